@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: the column stores need numpy
+    np = None
+
+from fortress.models import ORGANIC_KINDS, Coord3, Item
+
+
+FLAG_ALIVE = 1
+FLAG_CARRIED = 2
+FLAG_CONTAINED = 4
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class RowView(MutableMapping):
+    """Dict-like view of one entity's row in a `ColumnStore` matrix (see `ColumnStore.MATRICES`).
+
+    Keys are fixed by the matrix. Copies (`dict(view)`, `copy.deepcopy`, `dataclasses.asdict`)
+    are plain dicts.
+    """
+
+    __slots__ = ("_store", "_name", "_entity_id", "_cols")
+
+    def __init__(self, store: "ColumnStore", name: str, entity_id: int) -> None:
+        self._store = store
+        self._name = name
+        self._entity_id = entity_id
+        self._cols = store._matrix_cols[name]
+
+    def __getitem__(self, key: str) -> int:
+        store = self._store
+        return getattr(store, self._name)[store._row[self._entity_id], self._cols[key]].item()
+
+    def __setitem__(self, key: str, value: int) -> None:
+        store = self._store
+        getattr(store, self._name)[store._row[self._entity_id], self._cols[key]] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"{self._name} keys are fixed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cols)
+
+    def __len__(self) -> int:
+        return len(self._cols)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, int]:
+        return dict(self)
+
+    def copy(self) -> Dict[str, int]:
+        return dict(self)
+
+
+class ColumnStore:
+    """Struct-of-arrays rows for the entities of one EntityList, attached as a listener.
+
+    Rows follow insertion order (= id order); removed rows are cleared and compacted once
+    they dominate. Fields named in `BACKED` are authoritative here while an entity is
+    attached: their reads and writes go through the row (see `ColumnBacked`), and the values
+    are written back into the entity when it leaves the store. Subclasses list their arrays
+    in `COLUMNS` as (name, dtype, fill); `_write` copies the fields named in `MIRRORED` into
+    their columns on every change, and subclasses extend it for derived columns.
+    `MATRICES` lists (name, keys) for dict fields stored as one int row per entity and read
+    through a `RowView`.
+    """
+
+    COLUMNS: Tuple[Tuple[str, str, int], ...] = ()
+    MATRICES: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    BACKED: Tuple[str, ...] = ()
+    MIRRORED: Tuple[str, ...] = ()
+
+    def __init__(self, capacity: int = 256) -> None:
+        if np is None:
+            raise RuntimeError(f"{type(self).__name__} requires numpy")
+        self._capacity = capacity
+        self._matrix_cols = {name: {key: col for col, key in enumerate(keys)} for name, keys in self.MATRICES}
+        self.reset(())
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def reset(self, entities: Iterable[Any]) -> None:
+        for entity in list(getattr(self, "_entities", ())):
+            if entity is not None:
+                self._detach(entity)
+        self._allocate(self._capacity)
+        self._row: Dict[int, int] = {}
+        self._entities: List[Any] = []
+        self._views: Dict[Tuple[int, str], RowView] = {}
+        for entity in entities:
+            self.entity_added(entity)
+
+    def _arrays(self) -> Iterator[Tuple[str, int]]:
+        for name, _, fill in self.COLUMNS:
+            yield name, fill
+        for name, _ in self.MATRICES:
+            yield name, 0
+
+    def _allocate(self, capacity: int) -> None:
+        for name, dtype, fill in self.COLUMNS:
+            setattr(self, name, np.full(capacity, fill, dtype=dtype))
+        for name, keys in self.MATRICES:
+            setattr(self, name, np.zeros((capacity, len(keys)), dtype=np.int64))
+
+    def _grow(self) -> None:
+        size = len(self._entities)
+        old = {name: getattr(self, name) for name, _ in self._arrays()}
+        self._capacity = max(256, 2 * len(self.ids))
+        self._allocate(self._capacity)
+        for name, column in old.items():
+            getattr(self, name)[:size] = column[:size]
+
+    def _compact(self) -> None:
+        live = [row for row, entity in enumerate(self._entities) if entity is not None]
+        for name, fill in self._arrays():
+            column = getattr(self, name)
+            column[: len(live)] = column[live]
+            column[len(live) :] = fill
+        self._entities = [self._entities[row] for row in live]
+        self._row = {entity.id: row for row, entity in enumerate(self._entities)}
+
+    def _write(self, row: int, entity: Any) -> None:
+        for name in self.MIRRORED:
+            getattr(self, name)[row] = getattr(entity, name)
+
+    def _detach(self, entity: Any) -> None:
+        row = self._row.get(entity.id)
+        if row is None or entity._columns is not self:
+            return
+        values = [self._value(row, name) for name in self.BACKED]
+        object.__setattr__(entity, "_columns", None)
+        for name, value in zip(self.BACKED, values):
+            object.__setattr__(entity, name, value)
+
+    def _value(self, row: int, name: str) -> Any:
+        cols = self._matrix_cols.get(name)
+        if cols is not None:
+            return dict(zip(cols, getattr(self, name)[row].tolist()))
+        return getattr(self, name)[row].item()
+
+    def _store(self, row: int, name: str, value: Any) -> None:
+        cols = self._matrix_cols.get(name)
+        if cols is not None:
+            getattr(self, name)[row] = [value.get(key, 0) for key in cols]
+        else:
+            getattr(self, name)[row] = value
+
+    def get(self, entity: Any, name: str) -> Any:
+        if name in self._matrix_cols:
+            view = self._views.get((entity.id, name))
+            if view is None:
+                view = self._views[(entity.id, name)] = RowView(self, name, entity.id)
+            return view
+        return getattr(self, name)[self._row[entity.id]].item()
+
+    def set(self, entity: Any, name: str, value: Any) -> None:
+        self._store(self._row[entity.id], name, value)
+
+    def entity_added(self, entity: Any) -> None:
+        if entity.id in self._row:
+            return
+        if len(self._entities) >= len(self.ids):
+            if len(self._row) * 2 < len(self._entities):
+                self._compact()
+            else:
+                self._grow()
+        row = len(self._entities)
+        values = [getattr(entity, name) for name in self.BACKED]
+        self._entities.append(entity)
+        self._row[entity.id] = row
+        self.ids[row] = entity.id
+        for name, value in zip(self.BACKED, values):
+            self._store(row, name, value)
+        self._write(row, entity)
+        object.__setattr__(entity, "_columns", self)
+
+    def entity_removed(self, entity: Any) -> None:
+        row = self._row.get(entity.id)
+        if row is None:
+            return
+        self._detach(entity)
+        del self._row[entity.id]
+        for name, _ in self.MATRICES:
+            self._views.pop((entity.id, name), None)
+        self._entities[row] = None
+        for name, fill in self._arrays():
+            getattr(self, name)[row] = fill
+
+    def entity_changed(self, entity: Any, name: str, old: object) -> None:
+        row = self._row.get(entity.id)
+        if row is not None:
+            self._write(row, entity)
+
+
+class ItemColumns(ColumnStore):
+    """Struct-of-arrays mirror of `Game.items` for vectorized aging and spoilage.
+
+    Each item owns one row holding age, perishability, position, flags, kind id and
+    container id. `age` is the column-backed field.
+    """
+
+    COLUMNS = (
+        ("ids", "int64", 0),
+        ("age", "int64", 0),
+        ("perishability", "int64", 0),
+        ("x", "int64", 0),
+        ("y", "int64", 0),
+        ("z", "int64", 0),
+        ("flags", "uint8", 0),
+        ("kind", "int64", 0),
+        ("container", "int64", -1),
+    )
+    BACKED = ("age",)
+    MIRRORED = ("perishability", "x", "y", "z")
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._kind_ids: Dict[str, int] = {}
+        self._shelter_key: Optional[Tuple[int, Tuple[int, int, int]]] = None
+        super().__init__(capacity)
+        self._organic = np.zeros(0, dtype=bool)
+        self._shelter = np.zeros((1, 1, 1), dtype=bool)
+
+    def _kind_id(self, kind: str) -> int:
+        kind_id = self._kind_ids.get(kind)
+        if kind_id is None:
+            kind_id = len(self._kind_ids)
+            self._kind_ids[kind] = kind_id
+            self._organic = np.append(self._organic, kind in ORGANIC_KINDS)
+        return kind_id
+
+    def _write(self, row: int, item: Item) -> None:
+        super()._write(row, item)
+        flags = FLAG_ALIVE
+        if item.carried_by is not None:
+            flags |= FLAG_CARRIED
+        if item.container_id is not None:
+            flags |= FLAG_CONTAINED
+        self.flags[row] = flags
+        self.kind[row] = self._kind_id(item.kind)
+        self.container[row] = -1 if item.container_id is None else item.container_id
+
+    def _shelter_mask(self, cover: Any, shape: Tuple[int, int, int]) -> Any:
+        key = (cover.version, shape)
+        if self._shelter_key != key:
+            mask = np.zeros(shape, dtype=bool)
+            mask[1:] = True
+            for x, y, z in cover.tiles():
+                if 0 <= z < shape[0] and 0 <= y < shape[1] and 0 <= x < shape[2]:
+                    mask[z, y, x] = True
+            self._shelter, self._shelter_key = mask, key
+        return self._shelter
+
+    def age_and_expire(
+        self,
+        cover: Any,
+        shape: Tuple[int, int, int],
+        carried_positions: Iterable[Tuple[Item, Coord3]],
+        wet: bool,
+        hot: bool,
+    ) -> List[Item]:
+        # Vectorized `item.age += 1` + `_effective_perishability` over every row; returns the
+        # items past their effective perishability, in id order.
+        n = len(self._entities)
+        if n == 0:
+            return []
+        self.age[:n] += 1
+        flags = self.flags[:n]
+        perishability = self.perishability[:n]
+        organic = self._organic[self.kind[:n]]
+
+        x = self.x[:n].copy()
+        y = self.y[:n].copy()
+        z = self.z[:n].copy()
+        for item, (px, py, pz) in carried_positions:
+            row = self._row.get(item.id)
+            if row is not None:
+                x[row], y[row], z[row] = px, py, pz
+        depth, height, width = shape
+        sheltered = self._shelter_mask(cover, shape)[
+            np.clip(z, 0, depth - 1), np.clip(y, 0, height - 1), np.clip(x, 0, width - 1)
+        ]
+
+        effective = np.where(perishability > 0, perishability, 220)
+        if wet:
+            effective = (effective * 0.78).astype(np.int64)
+        if hot:
+            effective = (effective * 0.85).astype(np.int64)
+        effective = np.maximum(effective, 1)
+
+        at_risk = ((flags & FLAG_ALIVE) != 0) & ((flags & FLAG_CONTAINED) == 0)
+        at_risk &= organic | (perishability > 0)
+        at_risk &= ~(organic & sheltered)
+        rows = np.flatnonzero(at_risk & (self.age[:n] > effective))
+        if len(rows) > 1:
+            rows = rows[np.argsort(self.ids[rows], kind="stable")]
+        return [self._entities[row] for row in rows.tolist()]
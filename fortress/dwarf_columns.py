@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from fortress.columns import ColumnStore, np
+from fortress.models import Dwarf
+
+
+NEED_KEYS = ("hunger", "thirst", "alcohol", "sleep", "social", "worship", "entertainment", "safety")
+NUTRITION_KEYS = ("protein", "fiber", "variety")
+CRITICAL_NEEDS = ("hunger", "thirst", "sleep", "safety")
+
+
+@dataclass
+class NeedsPass:
+    # Outcome of one batched needs pass; `rows` are the living rows in list (= id) order.
+    rows: List[int]
+    visit: List[int]  # rows that may change mood, log or die this tick
+    deprived: List[bool]  # per row: log deprivation weakening
+    withdrawal: List[bool]  # per row: log alcohol withdrawal
+    roll_only: List[bool]  # per row: calm, so only the inspiration roll can apply (unless upset)
+
+
+class DwarfColumns(ColumnStore):
+    """Struct-of-arrays dwarf vitals: needs and nutrition as (dwarves x key) matrices plus hp,
+    stress, morale and the per-dwarf counters the needs pass advances.
+
+    `Dwarf.needs` and `Dwarf.nutrition` read as `RowView`s of the matrices while a dwarf is
+    attached. `update_needs` runs the numeric half of `_update_dwarf_needs` (increments,
+    clamps, deprivation damage, withdrawal and stress rules) for every dwarf at once.
+    """
+
+    COLUMNS = (
+        ("ids", "int64", 0),
+        ("hp", "int64", 0),
+        ("stress", "int64", 0),
+        ("morale", "int64", 0),
+        ("rested_bonus", "int64", 0),
+        ("withdrawal_ticks", "int64", 0),
+        ("alcohol_dependency", "int64", 0),
+    )
+    MATRICES = (("needs", NEED_KEYS), ("nutrition", NUTRITION_KEYS))
+    BACKED = ("hp", "stress", "morale", "rested_bonus", "withdrawal_ticks", "alcohol_dependency", "needs", "nutrition")
+
+    def entity_at(self, row: int) -> Dwarf:
+        return self._entities[row]
+
+    def snapshot(self) -> Dict[str, Any]:
+        n = len(self._entities)
+        return {name: getattr(self, name)[:n].copy() for name in self.BACKED}
+
+    def restore(self, snapshot: Dict[str, Any], start: int) -> None:
+        # Puts rows from `start` on back to their snapshot values.
+        for name, saved in snapshot.items():
+            getattr(self, name)[start : len(saved)] = saved[start:]
+
+    def update_needs(self, tick: int, raid_active: bool, no_drinks: bool) -> NeedsPass:
+        n = len(self._entities)
+        alive = self.hp[:n] > 0
+        needs = self.needs[:n]
+        need = {key: needs[:, col] for key, col in self._matrix_cols["needs"].items()}
+        nutrition = self.nutrition[:n]
+        hp, stress, morale = self.hp[:n], self.stress[:n], self.morale[:n]
+        dependency = self.alcohol_dependency[:n]
+
+        def bump(column: Any, mask: Any, delta: Any) -> None:
+            # clamp(column + delta, 0, 100) where mask
+            np.copyto(column, np.minimum(np.maximum(column + delta, 0), 100), where=mask)
+
+        rested = self.rested_bonus[:n]
+        rested -= alive & (rested > 0)
+        if tick % 2 == 0:
+            bump(need["hunger"], alive, 1)
+            bump(need["thirst"], alive, 1)
+        if tick % 4 == 0:
+            bump(need["alcohol"], alive, np.maximum(0, dependency // 45))
+            bump(need["sleep"], alive, 1)
+        if tick % 5 == 0:
+            bump(need["social"], alive, 1)
+            bump(need["worship"], alive, 1)
+            bump(need["entertainment"], alive, 1)
+        if tick % 4 == 0:
+            np.copyto(nutrition, np.minimum(np.maximum(nutrition + 1, 0), 100), where=alive[:, None])
+        if raid_active:
+            if tick % 2 == 0:
+                bump(need["safety"], alive, 1)
+        else:
+            bump(need["safety"], alive, -1)
+
+        if tick % 3 == 0:
+            overfed = alive & (nutrition.sum(axis=1) / len(NUTRITION_KEYS) >= 85)
+            bump(stress, overfed, 1)
+            bump(morale, overfed, -1)
+
+        if tick % 6 == 0:
+            starving = alive & (need["hunger"] >= 96)
+            bump(hp, starving, -1)
+            bump(morale, starving, -1)
+        if tick % 4 == 0:
+            parched = alive & (need["thirst"] >= 96)
+            bump(hp, parched, -2)
+            bump(morale, parched, -1)
+        if tick % 8 == 0:
+            bump(hp, alive & (need["sleep"] >= 98), -1)
+        deprived = alive & ((need["hunger"] >= 96) | (need["thirst"] >= 96)) & (tick % 10 == 0)
+
+        withdrawing = alive & (dependency >= 45) & no_drinks & (need["alcohol"] >= 85)
+        ticks = self.withdrawal_ticks[:n]
+        ticks[:] = np.where(withdrawing, ticks + 1, np.where(alive, 0, ticks))
+        if tick % 3 == 0:
+            bump(stress, withdrawing, np.maximum(1, dependency // 65))
+        bump(morale, withdrawing & (ticks % 10 == 0), -1)
+        withdrawal = withdrawing & ((ticks == 1) | (ticks == 20) | (ticks == 50))
+
+        high = sum((need[key] >= 90).astype(np.int64) for key in CRITICAL_NEEDS)
+        calm = alive & (high == 0)
+        tense = alive & (high > 0)
+        bump(stress, calm, -1)
+        if tick % 6 == 0:
+            bump(morale, calm & (stress < 40), 1)
+        bump(stress, tense, high - (morale > 60))
+        if tick % 4 == 0:
+            bump(morale, tense & (high >= 2), -1)
+        if tick % 3 == 0:
+            bump(morale, alive & (stress >= 85), -1)
+
+        # Stress 26..74 matches no mood rule; everything else is checked per dwarf.
+        visit = alive & (deprived | withdrawal | (stress >= 75) | (stress <= 25) | (hp <= 0))
+        roll_only = alive & (stress < 20) & (hp > 0) & ~deprived & ~withdrawal
+        return NeedsPass(
+            rows=np.flatnonzero(alive).tolist(),
+            visit=np.flatnonzero(visit).tolist(),
+            deprived=deprived.tolist(),
+            withdrawal=withdrawal.tolist(),
+            roll_only=roll_only.tolist(),
+        )
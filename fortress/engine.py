@@ -38,6 +38,37 @@ from fortress.systems.flora import FloraSystemsMixin
 from fortress.systems.defs import DefsMixin
 from fortress.systems.worldgen import WorldgenMixin
 from fortress.systems.game_helpers import GameHelpersMixin
+from fortress.inventory import HaulQueue, InventoryIndex, StockpileOccupancy
+from fortress.spatial import RectCoverage, RoomZoneTracker, SpatialGrid
+from fortress.spoilage import SpoilageSchedule
+from fortress.columns import ItemColumns, numpy_available
+from fortress.dwarf_columns import DwarfColumns
+from fortress.needs_clock import NeedsClock
+from fortress.flora_columns import FloraColumns
+from fortress.flora_species import FloraSpeciesTable
+from fortress.flora_targets import FloraTargets
+from fortress.event_log import DEFAULT_EVENT_LEVELS, EventLog, alert_line
+from fortress.job_board import BOARD_JOB_KINDS, BuiltWorkshops, JobBoard, ReadyWorkshops
+from fortress.pathing import PathFinder
+from fortress.registry import EntityList
+
+
+ENTITY_LIST_FIELDS = frozenset(
+    {
+        "zones",
+        "stockpiles",
+        "workshops",
+        "items",
+        "dwarves",
+        "animals",
+        "squads",
+        "factions",
+        "rooms",
+        "floras",
+        "jobs",
+    }
+)
+WEALTH_VERIFY_INTERVAL = 50
 
 
 @dataclass
@@ -77,6 +108,11 @@ class Game(
     next_mandate_id: int = 1
     workshop_dispatch_cursor: int = 0
     debug_reveal_all_geology: bool = False
+    debug_verify_wealth: bool = False
+    columnar_items: bool = False
+    vectorized_flora: bool = False
+    vectorized_needs: bool = False
+    blocking_workshops: bool = False
     interrupt_requested: bool = False
     game_over: bool = False
     max_flora: int = 80
@@ -98,11 +134,11 @@ class Game(
     geology_breached_tiles: set = field(default_factory=set)
     mandates: List[Mandate] = field(default_factory=list)
     crimes: List[Crime] = field(default_factory=list)
-    events: List[Event] = field(default_factory=list)
+    events: EventLog = field(default_factory=EventLog)
+    event_levels: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_EVENT_LEVELS))
     jobs: List[Job] = field(default_factory=list)
     world: WorldState = field(default_factory=WorldState)
     command_log: List[str] = field(default_factory=list)
-    alerts: List[str] = field(default_factory=list)
     economy_stats: Dict[str, int] = field(
         default_factory=lambda: {
             "foraged_herb": 0,
@@ -123,8 +159,23 @@ class Game(
     )
     defs: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Entity lists are always id-indexed, including wholesale reassignment (`g.items = [...]`).
+        if name in ENTITY_LIST_FIELDS:
+            if not isinstance(value, EntityList):
+                value = EntityList(value)
+            previous = self.__dict__.get(name)
+            if isinstance(previous, EntityList) and previous is not value:
+                value.take_listeners(previous)
+        elif name == "events" and not isinstance(value, EventLog):
+            value = EventLog(value)
+        object.__setattr__(self, name, value)
+        if name == "defs" and "flora_table" in self.__dict__:
+            self._compile_flora_species()
+
     def __post_init__(self) -> None:
         self.rng = random.Random(self.rng_seed)
+        self._build_indexes()
         self.defs = self.default_defs()
         self._generate_world()
         self._generate_geology()
@@ -145,17 +196,65 @@ class Game(
         self._init_flora()
         self._refresh_rooms_and_assignments()
 
+    @property
+    def alerts(self) -> List[str]:
+        return [alert_line(e) for e in self.events.alerts]
+
+    def _build_indexes(self) -> None:
+        self.inventory = InventoryIndex()
+        self.items.attach(self.inventory)
+        self.stockpile_occupancy = StockpileOccupancy()
+        self.items.attach(self.stockpile_occupancy)
+        self.haul_queue = HaulQueue()
+        self.items.attach(self.haul_queue)
+        # Item ages live in exactly one store: the NumPy columns when enabled, else the spoilage schedule.
+        self.item_columns = ItemColumns() if self.columnar_items and numpy_available() else None
+        self.spoilage = SpoilageSchedule() if self.item_columns is None else None
+        self.items.attach(self.spoilage if self.item_columns is None else self.item_columns)
+        self.item_grid = SpatialGrid()
+        self.items.attach(self.item_grid)
+        self.dwarf_grid = SpatialGrid()
+        self.dwarves.attach(self.dwarf_grid)
+        # Needs live in exactly one store: the NumPy columns when enabled, else the lazy needs clock.
+        self.dwarf_columns = DwarfColumns() if self.vectorized_needs and numpy_available() else None
+        self.needs_clock = NeedsClock() if self.dwarf_columns is None else None
+        self.dwarves.attach(self.needs_clock if self.dwarf_columns is None else self.dwarf_columns)
+        self.animal_grid = SpatialGrid()
+        self.animals.attach(self.animal_grid)
+        self.flora_grid = SpatialGrid()
+        self.floras.attach(self.flora_grid)
+        self.flora_table = FloraSpeciesTable()
+        self.floras.attach(self.flora_table)
+        self.flora_targets = FloraTargets()
+        self.floras.attach(self.flora_targets)
+        self.flora_columns = FloraColumns(self.flora_table) if self.vectorized_flora and numpy_available() else None
+        if self.flora_columns is not None:
+            self.floras.attach(self.flora_columns)
+        self.job_board = JobBoard(lambda: self.tick_count)
+        self.jobs.attach(self.job_board)
+        self.ready_workshops = ReadyWorkshops(self._labor_for_workshop)
+        self.workshops.attach(self.ready_workshops)
+        self.built_workshops = BuiltWorkshops()
+        self.workshops.attach(self.built_workshops)
+        self.paths = PathFinder(self.width, self.height, self.depth, block_workshops=self.blocking_workshops)
+        self.workshops.attach(self.paths)
+        self.room_cover = RectCoverage()
+        self.rooms.attach(self.room_cover)
+        self.room_tracker = RoomZoneTracker()
+        for entities in (self.zones, self.items, self.dwarves):
+            entities.attach(self.room_tracker)
+
     @property
     def raw_food(self) -> int:
-        return sum(1 for i in self.items if i.kind == "raw_food")
+        return self.inventory.count("raw_food")
 
     @property
     def cooked_food(self) -> int:
-        return sum(1 for i in self.items if i.kind == "cooked_food")
+        return self.inventory.count("cooked_food")
 
     @property
     def drinks(self) -> int:
-        return sum(1 for i in self.items if i.kind == "alcohol")
+        return self.inventory.count("alcohol")
 
     def add_dwarf(self, name: Optional[str] = None, x: Optional[int] = None, y: Optional[int] = None, z: int = 0) -> Dwarf:
         name = name or f"Dwarf{self.next_dwarf_id}"
@@ -274,13 +373,28 @@ class Game(
             raise ValueError(f"recipe not available for {ws.kind}")
         if amount <= 0:
             raise ValueError("amount must be > 0")
-        ws.orders[recipe] = ws.orders.get(recipe, 0) + amount
+        self._add_workshop_order(ws, recipe, amount)
 
     def queue_dig(self, x: int, y: int, from_z: int, to_z: int) -> None:
         self._validate_point(x, y, from_z)
         self._validate_point(x, y, to_z)
         self.jobs.append(self._new_job(kind="dig_stairs", labor="mine", destination=(x, y, from_z), remaining=6, target_id=to_z))
 
+    def cancel_job(self, job_id: int) -> Job:
+        job = self.jobs.get(job_id)
+        if job is not None:
+            self.jobs.remove(job)
+        else:
+            holder = next((d for d in self.dwarves if d.job is not None and d.job.id == job_id and d.job.kind in BOARD_JOB_KINDS), None)
+            if holder is None:
+                raise ValueError("no such designated job")
+            job, holder.job, holder.state = holder.job, None, "idle"
+        if job.kind == "build_workshop":
+            ws = self._find_workshop(job.target_id)
+            if ws and not ws.built:
+                self.workshops.remove(ws)
+        return job
+
     def tick(self, n: int = 1) -> None:
         for _ in range(n):
             if self.game_over:
@@ -313,7 +427,9 @@ class Game(
             self._plan_workshop_orders()
             self._sync_carried_items()
             self._refresh_rooms_and_assignments()
-            self.world.wealth = sum(i.value + i.quality for i in self.items)
+            self.world.wealth = self._ledger_wealth()
+            if self.debug_verify_wealth and self.tick_count % WEALTH_VERIFY_INTERVAL == 0:
+                self._verify_wealth()
             if self._living_dwarf_count() == 0:
                 self._trigger_game_over()
                 break
@@ -328,7 +444,7 @@ class Game(
         if self.game_over:
             return
         self.game_over = True
-        self._log("game_over", "No dwarves remain. The fortress has fallen.", 3)
+        self._log("game_over", "fortress_fallen", 3)
 
     def game_over_summary(self) -> str:
         deaths = sum(1 for d in self.dwarves if d.hp <= 0)
@@ -341,7 +457,7 @@ class Game(
             f"- deaths={deaths} total_events={len(self.events)}",
             "Recent events:",
         ]
-        recent = self.events[-5:]
+        recent = self.events.recent(5)
         if recent:
             for e in recent:
                 lines.append(f"- t{e.tick} [{e.kind}] {e.text}")
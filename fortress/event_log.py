@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from fortress.models import Event
+
+
+EVENT_CAPACITY = 400
+KIND_CAPACITY = 64
+ALERT_CAPACITY = 200
+ALERT_SEVERITY = 2
+# Minimum severity recorded per event kind; flora chatter is muted by default.
+MUTED = 99
+DEFAULT_EVENT_LEVELS: Dict[str, int] = {"flora": MUTED}
+
+
+def alert_line(event: Event) -> str:
+    return f"t{event.tick} [{event.kind}] {event.text}"
+
+
+class EventLog:
+    """Fixed-capacity ring of the most recent events.
+
+    Secondary rings keep the latest events of each kind and the latest alerts
+    (severity >= `ALERT_SEVERITY`), so panels read their tail without filtering or copying
+    the whole log. Appends are O(1); full rings drop their oldest entry.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Event] = (),
+        capacity: int = EVENT_CAPACITY,
+        kind_capacity: int = KIND_CAPACITY,
+        alert_capacity: int = ALERT_CAPACITY,
+    ) -> None:
+        self.capacity = capacity
+        self.kind_capacity = kind_capacity
+        self._ring: Deque[Event] = deque(maxlen=capacity)
+        self._kinds: Dict[str, Deque[Event]] = {}
+        self.alerts: Deque[Event] = deque(maxlen=alert_capacity)
+        for event in events:
+            self.append(event)
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._ring)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self._ring)[index]
+        return self._ring[index]
+
+    def __repr__(self) -> str:
+        return f"EventLog({len(self._ring)}/{self.capacity})"
+
+    def append(self, event: Event) -> None:
+        self._ring.append(event)
+        ring = self._kinds.get(event.kind)
+        if ring is None:
+            ring = self._kinds[event.kind] = deque(maxlen=self.kind_capacity)
+        ring.append(event)
+        if event.severity >= ALERT_SEVERITY:
+            self.alerts.append(event)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        for event in events:
+            self.append(event)
+
+    def clear(self) -> None:
+        self._ring.clear()
+        self._kinds.clear()
+        self.alerts.clear()
+
+    def recent(self, n: int, kind: Optional[str] = None) -> List[Event]:
+        """The last `n` events (of `kind`, if given), oldest first."""
+        ring = self._ring if kind is None else self._kinds.get(kind, ())
+        tail = list(islice(reversed(ring), n))
+        tail.reverse()
+        return tail
+
+    def recent_alerts(self, n: int) -> List[Event]:
+        tail = list(islice(reversed(self.alerts), n))
+        tail.reverse()
+        return tail
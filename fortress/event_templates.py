@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Dict
+
+
+# Event template id -> format string over the event's `data`. Events whose template is not
+# listed here (older saves, ad-hoc logging) carry their text as the template itself.
+EVENT_TEMPLATES: Dict[str, str] = {
+    "artifact_created": "An inspired artifact was created from colony legends.",
+    "animal_neglected": "A {species} died of neglect.",
+    "caravan_arrived": "A caravan arrived with trade goods.",
+    "cavern_breach": "Cavern breach at ({x},{y},{z})! Strange echoes from below...",
+    "cavern_wildlife": "Cavern wildlife has stirred and threatens the outpost.",
+    "container_queued": "Queued {recipe} for stockpile #{stockpile} ({stockpile_kind}).",
+    "crime_resolved": "Crime {crime} by dwarf #{dwarf} was resolved.",
+    "death": "{name} has died.",
+    "deposit_depleted": "{material} deposit at ({x},{y},{z}) is depleted.",
+    "deposit_discovered": "Discovered {material} {deposit} deposit ({rarity}) at ({x},{y},{z}).",
+    "deprivation": "{name} is physically weakening from deprivation.",
+    "flora_died": "{plant} ({scientific}) died off.",
+    "flora_harvested": "{name} harvested flora from {plant}.",
+    "flora_sprouted": "New {plant} ({scientific}) sprouted.",
+    "flora_stage": "{plant} ({scientific}) reached {stage}.",
+    "food_stolen": "{name} stole food due to desperation.",
+    "fortress_fallen": "No dwarves remain. The fortress has fallen.",
+    "goat_born": "A goat kid was born in the pasture.",
+    "inspired": "{name} feels inspired.",
+    "mandate_expired": "Mandate #{mandate} expired ({item} x{amount}).",
+    "mandate_fulfilled": "Mandate #{mandate} fulfilled ({item} x{amount}).",
+    "mandate_issued": "New {mandate_kind} mandate from {issuer}: {item} x{amount} by t{due}.",
+    "manuscript_completed": "A manuscript was completed in the archives.",
+    "overharvest": "Overharvest warning: tree felling is outpacing regrowth.",
+    "performance_recorded": "A performance record entered the cultural ledger.",
+    "raid_detected": "Raid detected: threat level {threat}",
+    "raid_dispersed": "Raiders dispersed before a full assault.",
+    "raid_repelled": "Raid repelled.",
+    "season_changed": "Season changed to {season}",
+    "skirmish_injury": "{name} was injured during a skirmish.",
+    "items_spoiled": "{count} perishable item(s) spoiled.",
+    "stairway_dug": "A stairway was dug at ({x},{y}) to z={z}",
+    "tantrum": "{name} is having a tantrum.",
+    "tantrum_damage": "{name} destroyed property in a tantrum.",
+    "tree_felled": "{name} felled {plant} for timber.",
+    "wealth_drift": "Wealth drift {drift:+d} (ledger={ledger} scan={scan}).",
+    "weather_changed": "Weather is now {weather}",
+    "withdrawal": "{name} is suffering alcohol withdrawal.",
+}
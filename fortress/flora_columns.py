@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from fortress.columns import ColumnStore, np
+from fortress.flora_species import FloraSpeciesTable
+from fortress.models import Flora
+
+
+NOTABLE_STAGES = ("mature", "ancient", "flowering", "seeded")
+
+
+@dataclass
+class FloraGrowth:
+    # Outcome of one vectorized growth pass; every row list is in list (= id) order.
+    died: List[int]
+    staged: List[Tuple[int, int]]  # (row, new stage index)
+    notable: Any  # bool per row: moved up into a NOTABLE_STAGES stage
+    was_dead: Any  # bool per row: dead before this tick
+    grew: Any  # bool per row: alive and survived this tick
+    health_changed: List[int]  # ids whose health the pass rewrote without notifying watchers
+
+
+class FloraColumns(ColumnStore):
+    """Struct-of-arrays mirror of `Game.floras` for the vectorized flora engine.
+
+    Growth, age, health, cooldown and the stressed/dormant flags are column-backed. Because
+    season, weather, temperature and biome are global, every growth input (multipliers,
+    temperature stress, dormancy, the rounded growth step) is computed once per species as an
+    array and gathered per plant; per-plant state then advances with array operations.
+    Stages are stored as codes into a shared stage vocabulary so seasonal rules can be masked.
+
+    Nothing here draws from the RNG; `_flora_tick_vectorized` runs the drawing rules for the
+    rows `draw_rows` selects, in list order, so state and RNG stream match the scalar tick.
+    """
+
+    COLUMNS = (
+        ("ids", "int64", 0),
+        ("species", "int64", -1),
+        ("stage_index", "int64", 0),
+        ("stage_code", "int64", -1),
+        ("age_ticks", "int64", 0),
+        ("growth_points", "int64", 0),
+        ("health", "int64", 0),
+        ("spread_cooldown", "int64", 0),
+        ("stressed", "bool", False),
+        ("dormant", "bool", False),
+        ("dead", "bool", False),
+        ("plant", "bool", False),
+    )
+    BACKED = ("age_ticks", "growth_points", "health", "spread_cooldown", "stressed", "dormant")
+    MIRRORED = ("dead",)
+
+    def __init__(self, table: FloraSpeciesTable, capacity: int = 256) -> None:
+        self.table = table
+        self._stage_codes: Dict[str, int] = {}
+        self._species_key: Any = None
+        super().__init__(capacity)
+
+    def code_of(self, stage: str) -> int:
+        code = self._stage_codes.get(stage)
+        if code is None:
+            code = len(self._stage_codes)
+            self._stage_codes[stage] = code
+        return code
+
+    def _write(self, row: int, flora: Flora) -> None:
+        super()._write(row, flora)
+        sp = self.table.get(flora.species_id)
+        self.species[row] = -1 if sp is None else sp.num
+        self.stage_index[row] = self.table.stage_index(flora.species_id, flora.stage)
+        self.stage_code[row] = self.code_of(flora.stage)
+        self.plant[row] = flora.kind == "plant"
+
+    def _species_arrays(self) -> None:
+        by_num = self.table.by_num
+        if self._species_key is by_num:
+            return
+        self._species_key = by_num
+        width = max((len(sp.stages) for sp in by_num), default=1)
+        self.sp_stage_codes = np.full((max(len(by_num), 1), width), -1, dtype=np.int64)
+        for sp in by_num:
+            self.sp_stage_codes[sp.num, : len(sp.stages)] = [self.code_of(stage) for stage in sp.stages]
+        self.sp_stage_count = np.array([len(sp.stages) for sp in by_num] or [1], dtype=np.int64)
+        self.sp_threshold = np.array([sp.stage_threshold for sp in by_num] or [1], dtype=np.int64)
+        self.sp_spread_stage = np.array([sp.spread_stage_index for sp in by_num] or [0], dtype=np.int64)
+        self.sp_temp_min = np.array([sp.temp_min for sp in by_num] or [0], dtype=np.int64)
+        self.sp_temp_max = np.array([sp.temp_max for sp in by_num] or [0], dtype=np.int64)
+        self.sp_dry_penalty = np.array([sp.dry_penalty for sp in by_num] or [0], dtype=np.int64)
+
+    def species_inputs(
+        self, season: str, weather: str, temperature: int, biome: str, mults: Tuple[float, float, float]
+    ) -> Tuple[Any, Any, Any]:
+        # Per species: temperature/weather/biome stress, dormancy and the rounded growth step
+        # for a surviving plant, with the scalar tick's float operations in the same order.
+        self._species_arrays()
+        by_num = self.table.by_num
+        rain_mult, temp_mult, elev_mult = mults
+        growth = np.array([sp.growth_for(season, weather) for sp in by_num] or [0.0], dtype=np.float64)
+        growth = growth * rain_mult * temp_mult * elev_mult
+        season_mod = np.array([sp.season_mod.get(season, 1.0) for sp in by_num] or [1.0], dtype=np.float64)
+        in_biome = np.array([biome in sp.biomes for sp in by_num] or [True], dtype=bool)
+
+        cold = temperature < self.sp_temp_min
+        hot = temperature > self.sp_temp_max
+        stress = np.where(cold, (self.sp_temp_min - temperature) // 2 + 2, 0)
+        stress += np.where(hot, (temperature - self.sp_temp_max) // 2 + 2, 0)
+        if weather == "dry":
+            stress += np.maximum(self.sp_dry_penalty, 0)
+        stress += np.where(in_biome, 0, 4)
+
+        dormant = (season_mod < 0.35) | (growth <= 0.2)
+        step = np.where(stress > 0, growth * np.maximum(0.25, 1.0 - (stress / 22.0)), growth)
+        step = step * 0.55
+        step = np.where(stress >= 4, step - 0.7, step)
+        return stress, dormant, np.round(step).astype(np.int64)
+
+    def grow(self, season: str, weather: str, temperature: int, biome: str, mults: Tuple[float, float, float]) -> FloraGrowth:
+        # The deterministic half of `_flora_tick` for every plant at once; nothing here draws
+        # from the RNG. Stage changes are reported, not applied, so watchers see them as writes.
+        n = len(self._entities)
+        sp_stress, sp_dormant, sp_step = self.species_inputs(season, weather, temperature, biome, mults)
+        species = self.species[:n]
+        live = species >= 0
+        num = np.where(live, species, 0)
+        stress = sp_stress[num]
+
+        self.age_ticks[:n] += live
+        cooldown = self.spread_cooldown[:n]
+        cooldown -= live & (cooldown > 0)
+        self.stressed[:n] = np.where(live, stress > 0, self.stressed[:n])
+        self.dormant[:n] = np.where(live, sp_dormant[num], self.dormant[:n])
+
+        was_dead = live & self.dead[:n]
+        grew = live & ~self.dead[:n]
+        health = self.health[:n]
+        before = health.copy()
+        health[:] = np.where(grew, np.clip(np.where(stress > 0, health - stress, health + 1), 0, 100), health)
+        died = grew & (health <= 0)
+        grew &= ~died
+
+        points = self.growth_points[:n]
+        points += np.where(grew, sp_step[num], 0)
+        threshold = self.sp_threshold[num]
+        index = self.stage_index[:n]
+        up = grew & (points >= threshold) & (index < self.sp_stage_count[num] - 1)
+        down = grew & ~up & (points <= -threshold) & (index > 0)
+        points -= np.where(up, threshold, 0)
+        points[down] = 0
+        new_index = index + up - down
+
+        moved = np.flatnonzero(up | down)
+        notable_codes = [self._stage_codes[s] for s in NOTABLE_STAGES if s in self._stage_codes]
+        notable = up & np.isin(self.sp_stage_codes[num, new_index], notable_codes)
+        return FloraGrowth(
+            died=np.flatnonzero(died).tolist(),
+            staged=list(zip(moved.tolist(), new_index[moved].tolist())),
+            notable=notable,
+            was_dead=was_dead,
+            grew=grew,
+            health_changed=self.ids[:n][health != before].tolist(),
+        )
+
+    def draw_rows(self, result: FloraGrowth, season: str) -> List[int]:
+        # Rows whose remaining per-plant rules draw from the RNG this tick: removal rolls for
+        # dead plants, notable stage-up log rolls, seasonal withering/sprouting and spreading.
+        # Must run after the reported stage changes have been written back.
+        n = len(self._entities)
+        code = self.stage_code[:n]
+        plant = self.plant[:n]
+        health = self.health[:n]
+        seasonal = np.zeros(n, dtype=bool)
+        flowering, seeded, withered = (self._stage_codes.get(s, -2) for s in ("flowering", "seeded", "withered"))
+        if season == "winter":
+            seasonal |= (code == flowering) | (code == seeded)
+        if season in ("autumn", "winter"):
+            seasonal |= code == seeded
+        if season == "spring":
+            seasonal |= (code == withered) & (health >= 35)
+        num = np.where(self.species[:n] >= 0, self.species[:n], 0)
+        spread = (self.stage_index[:n] >= self.sp_spread_stage[num]) & (health >= 55)
+        spread &= ~self.dormant[:n] & (self.spread_cooldown[:n] == 0)
+        removal = result.was_dead & (self.age_ticks[:n] % 40 == 0)
+        rows = (result.grew & ((plant & seasonal) | spread | result.notable)) | removal
+        return np.flatnonzero(rows).tolist()
+
+    def entity_at(self, row: int) -> Flora:
+        return self._entities[row]
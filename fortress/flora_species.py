@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from fortress.models import Flora
+
+
+SEASONS = ("spring", "summer", "autumn", "winter")
+WEATHERS = ("clear", "rain", "storm", "dry", "fog")
+
+
+@dataclass(frozen=True)
+class FloraSpecies:
+    num: int
+    id: str
+    common_name: str
+    scientific_name: str
+    kind: str
+    biomes: FrozenSet[str]
+    stages: Tuple[str, ...]
+    stage_ids: Mapping[str, int]
+    stage_threshold: int
+    base_growth: float
+    spread_stage_index: int
+    spread_radius: int
+    spread_chance: float
+    spread_cooldown: int
+    temp_min: int
+    temp_max: int
+    dry_penalty: int
+    season_mod: Mapping[str, float]
+    weather_mod: Mapping[str, float]
+    # (season, weather) -> base_growth * season_mod * weather_mod, multiplied in the same order as the tick.
+    growth: Mapping[Tuple[str, str], float]
+
+    def growth_for(self, season: str, weather: str) -> float:
+        value = self.growth.get((season, weather))
+        if value is None:
+            value = self.base_growth * self.season_mod.get(season, 1.0) * self.weather_mod.get(weather, 1.0)
+        return value
+
+
+def compile_species(num: int, raw: Mapping[str, Any]) -> FloraSpecies:
+    stages = tuple(raw["stages"])
+    season_mod = dict(raw["season_mod"])
+    weather_mod = dict(raw["weather_mod"])
+    base_growth = float(raw["base_growth"])
+    growth = {
+        (season, weather): base_growth * season_mod.get(season, 1.0) * weather_mod.get(weather, 1.0)
+        for season in SEASONS
+        for weather in WEATHERS
+    }
+    stage_ids: Dict[str, int] = {}
+    for index, stage in enumerate(stages):
+        stage_ids.setdefault(stage, index)
+    return FloraSpecies(
+        num=num,
+        id=raw["id"],
+        common_name=raw["common_name"],
+        scientific_name=raw["scientific_name"],
+        kind=raw["kind"],
+        biomes=frozenset(raw.get("biomes", [])),
+        stages=stages,
+        stage_ids=stage_ids,
+        stage_threshold=int(raw["stage_threshold"]),
+        base_growth=base_growth,
+        spread_stage_index=int(raw["spread_stage_index"]),
+        spread_radius=int(raw["spread_radius"]),
+        spread_chance=float(raw["spread_chance"]),
+        spread_cooldown=int(raw["spread_cooldown"]),
+        temp_min=int(raw["temp_min"]),
+        temp_max=int(raw["temp_max"]),
+        dry_penalty=int(raw.get("dry_penalty", 0)),
+        season_mod=season_mod,
+        weather_mod=weather_mod,
+        growth=growth,
+    )
+
+
+class FloraSpeciesTable:
+    """`defs["flora_species"]` compiled into `FloraSpecies` records with numeric ids.
+
+    Attached to `Game.floras`, it keeps each plant's `stage_index` (position of `stage` in
+    its species' stage list, 0 when absent) current as stages or species change.
+    """
+
+    def __init__(self) -> None:
+        self.species: Dict[str, FloraSpecies] = {}
+        self.by_num: List[FloraSpecies] = []
+
+    def compile(self, species_defs: Mapping[str, Mapping[str, Any]]) -> None:
+        self.by_num = [compile_species(num, raw) for num, raw in enumerate(species_defs.values())]
+        self.species = dict(zip(species_defs.keys(), self.by_num))
+
+    def get(self, species_id: str) -> Optional[FloraSpecies]:
+        return self.species.get(species_id)
+
+    def for_biome(self, biome: str) -> List[FloraSpecies]:
+        return [sp for sp in self.by_num if biome in sp.biomes]
+
+    def stage_index(self, species_id: str, stage: str) -> int:
+        sp = self.species.get(species_id)
+        if sp is None:
+            return 0
+        return sp.stage_ids.get(stage, 0)
+
+    def reset(self, floras: Iterable[Flora]) -> None:
+        for flora in floras:
+            self.entity_added(flora)
+
+    def entity_added(self, flora: Flora) -> None:
+        flora.stage_index = self.stage_index(flora.species_id, flora.stage)
+
+    def entity_removed(self, flora: Flora) -> None:
+        return
+
+    def entity_changed(self, flora: Flora, name: str, old: object) -> None:
+        if name in ("stage", "species_id"):
+            flora.stage_index = self.stage_index(flora.species_id, flora.stage)
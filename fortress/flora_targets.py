@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fortress.models import Flora
+
+
+FORAGE_STAGES = frozenset({"juvenile", "mature", "flowering", "seeded"})
+CHOP_STAGES = frozenset({"sapling", "young", "mature", "ancient"})
+TARGET_FIELDS = frozenset({"z", "stage", "species_id", "health", "dead", "reserved_by"})
+
+HeapEntry = Tuple[int, int, int, int]
+
+
+def target_kind(flora: Flora) -> Optional[str]:
+    # "forage" / "chop" when the plant is an unreserved candidate for that job, else None.
+    if flora.dead or flora.reserved_by is not None:
+        return None
+    if flora.kind == "plant" and flora.stage in FORAGE_STAGES:
+        return "forage"
+    if flora.kind == "tree" and flora.stage in CHOP_STAGES:
+        return "chop"
+    return None
+
+
+class FloraTargets:
+    """Forage and chop candidates, one max-heap per (job kind, z).
+
+    Heaps are keyed on (stage_index, health, -id), the order `_find_forageable_flora` and
+    `_find_tree_for_chop` pick by. Attached to `Game.floras`; writes to `TARGET_FIELDS`
+    mark a plant pending and it is re-keyed on the next query, superseded heap entries
+    being dropped lazily by stamp. Bulk health updates from the vectorized flora engine
+    are reported through `touch_ids`.
+    """
+
+    def __init__(self) -> None:
+        self.reset(())
+
+    def reset(self, floras: Iterable[Flora]) -> None:
+        self._floras: Dict[int, Flora] = {}
+        self._stamp: Dict[int, int] = {}
+        self._heaps: Dict[Tuple[str, int], List[HeapEntry]] = {}
+        self._pending: Set[int] = set()
+        self._entries = 0
+        self._next_stamp = 0
+        for flora in floras:
+            self.entity_added(flora)
+
+    def __len__(self) -> int:
+        self._flush()
+        return len(self._stamp)
+
+    def best(self, kind: str, z: int, accept: Optional[Callable[[Flora], bool]] = None) -> Optional[Flora]:
+        # Top live candidate on level `z`; candidates `accept` rejects are passed over but kept.
+        self._flush()
+        heap = self._heaps.get((kind, z))
+        skipped: List[HeapEntry] = []
+        found: Optional[Flora] = None
+        while heap:
+            flora_id, stamp = heap[0][2], heap[0][3]
+            if self._stamp.get(flora_id) != stamp:
+                heappop(heap)
+                self._entries -= 1
+                continue
+            flora = self._floras[flora_id]
+            if accept is None or accept(flora):
+                found = flora
+                break
+            skipped.append(heappop(heap))
+        for entry in skipped:
+            heappush(heap, entry)
+        return found
+
+    def touch_ids(self, flora_ids: Iterable[int]) -> None:
+        self._pending.update(flora_ids)
+
+    def entity_added(self, flora: Flora) -> None:
+        self._floras[flora.id] = flora
+        self._pending.add(flora.id)
+
+    def entity_removed(self, flora: Flora) -> None:
+        self._floras.pop(flora.id, None)
+        self._stamp.pop(flora.id, None)
+        self._pending.discard(flora.id)
+
+    def entity_changed(self, flora: Flora, name: str, old: object) -> None:
+        if name in TARGET_FIELDS:
+            self._pending.add(flora.id)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        for flora_id in self._pending:
+            flora = self._floras.get(flora_id)
+            if flora is None:
+                continue
+            kind = target_kind(flora)
+            if kind is None:
+                self._stamp.pop(flora_id, None)
+                continue
+            self._next_stamp += 1
+            self._stamp[flora_id] = self._next_stamp
+            heap = self._heaps.setdefault((kind, flora.z), [])
+            heappush(heap, (-flora.stage_index, -flora.health, flora_id, self._next_stamp))
+            self._entries += 1
+        self._pending.clear()
+        if self._entries > 2 * len(self._stamp) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        for key, heap in list(self._heaps.items()):
+            live = [e for e in heap if self._stamp.get(e[2]) == e[3]]
+            if live:
+                heapify(live)
+                self._heaps[key] = live
+            else:
+                del self._heaps[key]
+        self._entries = sum(len(heap) for heap in self._heaps.values())
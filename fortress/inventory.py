@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush
+from typing import Callable, Collection, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from fortress.models import Coord3, Item, Stockpile, is_container_kind
+
+
+_EMPTY: Dict[int, Item] = {}
+
+
+ItemFilter = Callable[[Item], bool]
+
+
+class IdBucket:
+    """Set of items with an O(1) amortised lookup of the lowest id (lazy-deletion min-heap)."""
+
+    def __init__(self) -> None:
+        self.items: Dict[int, Item] = {}
+        self._heap: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Item) -> None:
+        if item.id in self.items:
+            return
+        self.items[item.id] = item
+        heappush(self._heap, item.id)
+        # Stale ids are dropped lazily on lookup; compact when they dominate the heap.
+        if len(self._heap) > 2 * len(self.items) + 32:
+            self._heap = sorted(self.items)
+
+    def discard(self, item_id: int) -> None:
+        self.items.pop(item_id, None)
+
+    def first(self) -> Optional[Item]:
+        heap = self._heap
+        while heap:
+            item = self.items.get(heap[0])
+            if item is not None:
+                return item
+            heappop(heap)
+        return None
+
+    def lowest(self, n: int, accept: Optional[ItemFilter] = None) -> List[Item]:
+        """Up to `n` items with the lowest ids (that `accept` passes, if given), in id order."""
+        heap = self._heap
+        taken: List[int] = []
+        found: List[Item] = []
+        while heap and len(found) < n:
+            item_id = heappop(heap)
+            item = self.items.get(item_id)
+            if item is not None:
+                taken.append(item_id)
+                if accept is None or accept(item):
+                    found.append(item)
+        for item_id in taken:
+            heappush(heap, item_id)
+        return found
+
+
+class InventoryIndex:
+    """Incremental item indexes kept in step with `Game.items`.
+
+    - per-kind counts and the lowest-id free (unreserved, uncarried) item of each kind
+    - items currently carried by a dwarf
+    - container id -> contained items, and loose containers per stockpile
+    - the running item wealth (sum of value + quality)
+
+    Attached as a listener to `Game.items`; every update is O(1) or O(log n).
+    """
+
+    def __init__(self) -> None:
+        self.reset(())
+
+    def reset(self, items: Iterable[Item]) -> None:
+        self.counts: Dict[str, int] = {}
+        self.wealth = 0
+        self.containers: Dict[int, Item] = {}
+        self.carried: Dict[int, Item] = {}
+        self._free: Dict[str, IdBucket] = {}
+        self._contents: Dict[int, Dict[int, Item]] = {}
+        self._stockpile_containers: Dict[int, Dict[int, Item]] = {}
+        for item in items:
+            self.entity_added(item)
+
+    def count(self, kind: str) -> int:
+        return self.counts.get(kind, 0)
+
+    def first_free(self, kind: str, accept: Optional[ItemFilter] = None) -> Optional[Item]:
+        free = self._free.get(kind)
+        if not free:
+            return None
+        if accept is None:
+            return free.first()
+        found = free.lowest(1, accept)
+        return found[0] if found else None
+
+    def free_count(self, kind: str) -> int:
+        free = self._free.get(kind)
+        return len(free) if free else 0
+
+    def reserve_free(self, wants: Mapping[str, int], owner: int, accept: Optional[ItemFilter] = None) -> Optional[List[Item]]:
+        """Reserve `qty` free items of each kind (lowest ids first) for `owner`, or nothing at all.
+
+        `accept`, if given, limits the pick to the items it passes.
+        """
+        if any(self.free_count(kind) < qty for kind, qty in wants.items()):
+            return None
+        reserved: List[Item] = []
+        for kind, qty in wants.items():
+            found = self._free[kind].lowest(qty, accept)
+            if len(found) < qty:
+                return None
+            reserved.extend(found)
+        for item in reserved:
+            # The watched write drops the item from the free bucket.
+            item.reserved_by = owner
+        return reserved
+
+    def contents_of(self, container_id: int) -> Dict[int, Item]:
+        return self._contents.get(container_id, _EMPTY)
+
+    def containers_in(self, stockpile_id: int) -> Dict[int, Item]:
+        return self._stockpile_containers.get(stockpile_id, _EMPTY)
+
+    def entity_added(self, item: Item) -> None:
+        self.wealth += item.value + item.quality
+        self._index(item, item.kind, item.container_id, item.stockpile_id)
+
+    def entity_removed(self, item: Item) -> None:
+        self.wealth -= item.value + item.quality
+        self._unindex(item, item.kind, item.container_id, item.stockpile_id)
+
+    def entity_changed(self, item: Item, name: str, old: object) -> None:
+        if name in ("value", "quality"):
+            self.wealth += getattr(item, name) - old
+            return
+        if name in ("reserved_by", "carried_by"):
+            if item.carried_by is None:
+                self.carried.pop(item.id, None)
+            else:
+                self.carried[item.id] = item
+            if item.reserved_by is None and item.carried_by is None:
+                self._free.setdefault(item.kind, IdBucket()).add(item)
+            elif item.kind in self._free:
+                self._free[item.kind].discard(item.id)
+            return
+        if name not in ("kind", "container_id", "stockpile_id"):
+            return
+        kind = old if name == "kind" else item.kind
+        container_id = old if name == "container_id" else item.container_id
+        stockpile_id = old if name == "stockpile_id" else item.stockpile_id
+        self._unindex(item, kind, container_id, stockpile_id)
+        self._index(item, item.kind, item.container_id, item.stockpile_id)
+
+    def _index(self, item: Item, kind: str, container_id: Optional[int], stockpile_id: Optional[int]) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if item.reserved_by is None and item.carried_by is None:
+            self._free.setdefault(kind, IdBucket()).add(item)
+        if item.carried_by is not None:
+            self.carried[item.id] = item
+        if container_id is not None:
+            self._contents.setdefault(container_id, {})[item.id] = item
+        if is_container_kind(kind):
+            self.containers[item.id] = item
+            if stockpile_id is not None and container_id is None:
+                self._stockpile_containers.setdefault(stockpile_id, {})[item.id] = item
+
+    def _unindex(self, item: Item, kind: str, container_id: Optional[int], stockpile_id: Optional[int]) -> None:
+        remaining = self.counts.get(kind, 0) - 1
+        if remaining > 0:
+            self.counts[kind] = remaining
+        else:
+            self.counts.pop(kind, None)
+        if kind in self._free:
+            self._free[kind].discard(item.id)
+        self.carried.pop(item.id, None)
+        if container_id is not None:
+            self._discard(self._contents, container_id, item.id)
+        if is_container_kind(kind):
+            self.containers.pop(item.id, None)
+            if stockpile_id is not None:
+                self._discard(self._stockpile_containers, stockpile_id, item.id)
+
+    @staticmethod
+    def _discard(buckets: Dict[int, Dict[int, Item]], key: int, item_id: int) -> None:
+        bucket = buckets.get(key)
+        if bucket is None:
+            return
+        bucket.pop(item_id, None)
+        if not bucket:
+            del buckets[key]
+
+
+class StockpileOccupancy:
+    """Slot usage per stockpile and per stockpile tile, for items sitting loose in a pile.
+
+    An item occupies a slot while `stockpile_id` is set and it is not inside a container.
+    `drop_tile` keeps a lazily-invalidated min-heap of (load, y, x) per stockpile, so picking
+    the least-loaded tile is a heap peek instead of a scan per tile.
+    """
+
+    def __init__(self) -> None:
+        self.reset(())
+
+    def reset(self, items: Iterable[Item]) -> None:
+        self._used: Dict[int, int] = {}
+        self._loose: Dict[int, Dict[int, Item]] = {}
+        self._tile_loads: Dict[int, Dict[Coord3, int]] = {}
+        self._drop_heaps: Dict[int, Tuple[Tuple[int, int, int, int, int], List[Tuple[int, int, int]]]] = {}
+        for item in items:
+            self.entity_added(item)
+
+    def used_slots(self, stockpile_id: int) -> int:
+        return self._used.get(stockpile_id, 0)
+
+    def loose_count(self, stockpile_id: int) -> int:
+        return len(self._loose.get(stockpile_id, _EMPTY))
+
+    def first_loose(self, stockpile_id: int) -> Optional[Item]:
+        loose = self._loose.get(stockpile_id)
+        if not loose:
+            return None
+        return loose[min(loose)]
+
+    def tile_load(self, stockpile_id: int, pos: Coord3) -> int:
+        return self._tile_loads.get(stockpile_id, {}).get(pos, 0)
+
+    def drop_tile(self, stockpile: Stockpile) -> Coord3:
+        rect = (stockpile.x, stockpile.y, stockpile.z, stockpile.w, stockpile.h)
+        entry = self._drop_heaps.get(stockpile.id)
+        if entry is None or entry[0] != rect:
+            entry = (rect, self._build_drop_heap(stockpile))
+            self._drop_heaps[stockpile.id] = entry
+        heap = entry[1]
+        loads = self._tile_loads.get(stockpile.id, {})
+        while heap:
+            load, yy, xx = heap[0]
+            if loads.get((xx, yy, stockpile.z), 0) == load:
+                return (xx, yy, stockpile.z)
+            heappop(heap)
+        return (stockpile.x, stockpile.y, stockpile.z)
+
+    def _build_drop_heap(self, stockpile: Stockpile) -> List[Tuple[int, int, int]]:
+        loads = self._tile_loads.get(stockpile.id, {})
+        heap = [
+            (loads.get((xx, yy, stockpile.z), 0), yy, xx)
+            for yy in range(stockpile.y, stockpile.y + stockpile.h)
+            for xx in range(stockpile.x, stockpile.x + stockpile.w)
+        ]
+        heapify(heap)
+        return heap
+
+    def entity_added(self, item: Item) -> None:
+        self._index(item, item.stockpile_id, item.container_id, item.kind, (item.x, item.y, item.z))
+
+    def entity_removed(self, item: Item) -> None:
+        self._unindex(item, item.stockpile_id, item.container_id, item.kind, (item.x, item.y, item.z))
+
+    def entity_changed(self, item: Item, name: str, old: object) -> None:
+        if name not in ("stockpile_id", "container_id", "kind", "x", "y", "z"):
+            return
+        stockpile_id = old if name == "stockpile_id" else item.stockpile_id
+        container_id = old if name == "container_id" else item.container_id
+        if stockpile_id is None and item.stockpile_id is None:
+            return
+        if container_id is not None and item.container_id is not None:
+            return
+        kind = old if name == "kind" else item.kind
+        pos = (
+            old if name == "x" else item.x,
+            old if name == "y" else item.y,
+            old if name == "z" else item.z,
+        )
+        self._unindex(item, stockpile_id, container_id, kind, pos)
+        self._index(item, item.stockpile_id, item.container_id, item.kind, (item.x, item.y, item.z))
+
+    def _index(self, item: Item, stockpile_id: Optional[int], container_id: Optional[int], kind: str, pos: Coord3) -> None:
+        if stockpile_id is None or container_id is not None:
+            return
+        self._used[stockpile_id] = self._used.get(stockpile_id, 0) + 1
+        if not is_container_kind(kind):
+            self._loose.setdefault(stockpile_id, {})[item.id] = item
+        self._adjust_tile(stockpile_id, pos, 1)
+
+    def _unindex(self, item: Item, stockpile_id: Optional[int], container_id: Optional[int], kind: str, pos: Coord3) -> None:
+        if stockpile_id is None or container_id is not None:
+            return
+        used = self._used.get(stockpile_id, 0) - 1
+        if used > 0:
+            self._used[stockpile_id] = used
+        else:
+            self._used.pop(stockpile_id, None)
+        InventoryIndex._discard(self._loose, stockpile_id, item.id)
+        self._adjust_tile(stockpile_id, pos, -1)
+
+    def _adjust_tile(self, stockpile_id: int, pos: Coord3, delta: int) -> None:
+        loads = self._tile_loads.setdefault(stockpile_id, {})
+        load = loads.get(pos, 0) + delta
+        if load > 0:
+            loads[pos] = load
+        else:
+            loads.pop(pos, None)
+        entry = self._drop_heaps.get(stockpile_id)
+        if entry is None:
+            return
+        (sx, sy, sz, sw, sh), heap = entry
+        x, y, z = pos
+        if z != sz or not (sx <= x < sx + sw and sy <= y < sy + sh):
+            return
+        heappush(heap, (max(0, load), y, x))
+        if len(heap) > 4 * sw * sh + 32:
+            del self._drop_heaps[stockpile_id]
+
+
+class HaulQueue:
+    """Items waiting to be hauled: loose, unreserved, uncarried and not yet stockpiled.
+
+    Bucketed by (z, kind). Stockpile choice depends only on an item's z-level and kind
+    (kind refines the stockpile category), so one probe per bucket decides every item in it.
+    """
+
+    def __init__(self) -> None:
+        self.reset(())
+
+    def reset(self, items: Iterable[Item]) -> None:
+        self._buckets: Dict[Tuple[int, str], IdBucket] = {}
+        self._where: Dict[int, Tuple[int, str]] = {}
+        for item in items:
+            self.entity_added(item)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def heads(self, accept: Optional[ItemFilter] = None, levels: Optional[Collection[int]] = None) -> List[Item]:
+        """Lowest-id waiting item of each bucket, in id order (the old full-scan order).
+
+        `levels` limits the buckets to those z-levels and `accept` the items considered.
+        """
+        heads: List[Item] = []
+        for (z, _), bucket in self._buckets.items():
+            if levels is not None and z not in levels:
+                continue
+            if accept is None:
+                head = bucket.first()
+                if head is not None:
+                    heads.append(head)
+            else:
+                heads.extend(bucket.lowest(1, accept))
+        heads.sort(key=lambda item: item.id)
+        return heads
+
+    def lowest(self, item: Item, n: int, accept: Optional[ItemFilter] = None) -> List[Item]:
+        """Up to `n` lowest-id waiting items of `item`'s bucket, in id order."""
+        key = self._where.get(item.id)
+        return self._buckets[key].lowest(n, accept) if key is not None else []
+
+    def entity_added(self, item: Item) -> None:
+        if (
+            item.reserved_by is not None
+            or item.carried_by is not None
+            or item.stockpile_id is not None
+            or item.container_id is not None
+        ):
+            return
+        key = (item.z, item.kind)
+        self._buckets.setdefault(key, IdBucket()).add(item)
+        self._where[item.id] = key
+
+    def entity_removed(self, item: Item) -> None:
+        key = self._where.pop(item.id, None)
+        if key is None:
+            return
+        bucket = self._buckets[key]
+        bucket.discard(item.id)
+        if not bucket:
+            del self._buckets[key]
+
+    def entity_changed(self, item: Item, name: str, old: object) -> None:
+        if name in ("reserved_by", "carried_by", "stockpile_id", "container_id", "kind", "z"):
+            self.entity_removed(item)
+            self.entity_added(item)
@@ -66,6 +66,9 @@ class CommandMixin:
         if cmd == "dig" and len(parts) == 5:
             self.queue_dig(int(parts[1]), int(parts[2]), int(parts[3]), int(parts[4]))
             return "dig job queued"
+        if cmd == "cancel" and len(parts) == 3 and parts[1] == "job":
+            job = self.cancel_job(int(parts[2]))
+            return f"cancelled job [{job.id}] {job.kind}"
         if cmd == "set" and len(parts) == 5 and parts[1] == "need":
             d = self._find_dwarf(int(parts[2]))
             if not d:
@@ -87,6 +90,9 @@ class CommandMixin:
                 return "dwarf not found"
             d.stress = clamp(int(parts[3]), 0, 100)
             return f"set stress {d.id}={d.stress}"
+        if cmd == "set" and len(parts) == 4 and parts[1] == "loglevel":
+            self.event_levels[parts[2]] = int(parts[3])
+            return f"set loglevel {parts[2]}={self.event_levels[parts[2]]}"
         if cmd == "labor" and len(parts) == 4:
             d = self._find_dwarf(int(parts[1]))
             if not d:
@@ -146,6 +152,12 @@ class CommandMixin:
             else:
                 self.debug_reveal_all_geology = True
             return f"geology reveal_all={self.debug_reveal_all_geology}"
+        if cmd == "verify" and len(parts) >= 2 and parts[1] == "wealth":
+            if len(parts) >= 3:
+                self.debug_verify_wealth = parts[2].lower() not in {"off", "0", "false"}
+                return f"wealth verify={self.debug_verify_wealth}"
+            drift = self._verify_wealth()
+            return f"wealth={self._ledger_wealth()} drift={drift:+d}"
         if cmd == "flora" and len(parts) == 5 and parts[1] == "at":
             return self.flora_at(int(parts[2]), int(parts[3]), int(parts[4]))
         if cmd == "prospect" and len(parts) == 4:
@@ -206,9 +218,11 @@ def help_text() -> str:
         "    kinds: kitchen kitchen_advanced brewery carpenter mason craftdwarf smithy loom leatherworks butcher tanner farmer mill quern furnace weaponsmith armorsmith blacksmith jeweler siege mechanic ashery dyer soapmaker potter bowyer fletcher paper scribe apothecary doctor\n"
         "  order <workshop_id> <recipe> <amount>\n"
         "  dig <x> <y> <from_z> <to_z>\n"
+        "  cancel job <job_id>\n"
         "  set need <dwarf_id> <need> <value>\n"
         "  set morale <dwarf_id> <value>\n"
         "  set stress <dwarf_id> <value>\n"
+        "  set loglevel <event_kind> <min_severity>\n"
         "  labor <dwarf_id> <labor> <0..5>\n"
         "  forbid <dwarf_id> <labor> | allow <dwarf_id> <labor>\n"
         "  squad create <name>\n"
@@ -217,6 +231,7 @@ def help_text() -> str:
         "  alert <peace|raid>\n"
         "  panel <world|worldgen|flora|geology|rooms|dwarves|jobs|stocks|events|factions|squads|justice|culture>\n"
         "  reveal geology [off]\n"
+        "  verify wealth [on|off]\n"
         "  flora at <x> <y> <z>\n"
         "  prospect <x> <y> <z>\n"
         "  items\n"
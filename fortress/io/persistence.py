@@ -4,6 +4,7 @@ from dataclasses import asdict
 from typing import Any, Dict, List
 import json
 
+from fortress.event_log import DEFAULT_EVENT_LEVELS
 from fortress.models import (
     Animal,
     Crime,
@@ -54,16 +55,18 @@ class PersistenceMixin:
             "regions": [asdict(r) for r in self.regions],
             "world_history": [asdict(h) for h in self.world_history],
             "rooms": [asdict(r) for r in self.rooms],
-            "floras": [asdict(fl) for fl in self.floras],
+            "floras": [dump_flora(fl) for fl in self.floras],
             "geology": {
                 "strata": self.geology_strata,
                 "deposits": [asdict(dep) for dep in self.geology_deposits],
                 "cavern_tiles": [list(t) for t in sorted(self.geology_cavern_tiles)],
                 "breached_tiles": [list(t) for t in sorted(self.geology_breached_tiles)],
             },
+            "stairs": [list(t) for t in sorted(self.paths.stairs)],
             "mandates": [asdict(m) for m in self.mandates],
             "crimes": [asdict(c) for c in self.crimes],
-            "events": [asdict(e) for e in self.events],
+            "events": [{**asdict(e), "text": e.text} for e in self.events],
+            "event_levels": dict(self.event_levels),
             "jobs": [asdict(j) for j in self.jobs],
             "counters": {
                 "next_zone_id": self.next_zone_id,
@@ -134,7 +137,7 @@ class PersistenceMixin:
         g.regions = [Region(**r) for r in data.get("regions", [])]
         g.world_history = [HistoricalEvent(**h) for h in data.get("world_history", [])]
         g.rooms = [Room(**r) for r in data.get("rooms", [])]
-        g.floras = [Flora(**fl) for fl in data.get("floras", [])]
+        g.floras = [load_flora(fl) for fl in data.get("floras", [])]
         geology = data.get("geology", {})
         g.geology_strata = {int(k): v for k, v in geology.get("strata", {}).items()}
         g.geology_deposits = [GeologyDeposit(**dep) for dep in geology.get("deposits", [])]
@@ -142,9 +145,18 @@ class PersistenceMixin:
         g.geology_breached_tiles = {tuple(t) for t in geology.get("breached_tiles", [])}
         if not g.geology_strata:
             g._generate_geology()
+        if "stairs" in data:
+            for x, y, z in data["stairs"]:
+                g.paths.add_stairs(x, y, z, z + 1)
+        else:
+            # Saves from before dug stairways: keep everything off level 0 connected to it.
+            for ent in [*g.dwarves, *g.animals, *g.workshops]:
+                if ent.z > 0:
+                    g.paths.add_stairs(ent.x, ent.y, 0, ent.z)
         g.mandates = [Mandate(**m) for m in data.get("mandates", [])]
         g.crimes = [Crime(**c) for c in data["crimes"]]
-        g.events = [Event(**e) for e in data["events"]]
+        g.events = [load_event(e) for e in data["events"]]
+        g.event_levels = dict(data.get("event_levels", DEFAULT_EVENT_LEVELS))
         g.jobs = [Job(**j) for j in data["jobs"]]
         counters = data["counters"]
         g.next_zone_id = counters["next_zone_id"]
@@ -164,6 +176,14 @@ class PersistenceMixin:
         g.command_log = data.get("command_log", [])
         g.economy_stats.update(data.get("economy_stats", {}))
         g.defs = data.get("defs", g.default_defs())
+        for d in g.dwarves:
+            job = d.job
+            if job is None or job.kind != "workshop_task" or job.reserved_ids:
+                continue
+            # Older saves did not record a task's inputs; they are the items its dwarf holds reserved.
+            ws = next((w for w in g.workshops if w.id == job.target_id), None)
+            inputs = g.defs.get("recipes", {}).get(ws.kind if ws else "", {}).get(job.recipe or "", {}).get("inputs", {})
+            job.reserved_ids = [i.id for i in g.items if i.reserved_by == d.id and i.kind in inputs]
         if not g.floras:
             g._init_flora()
         g._refresh_rooms_and_assignments()
@@ -192,6 +212,24 @@ class PersistenceMixin:
         return outputs
 
 
+def dump_flora(flora: Flora) -> Dict[str, Any]:
+    # stage_index is derived from stage and recomputed by FloraSpeciesTable on load.
+    raw = asdict(flora)
+    del raw["stage_index"]
+    return raw
+
+
+def load_flora(raw: Dict[str, Any]) -> Flora:
+    return Flora(**{key: value for key, value in raw.items() if key != "stage_index"})
+
+
+def load_event(raw: Dict[str, Any]) -> Event:
+    # Saves carry rendered text; older saves have only the text, which stands in as the template.
+    fields = {key: value for key, value in raw.items() if key != "text"}
+    fields.setdefault("template", raw.get("text", ""))
+    return Event(**fields)
+
+
 def deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     out = dict(a)
     for k, v in b.items():
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
+from fortress.event_log import alert_line
+
 
 class RenderMixin:
     def render_geology(self, z: Optional[int] = None) -> str:
@@ -88,12 +90,16 @@ class RenderMixin:
             if self._in_bounds(ws.x, ws.y, z):
                 grid[ws.y][ws.x] = ch
 
-        for fl in self.floras:
-            if fl.z != z or not self._in_bounds(fl.x, fl.y, z):
+        for fl in self.flora_grid.on_level(z):
+            if not self._in_bounds(fl.x, fl.y, z):
                 continue
             grid[fl.y][fl.x] = self._flora_glyph(fl)
 
-        for item in self.items:
+        # Carried items draw at their carrier, wherever their own coordinates last synced.
+        level_items = [i for i in self.item_grid.on_level(z) if i.carried_by is None]
+        level_items.extend(self.inventory.carried.values())
+        level_items.sort(key=lambda i: i.id)
+        for item in level_items:
             ix, iy, iz = self._item_pos(item)
             if iz != z or not self._in_bounds(ix, iy, iz):
                 continue
@@ -123,12 +129,12 @@ class RenderMixin:
             }.get(item.kind, "i")
             grid[iy][ix] = ch
 
-        for a in self.animals:
-            if a.z == z and self._in_bounds(a.x, a.y, z):
+        for a in self.animal_grid.on_level(z):
+            if self._in_bounds(a.x, a.y, z):
                 grid[a.y][a.x] = "a"
 
-        for d in self.dwarves:
-            if d.z == z and d.hp > 0 and self._in_bounds(d.x, d.y, z):
+        for d in self.dwarf_grid.on_level(z):
+            if d.hp > 0 and self._in_bounds(d.x, d.y, z):
                 grid[d.y][d.x] = "D"
 
         lines = [
@@ -224,7 +230,12 @@ class RenderMixin:
                 )
             return "\n".join(lines)
         if name == "jobs":
-            lines = ["Global queued jobs:"]
+            lines = ["Job board:"]
+            for labor in sorted(set(self.job_board.labors()) | set(self.job_board.waited)):
+                lines.append(
+                    f"  {labor}: queued={self.job_board.depth(labor)} oldest_wait={self.job_board.oldest_wait(labor)} mean_wait={self.job_board.mean_wait(labor):.1f}"
+                )
+            lines.append("Global queued jobs:")
             for j in self.jobs:
                 lines.append(f"[{j.id}] {j.kind} labor={j.labor} target={j.target_id} rem={j.remaining}")
             lines.append("Assigned jobs:")
@@ -248,16 +259,14 @@ class RenderMixin:
                     f"{k}: total={counts[k]} loose={loose_counts.get(k, 0)} contained={contained_counts.get(k, 0)}"
                 )
             lines.append("Containers:")
-            for i in sorted(self.items, key=lambda x: x.id):
-                if i.kind not in {"chest", "barrel", "bin", "crate", "bag"}:
-                    continue
-                used = sum(1 for x in self.items if x.container_id == i.id)
+            for i in sorted(self.inventory.containers.values(), key=lambda x: x.id):
+                used = len(self.inventory.contents_of(i.id))
                 lines.append(
                     f"  [{i.id}] {i.kind} stockpile={i.stockpile_id} load={used} mat={i.material}"
                 )
             return "\n".join(lines)
         if name == "events":
-            return "\n".join(f"t{e.tick} [{e.kind}] sev={e.severity} {e.text}" for e in self.events[-20:])
+            return "\n".join(f"t{e.tick} [{e.kind}] sev={e.severity} {e.text}" for e in self.events.recent(20))
         if name == "factions":
             return "\n".join(
                 f"[{f.id}] {f.name}: {f.stance} rep={f.reputation} home_region={f.home_region_id} type={f.civ_type}"
@@ -342,7 +351,7 @@ class RenderMixin:
             for label, count in sorted(species_counts.items(), key=lambda kv: kv[1], reverse=True)[:12]:
                 lines.append(f"  {label}: {count}")
             lines.append("Recent flora events:")
-            flora_events = [e for e in self.events if e.kind == "flora"][-8:]
+            flora_events = self.events.recent(8, kind="flora")
             if flora_events:
                 for e in flora_events:
                     lines.append(f"  t{e.tick} {e.text}")
@@ -407,4 +416,4 @@ class RenderMixin:
         return "\n".join(lines)
 
     def alerts_dump(self) -> str:
-        return "\n".join(self.alerts[-20:]) or "no alerts"
+        return "\n".join(alert_line(e) for e in self.events.recent_alerts(20)) or "no alerts"
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Tuple
+
+from fortress.models import Job, Workshop
+
+
+# Job kinds designated by the player and queued on the board until a dwarf takes them.
+BOARD_JOB_KINDS = frozenset({"build_workshop", "dig_stairs"})
+
+
+class JobBoard:
+    """Queued global jobs (`Game.jobs`) as per-labor priority queues, bucketed by z-level.
+
+    Jobs pop oldest designation (lowest id) first. `take` passes over whole z-buckets
+    outside the caller's `levels` (those it cannot reach) without looking at them, and
+    skips jobs it rejects (e.g. walled off on a reachable level) without dequeuing them.
+    Taken and cancelled jobs leave stale heap entries that are dropped lazily, so pushes
+    and pops are O(log n).
+    Attached as a listener to `Game.jobs`; `clock` reads the current tick for wait times.
+    """
+
+    def __init__(self, clock: Callable[[], int]) -> None:
+        self.clock = clock
+        self.reset(())
+
+    def reset(self, jobs: Iterable[Job]) -> None:
+        self._queues: Dict[str, Dict[int, List[int]]] = {}
+        self._jobs: Dict[int, Job] = {}
+        self._where: Dict[int, Tuple[str, int]] = {}
+        self._queued_at: Dict[int, int] = {}
+        self._depth: Dict[str, int] = {}
+        # labor -> (jobs taken, total ticks they waited)
+        self.waited: Dict[str, Tuple[int, int]] = {}
+        for job in jobs:
+            self.entity_added(job)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def depth(self, labor: str) -> int:
+        return self._depth.get(labor, 0)
+
+    def labors(self) -> List[str]:
+        return sorted(self._depth)
+
+    def oldest_wait(self, labor: str) -> int:
+        now = self.clock()
+        return max((now - self._queued_at[job_id] for job_id, (lab, _) in self._where.items() if lab == labor), default=0)
+
+    def mean_wait(self, labor: str) -> float:
+        taken, total = self.waited.get(labor, (0, 0))
+        return total / taken if taken else 0.0
+
+    def entity_added(self, job: Job) -> None:
+        if job.id in self._jobs:
+            return
+        key = (job.labor, job.destination[2] if job.destination is not None else -1)
+        self._jobs[job.id] = job
+        self._where[job.id] = key
+        self._queued_at[job.id] = self.clock()
+        self._depth[job.labor] = self._depth.get(job.labor, 0) + 1
+        heap = self._queues.setdefault(key[0], {}).setdefault(key[1], [])
+        heappush(heap, job.id)
+        if len(heap) > 2 * self._depth[job.labor] + 32:
+            self._compact(key)
+
+    def entity_removed(self, job: Job) -> None:
+        if self._jobs.get(job.id) is not job:
+            return
+        del self._jobs[job.id]
+        del self._where[job.id]
+        del self._queued_at[job.id]
+        self._depth[job.labor] -= 1
+        if not self._depth[job.labor]:
+            del self._depth[job.labor]
+            del self._queues[job.labor]
+
+    def entity_changed(self, job: Job, name: str, old: object) -> None:
+        pass
+
+    def take(self, labor: str, accept: Callable[[Job], bool], levels: Optional[Collection[int]] = None) -> Optional[Job]:
+        """Lowest-id accepted job of `labor`, counted as waited-for; the caller dequeues it.
+
+        With `levels`, only jobs on those z-levels (or without a destination) are considered.
+        """
+        best: Optional[Job] = None
+        for z in list(self._queues.get(labor, ())):
+            if levels is not None and z >= 0 and z not in levels:
+                continue
+            job = self._first(labor, z, accept)
+            if job is not None and (best is None or job.id < best.id):
+                best = job
+        if best is not None:
+            taken, total = self.waited.get(labor, (0, 0))
+            self.waited[labor] = (taken + 1, total + self.clock() - self._queued_at[best.id])
+        return best
+
+    def _first(self, labor: str, z: int, accept: Callable[[Job], bool]) -> Optional[Job]:
+        heap = self._queues[labor][z]
+        key = (labor, z)
+        skipped: List[int] = []
+        found: Optional[Job] = None
+        while heap:
+            job_id = heap[0]
+            if self._where.get(job_id) != key:
+                heappop(heap)
+                continue
+            job = self._jobs[job_id]
+            if accept(job):
+                found = job
+                break
+            skipped.append(heappop(heap))
+        for job_id in skipped:
+            heappush(heap, job_id)
+        if not heap:
+            del self._queues[labor][z]
+        return found
+
+    def _compact(self, key: Tuple[str, int]) -> None:
+        heap = [job_id for job_id in set(self._queues[key[0]][key[1]]) if self._where.get(job_id) == key]
+        heapify(heap)
+        self._queues[key[0]][key[1]] = heap
+
+
+class ReadyWorkshops:
+    """Built workshops with outstanding orders, keyed by (z, labor) for workshop dispatch.
+
+    Attached as a listener to `Game.workshops` (built/z changes arrive as watched writes);
+    order changes go through `refresh`.
+    """
+
+    def __init__(self, labor_for: Callable[[str], str]) -> None:
+        self.labor_for = labor_for
+        self.reset(())
+
+    def reset(self, workshops: Iterable[Workshop]) -> None:
+        self._ready: Dict[Tuple[int, str], Dict[int, Workshop]] = {}
+        self._where: Dict[int, Tuple[int, str]] = {}
+        for ws in workshops:
+            self.refresh(ws)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def at(self, z: int) -> List[Tuple[str, Workshop]]:
+        """(labor, workshop) pairs ready on level `z`, in workshop id order."""
+        ready = [(labor, ws) for (wz, labor), bucket in self._ready.items() if wz == z for ws in bucket.values()]
+        ready.sort(key=lambda pair: pair[1].id)
+        return ready
+
+    def refresh(self, ws: Workshop) -> None:
+        self.entity_removed(ws)
+        if ws.built and any(count > 0 for count in ws.orders.values()):
+            key = (ws.z, self.labor_for(ws.kind))
+            self._ready.setdefault(key, {})[ws.id] = ws
+            self._where[ws.id] = key
+
+    def entity_added(self, ws: Workshop) -> None:
+        self.refresh(ws)
+
+    def entity_removed(self, ws: Workshop) -> None:
+        key = self._where.pop(ws.id, None)
+        if key is None:
+            return
+        bucket = self._ready[key]
+        del bucket[ws.id]
+        if not bucket:
+            del self._ready[key]
+
+    def entity_changed(self, ws: Workshop, name: str, old: object) -> None:
+        if name in ("z", "built"):
+            self.refresh(ws)
+
+
+class BuiltWorkshops:
+    """Built workshops by kind, for the order planner's workshop lookups.
+
+    Attached as a listener to `Game.workshops`.
+    """
+
+    def __init__(self) -> None:
+        self.reset(())
+
+    def reset(self, workshops: Iterable[Workshop]) -> None:
+        self._by_kind: Dict[str, Dict[int, Workshop]] = {}
+        for ws in workshops:
+            self.entity_added(ws)
+
+    def first(self, kind: str) -> Optional[Workshop]:
+        bucket = self._by_kind.get(kind)
+        return bucket[min(bucket)] if bucket else None
+
+    def of_kind(self, kind: str) -> List[Workshop]:
+        bucket = self._by_kind.get(kind)
+        return [bucket[ws_id] for ws_id in sorted(bucket)] if bucket else []
+
+    def entity_added(self, ws: Workshop) -> None:
+        if ws.built:
+            self._by_kind.setdefault(ws.kind, {})[ws.id] = ws
+
+    def entity_removed(self, ws: Workshop) -> None:
+        bucket = self._by_kind.get(ws.kind)
+        if bucket is None or bucket.get(ws.id) is not ws:
+            return
+        del bucket[ws.id]
+        if not bucket:
+            del self._by_kind[ws.kind]
+
+    def entity_changed(self, ws: Workshop, name: str, old: object) -> None:
+        if name == "built":
+            self.entity_removed(ws)
+            self.entity_added(ws)
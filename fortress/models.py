@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple
 import random
+from types import MemberDescriptorType
+
+from fortress.event_templates import EVENT_TEMPLATES
 
 
 Coord3 = Tuple[int, int, int]
@@ -32,13 +35,117 @@ CONTAINER_CAPACITY: Dict[str, int] = {
     "bag": 8,
 }
 
+ORGANIC_KINDS = frozenset(
+    {
+        "raw_food",
+        "cooked_food",
+        "alcohol",
+        "herb",
+        "berry",
+        "fiber",
+        "hide",
+        "leather",
+        "timber",
+        "wood",
+        "seed",
+        "flour",
+    }
+)
+
 
 def clamp(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, v))
 
 
+def weathered_perishability(base: int, wet: bool, hot: bool) -> int:
+    if base <= 0:
+        return 0
+    effective = base
+    if wet:
+        effective = int(effective * 0.78)
+    if hot:
+        effective = int(effective * 0.85)
+    return max(1, effective)
+
+
+class Watched:
+    # Writes to `_watched_fields` are reported to the owning EntityList so its indexes stay current.
+    # `_columns` is the column store (if any) backing the entity's `ColumnBacked` fields.
+    __slots__ = ("_watcher", "_columns")
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        obj = super().__new__(cls)
+        object.__setattr__(obj, "_watcher", None)
+        object.__setattr__(obj, "_columns", None)
+        return obj
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        watcher = self._watcher
+        if watcher is None or name not in self._watched_fields:
+            object.__setattr__(self, name, value)
+            return
+        old = getattr(self, name)
+        object.__setattr__(self, name, value)
+        if old != value:
+            watcher(self, name, old)
+
+
+class ColumnBacked:
+    # Slot field that lives in the attached column store (`_columns`) while there is one that lists it in `BACKED`.
+    def __init__(self, name: str, slot: Any) -> None:
+        self.name = name
+        self.slot = slot
+        self._slot_get = slot.__get__
+        self._slot_set = slot.__set__
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        columns = obj._columns
+        if columns is None or self.name not in columns.BACKED:
+            return self._slot_get(obj)
+        return columns.get(obj, self.name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        columns = obj._columns
+        if columns is None or self.name not in columns.BACKED:
+            self._slot_set(obj, value)
+        else:
+            columns.set(obj, self.name, value)
+
+
+class InstanceField:
+    # Stands in for the slot of a `ColumnBacked` field on classes with an instance `__dict__`.
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+def column_backed(*names: str) -> Callable[[type], type]:
+    def wrap(cls: type) -> type:
+        for name in names:
+            slot = cls.__dict__.get(name)
+            if not isinstance(slot, MemberDescriptorType):
+                slot = InstanceField(name)
+            setattr(cls, name, ColumnBacked(name, slot))
+        return cls
+
+    return wrap
+
+
 @dataclass
-class Zone:
+class Zone(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset({"kind", "x", "y", "z", "w", "h"})
+
     id: int
     kind: str  # farm recreation temple dormitory hospital pasture burrow
     x: int
@@ -89,7 +196,9 @@ class Stockpile:
 
 
 @dataclass
-class Workshop:
+class Workshop(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset({"x", "y", "z", "built"})
+
     id: int
     kind: str  # kitchen brewery carpenter mason craftdwarf smithy loom leatherworks
     x: int
@@ -103,8 +212,25 @@ class Workshop:
         return (self.x, self.y, self.z)
 
 
-@dataclass
-class Item:
+@column_backed("age")
+@dataclass(slots=True)
+class Item(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "kind",
+            "x",
+            "y",
+            "z",
+            "value",
+            "quality",
+            "perishability",
+            "carried_by",
+            "reserved_by",
+            "container_id",
+            "stockpile_id",
+        }
+    )
+
     id: int
     kind: str
     x: int
@@ -122,7 +248,7 @@ class Item:
     container_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     id: int
     kind: str
@@ -134,10 +260,15 @@ class Job:
     remaining: int = 1
     phase: str = ""
     container_id: Optional[int] = None
+    # Workshop inputs reserved for this job, consumed on completion.
+    reserved_ids: List[int] = field(default_factory=list)
 
 
+@column_backed("hp", "stress", "morale", "rested_bonus", "withdrawal_ticks", "alcohol_dependency", "needs", "nutrition")
 @dataclass
-class Dwarf:
+class Dwarf(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset({"x", "y", "z", "alcohol_dependency"})
+
     id: int
     name: str
     x: int
@@ -191,7 +322,9 @@ class Dwarf:
 
 
 @dataclass
-class Animal:
+class Animal(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset({"x", "y", "z"})
+
     id: int
     species: str
     x: int
@@ -223,7 +356,7 @@ class Faction:
     civ_type: str = "kingdom"
 
 
-@dataclass
+@dataclass(slots=True)
 class Crime:
     id: int
     tick: int
@@ -232,12 +365,20 @@ class Crime:
     resolved: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     tick: int
     kind: str
-    text: str
+    # An `EVENT_TEMPLATES` id, rendered with `data` only when the text is read.
+    template: str
     severity: int = 1
+    # Structured payload (entity ids, amounts) that doubles as the template arguments.
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        fmt = EVENT_TEMPLATES.get(self.template)
+        return self.template if fmt is None else fmt.format(**self.data)
 
 
 @dataclass
@@ -280,8 +421,13 @@ class Room:
         return pz == self.z and self.x <= px < self.x + self.w and self.y <= py < self.y + self.h
 
 
-@dataclass
-class Flora:
+@column_backed("age_ticks", "growth_points", "health", "spread_cooldown", "stressed", "dormant")
+@dataclass(slots=True)
+class Flora(Watched):
+    _watched_fields: ClassVar[FrozenSet[str]] = frozenset(
+        {"x", "y", "z", "stage", "species_id", "dead", "health", "reserved_by"}
+    )
+
     id: int
     species_id: str
     common_name: str
@@ -299,13 +445,14 @@ class Flora:
     dead: bool = False
     spread_cooldown: int = 0
     reserved_by: Optional[int] = None
+    stage_index: int = field(default=0, repr=False, compare=False)  # kept in step with `stage` by FloraSpeciesTable
 
     @property
     def pos(self) -> Coord3:
         return (self.x, self.y, self.z)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeologyDeposit:
     id: int
     x: int
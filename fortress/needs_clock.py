@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, Mapping, Set, Tuple
+
+from fortress.dwarf_columns import CRITICAL_NEEDS, NUTRITION_KEYS
+from fortress.models import Dwarf, clamp
+
+
+# need -> (period, step) of its rise in the needs pass. Alcohol rises by the dwarf's dependency
+# pressure and safety by the raid state, so both are resolved per dwarf / per phase.
+NEED_RATES: Dict[str, Tuple[int, int]] = {
+    "hunger": (2, 1),
+    "thirst": (2, 1),
+    "sleep": (4, 1),
+    "social": (5, 1),
+    "worship": (5, 1),
+    "entertainment": (5, 1),
+}
+NUTRITION_RATE = (4, 1)
+# Thresholds the needs pass branches on (see `need_flags`), ascending.
+NEED_THRESHOLDS: Dict[str, Tuple[int, ...]] = {
+    "hunger": (90, 96),
+    "thirst": (90, 96),
+    "sleep": (90, 98),
+    "safety": (90,),
+    "alcohol": (85,),
+}
+OVERFED_NUTRITION = 85
+NEVER = sys.maxsize
+
+NeedFlags = Tuple[bool, bool, bool, bool, bool, int]
+
+
+def alcohol_pressure(dependency: int) -> int:
+    return max(0, dependency // 45)
+
+
+def risen(value: int, step: int, steps: int) -> int:
+    # `steps` applications of clamp(value + step, 0, 100), in closed form.
+    if steps <= 0:
+        return value
+    value = clamp(value + step, 0, 100)
+    return clamp(value + step * (steps - 1), 0, 100)
+
+
+def need_flags(needs: Mapping[str, int], nutrition: Mapping[str, int]) -> NeedFlags:
+    # Everything the needs pass branches on: (overfed, starving, parched, exhausted, craving,
+    # number of critical needs at 90+).
+    return (
+        sum(nutrition.values()) / len(nutrition) >= OVERFED_NUTRITION,
+        needs["hunger"] >= 96,
+        needs["thirst"] >= 96,
+        needs["sleep"] >= 98,
+        needs["alcohol"] >= 85,
+        sum(1 for key in CRITICAL_NEEDS if needs.get(key, 0) >= 90),
+    )
+
+
+class NeedsView(MutableMapping):
+    """Dict-like view of a dwarf's `needs` or `nutrition` as the `NeedsClock` evaluates them now.
+
+    Copies (`dict(view)`, `copy.deepcopy`, `dataclasses.asdict`) are plain dicts.
+    """
+
+    __slots__ = ("_clock", "_name", "_dwarf_id")
+
+    def __init__(self, clock: "NeedsClock", name: str, dwarf_id: int) -> None:
+        self._clock = clock
+        self._name = name
+        self._dwarf_id = dwarf_id
+
+    def __getitem__(self, key: str) -> int:
+        return self._clock.value(self._dwarf_id, self._name, key)
+
+    def __setitem__(self, key: str, value: int) -> None:
+        self._clock.write(self._dwarf_id, self._name, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"{self._name} keys are fixed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._clock._base[self._name][self._dwarf_id])
+
+    def __len__(self) -> int:
+        return len(self._clock._base[self._name][self._dwarf_id])
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, int]:
+        return dict(self)
+
+    def copy(self) -> Dict[str, int]:
+        return dict(self)
+
+
+class NeedsClock:
+    """Lazy dwarf needs for the scalar needs pass.
+
+    Needs and nutrition rise on a fixed cadence (`NEED_RATES`), so an attached dwarf stores
+    base values and the pass tick they were taken at, and `Dwarf.needs` / `Dwarf.nutrition`
+    read as `NeedsView`s that evaluate them in closed form at the clock's tick (see
+    `ColumnBacked`). Writes, dependency changes, raid toggles and gaps in the pass ticks rebase.
+
+    The pass only needs `need_flags`, which change when a need crosses one of
+    `NEED_THRESHOLDS` (or nutrition turns overfed); each dwarf's flags are cached with the
+    earliest pass tick that can change them, so content dwarves cost no need arithmetic.
+    Dead dwarves are skipped by the pass, so their needs freeze until they recover.
+    """
+
+    BACKED = ("needs", "nutrition")
+
+    def __init__(self) -> None:
+        self.tick = 0
+        self.raid = False
+        self._dwarves: Dict[int, Dwarf] = {}
+        self._base: Dict[str, Dict[int, Dict[str, int]]] = {name: {} for name in self.BACKED}
+        self._since: Dict[int, int] = {}
+        self._pressure: Dict[int, int] = {}
+        self._frozen: Set[int] = set()
+        self._flags: Dict[int, NeedFlags] = {}
+        self._wake: Dict[int, int] = {}
+        self._views: Dict[Tuple[int, str], NeedsView] = {}
+
+    def __len__(self) -> int:
+        return len(self._dwarves)
+
+    def reset(self, dwarves: Iterable[Dwarf]) -> None:
+        for dwarf in list(self._dwarves.values()):
+            self._detach(dwarf)
+        self._dwarves.clear()
+        for base in self._base.values():
+            base.clear()
+        self._since.clear()
+        self._pressure.clear()
+        self._frozen.clear()
+        self._flags.clear()
+        self._wake.clear()
+        self._views.clear()
+        for dwarf in dwarves:
+            self.entity_added(dwarf)
+
+    def _rate(self, dwarf_id: int, name: str, key: str) -> Tuple[int, int]:
+        if name == "nutrition":
+            return NUTRITION_RATE if key in NUTRITION_KEYS else (0, 0)
+        if key == "safety":
+            return (2, 1) if self.raid else (1, -1)
+        if key == "alcohol":
+            return 4, self._pressure[dwarf_id]
+        return NEED_RATES.get(key, (0, 0))
+
+    def _value_at(self, dwarf_id: int, name: str, key: str, tick: int) -> int:
+        value = self._base[name][dwarf_id][key]
+        if dwarf_id in self._frozen:
+            return value
+        period, step = self._rate(dwarf_id, name, key)
+        if not period:
+            return value
+        return risen(value, step, tick // period - self._since[dwarf_id] // period)
+
+    def _values_at(self, dwarf_id: int, name: str, tick: int) -> Dict[str, int]:
+        return {key: self._value_at(dwarf_id, name, key, tick) for key in self._base[name][dwarf_id]}
+
+    def _rebase(self, dwarf_id: int, since: int, tick: int) -> None:
+        # Settles the values as of pass `tick`; later rises count from pass `since`.
+        for name, base in self._base.items():
+            base[dwarf_id] = self._values_at(dwarf_id, name, tick)
+        self._since[dwarf_id] = since
+        self._wake[dwarf_id] = 0
+
+    def value(self, dwarf_id: int, name: str, key: str) -> int:
+        return self._value_at(dwarf_id, name, key, self.tick)
+
+    def write(self, dwarf_id: int, name: str, key: str, value: int) -> None:
+        self._rebase(dwarf_id, self.tick, self.tick)
+        self._base[name][dwarf_id][key] = value
+
+    def get(self, dwarf: Dwarf, name: str) -> NeedsView:
+        view = self._views.get((dwarf.id, name))
+        if view is None:
+            view = self._views[(dwarf.id, name)] = NeedsView(self, name, dwarf.id)
+        return view
+
+    def set(self, dwarf: Dwarf, name: str, value: Mapping[str, int]) -> None:
+        self._rebase(dwarf.id, self.tick, self.tick)
+        self._base[name][dwarf.id] = dict(value)
+
+    def _detach(self, dwarf: Dwarf) -> None:
+        if dwarf._columns is not self:
+            return
+        values = [self._values_at(dwarf.id, name, self.tick) for name in self.BACKED]
+        object.__setattr__(dwarf, "_columns", None)
+        for name, value in zip(self.BACKED, values):
+            object.__setattr__(dwarf, name, value)
+
+    def entity_added(self, dwarf: Dwarf) -> None:
+        if dwarf.id in self._dwarves:
+            return
+        for name, base in self._base.items():
+            base[dwarf.id] = dict(getattr(dwarf, name))
+        self._dwarves[dwarf.id] = dwarf
+        self._since[dwarf.id] = self.tick
+        self._pressure[dwarf.id] = alcohol_pressure(dwarf.alcohol_dependency)
+        self._wake[dwarf.id] = 0
+        object.__setattr__(dwarf, "_columns", self)
+
+    def entity_removed(self, dwarf: Dwarf) -> None:
+        if dwarf.id not in self._dwarves:
+            return
+        self._detach(dwarf)
+        del self._dwarves[dwarf.id]
+        for name, base in self._base.items():
+            del base[dwarf.id]
+            self._views.pop((dwarf.id, name), None)
+        del self._since[dwarf.id]
+        del self._pressure[dwarf.id]
+        self._frozen.discard(dwarf.id)
+        self._flags.pop(dwarf.id, None)
+        del self._wake[dwarf.id]
+
+    def entity_changed(self, dwarf: Dwarf, name: str, old: object) -> None:
+        if name != "alcohol_dependency" or dwarf.id not in self._dwarves:
+            return
+        self._rebase(dwarf.id, self.tick, self.tick)
+        self._pressure[dwarf.id] = alcohol_pressure(dwarf.alcohol_dependency)
+
+    def advance(self, tick: int, raid: bool) -> None:
+        # Called at the start of each needs pass. Rises are counted over consecutive pass ticks
+        # in one raid phase; anything else settles every dwarf at the last pass first.
+        if tick != self.tick + 1 or raid != self.raid:
+            for dwarf_id in self._dwarves:
+                self._rebase(dwarf_id, tick - 1, self.tick)
+            self.raid = raid
+        self.tick = tick
+
+    def freeze(self, dwarf: Dwarf) -> None:
+        # The pass skipped this dead dwarf: its needs stop at the previous pass.
+        if dwarf.id in self._frozen:
+            return
+        self._rebase(dwarf.id, self.tick - 1, self.tick - 1)
+        self._frozen.add(dwarf.id)
+
+    def flags(self, dwarf: Dwarf) -> NeedFlags:
+        dwarf_id = dwarf.id
+        if dwarf_id in self._frozen:
+            self._frozen.discard(dwarf_id)
+            self._since[dwarf_id] = self.tick - 1
+            self._wake[dwarf_id] = 0
+        if self.tick < self._wake[dwarf_id]:
+            return self._flags[dwarf_id]
+        needs = self._values_at(dwarf_id, "needs", self.tick)
+        nutrition = self._values_at(dwarf_id, "nutrition", self.tick)
+        flags = self._flags[dwarf_id] = need_flags(needs, nutrition)
+        self._wake[dwarf_id] = self._next_wake(dwarf_id, needs, nutrition, flags[0])
+        return flags
+
+    def _next_wake(self, dwarf_id: int, needs: Mapping[str, int], nutrition: Mapping[str, int], overfed: bool) -> int:
+        # Earliest pass tick at which a flag can flip. Estimates may be early (values outside
+        # 0..100 are treated as clamped), never late: an early wake just recomputes the flags.
+        wake = NEVER
+        for key, thresholds in NEED_THRESHOLDS.items():
+            period, step = self._rate(dwarf_id, "needs", key)
+            value = clamp(needs[key], 0, 100)
+            if step > 0:
+                above = [t for t in thresholds if t > value]
+                if not above:
+                    continue
+                steps = -(-(above[0] - value) // step)
+            elif step < 0:
+                below = [t for t in thresholds if t <= value]
+                if not below:
+                    continue
+                steps = (value - below[-1]) // -step + 1
+            else:
+                continue
+            wake = min(wake, (self.tick // period + steps) * period)
+        rising = sum(1 for key in nutrition if key in NUTRITION_KEYS)
+        total = sum(max(value, 0) if key in NUTRITION_KEYS else value for key, value in nutrition.items())
+        short = OVERFED_NUTRITION * len(nutrition) - total
+        if rising and not overfed:
+            period, _ = NUTRITION_RATE
+            wake = min(wake, (self.tick // period + max(1, -(-short // rising))) * period)
+        return wake
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict, deque
+from heapq import heappop, heappush
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from fortress.models import Coord3, Workshop
+
+
+Route = Tuple[Coord3, ...]
+
+PLANE_STEPS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+HOT_ROUTES = 6  # fresh routes to one goal before it gets a flow field
+
+
+class FlowField:
+    # Next-step table toward one goal: `step[i]` is the tile index to move to from tile i, -1 if none.
+    __slots__ = ("goal", "version", "step")
+
+    def __init__(self, goal: Coord3, version: int, step: "array[int]") -> None:
+        self.goal = goal
+        self.version = version
+        self.step = step
+
+
+class PathFinder:
+    """Passability grid, stairways and shortest routes with an LRU route cache.
+
+    Attached to `Game.workshops`. Every tile is walkable; with `block_workshops` a built
+    workshop's tile may only be a route's start or end. Levels connect only through dug
+    stairways (`stairs` holds the lower tile of each z / z+1 link). Routes are shortest 8-connected paths: the
+    diagonal-then-straight line when it is clear (so movement on open ground is unchanged),
+    otherwise A*. Routes are cached by (start, goal); any change to the grid clears the cache.
+
+    Goals that keep needing fresh routes (stockpile drop tiles, workshops, zone tiles) get a
+    `FlowField` shared by every walker: one BFS from the goal, after which each step is one
+    table lookup. Steps prefer the straight-line move whenever it is on a shortest path. At
+    most `field_budget` fields are kept (least recently used go first); fields built before a
+    grid change are rebuilt the next time they are used.
+
+    Connectivity is labelled lazily per grid version: 8-connected areas of walkable tiles on
+    each level, joined into regions through stairways. `reachable` compares region ids, so
+    hopeless searches and job assignments are rejected without searching.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        depth: int,
+        capacity: int = 512,
+        field_budget: int = 24,
+        block_workshops: bool = False,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.capacity = capacity
+        self.field_budget = field_budget
+        self.block_workshops = block_workshops
+        self.fields_built = 0
+        self.stairs: Set[Coord3] = set()
+        self.walkable = bytearray(b"\x01") * (width * height * depth)
+        self.up = bytearray(width * height * depth)
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._blocked: Dict[Coord3, int] = {}
+        self._blocking: Dict[int, Coord3] = {}
+        self._cache: "OrderedDict[Tuple[Coord3, Coord3], Optional[Route]]" = OrderedDict()
+        self._following: Dict[int, Tuple[Coord3, int, Route, int]] = {}
+        self._fields: "OrderedDict[Coord3, FlowField]" = OrderedDict()
+        self._demand: Dict[Coord3, int] = {}
+        self._adjacent: Optional[List[Tuple[int, ...]]] = None
+        self._labels_version = -1
+        self.level_labels: "array[int]" = array("i")
+        self.level_regions: List[int] = []
+        self._region: "array[int]" = array("i")
+        self._touching: Dict[int, FrozenSet[int]] = {}
+        self._level_sets: List[FrozenSet[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _index(self, x: int, y: int, z: int) -> int:
+        return (z * self.height + y) * self.width + x
+
+    def _coord(self, index: int) -> Coord3:
+        z, rest = divmod(index, self.width * self.height)
+        y, x = divmod(rest, self.width)
+        return (x, y, z)
+
+    def in_bounds(self, pos: Coord3) -> bool:
+        x, y, z = pos
+        return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth
+
+    def is_walkable(self, pos: Coord3) -> bool:
+        return self.in_bounds(pos) and bool(self.walkable[self._index(*pos)])
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._cache.clear()
+        self._following.clear()
+
+    def reset(self, workshops: Iterable[Workshop]) -> None:
+        for workshop_id in list(self._blocking):
+            self._unblock(workshop_id)
+        for workshop in workshops:
+            self.entity_added(workshop)
+        self.invalidate()
+
+    def entity_added(self, workshop: Workshop) -> None:
+        tile = workshop.pos if self.block_workshops and workshop.built else None
+        if self._blocking.get(workshop.id) == tile:
+            return
+        self._unblock(workshop.id)
+        if tile is None or not self.in_bounds(tile):
+            return
+        self._blocking[workshop.id] = tile
+        self._blocked[tile] = self._blocked.get(tile, 0) + 1
+        self.walkable[self._index(*tile)] = 0
+        self.invalidate()
+
+    def entity_removed(self, workshop: Workshop) -> None:
+        self._unblock(workshop.id)
+
+    def entity_changed(self, workshop: Workshop, name: str, old: object) -> None:
+        self.entity_added(workshop)
+
+    def _unblock(self, workshop_id: int) -> None:
+        tile = self._blocking.pop(workshop_id, None)
+        if tile is None:
+            return
+        self._blocked[tile] -= 1
+        if not self._blocked[tile]:
+            del self._blocked[tile]
+            self.walkable[self._index(*tile)] = 1
+        self.invalidate()
+
+    def add_stairs(self, x: int, y: int, from_z: int, to_z: int) -> None:
+        added = False
+        for z in range(min(from_z, to_z), max(from_z, to_z)):
+            if (x, y, z) in self.stairs or not self.in_bounds((x, y, z + 1)):
+                continue
+            self.stairs.add((x, y, z))
+            self.up[self._index(x, y, z)] = 1
+            added = True
+        if added:
+            self._adjacent = None
+            self.invalidate()
+
+    def route(self, start: Coord3, goal: Coord3) -> Optional[Route]:
+        # Tiles from start to goal inclusive, or None when the goal cannot be reached.
+        key = (start, goal)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+        self.misses += 1
+        route = None
+        if self.reachable(start, goal):
+            route = self._line(start, goal) or self._search(start, goal)
+        self._cache[key] = route
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return route
+
+    def next_step(self, walker_id: int, start: Coord3, goal: Coord3) -> Optional[Coord3]:
+        # Follows the goal's flow field, else the walker's current route while it stays valid;
+        # None when unreachable.
+        field = self.field(goal)
+        if field is not None:
+            if not self.in_bounds(start):
+                return None
+            step = field.step[self._index(*start)]
+            return None if step < 0 else self._coord(step)
+        following = self._following.get(walker_id)
+        if following is not None:
+            route_goal, version, route, i = following
+            if route_goal == goal and version == self.version and i + 1 < len(route) and route[i] == start:
+                self._following[walker_id] = (goal, version, route, i + 1)
+                return route[i + 1]
+        self._demand[goal] = self._demand.get(goal, 0) + 1
+        route = self.route(start, goal)
+        if route is None or len(route) < 2:
+            self._following.pop(walker_id, None)
+            return None
+        self._following[walker_id] = (goal, self.version, route, 1)
+        return route[1]
+
+    def reachable(self, start: Coord3, goal: Coord3) -> bool:
+        if not (self.in_bounds(start) and self.in_bounds(goal)):
+            return False
+        if start == goal:
+            return True
+        self._label()
+        return not self._regions_touching(self._index(*start)).isdisjoint(self._regions_touching(self._index(*goal)))
+
+    def reachable_levels(self, start: Coord3) -> Set[int]:
+        # z-levels with at least one walkable tile reachable from `start`.
+        if not self.in_bounds(start):
+            return set()
+        self._label()
+        regions = self._regions_touching(self._index(*start))
+        return {z for z, level in enumerate(self._level_sets) if not regions.isdisjoint(level)}
+
+    def region(self, pos: Coord3) -> int:
+        # Region id of a walkable tile, -1 for blocked or off-grid tiles.
+        if not self.in_bounds(pos):
+            return -1
+        self._label()
+        return self._region[self._index(*pos)]
+
+    def _regions_touching(self, i: int) -> FrozenSet[int]:
+        # A blocked tile is entered from (or left into) whichever regions surround it.
+        region = self._region[i]
+        if region >= 0:
+            return frozenset((region,))
+        touching = self._touching.get(i)
+        if touching is None:
+            touching = self._touching[i] = frozenset(self._region[j] for j in self._adjacency()[i] if self._region[j] >= 0)
+        return touching
+
+    def _label(self) -> None:
+        if self._labels_version == self.version:
+            return
+        adjacent = self._adjacency()
+        walkable = self.walkable
+        plane = self.width * self.height
+        labels = array("i", [-1]) * len(walkable)
+        count = 0
+        level_of: List[int] = []
+        for seed, open_tile in enumerate(walkable):
+            if not open_tile or labels[seed] >= 0:
+                continue
+            z = seed // plane
+            level_of.append(z)
+            labels[seed] = count
+            queue = deque([seed])
+            while queue:
+                i = queue.popleft()
+                for j in adjacent[i]:
+                    if labels[j] < 0 and walkable[j] and j // plane == z:
+                        labels[j] = count
+                        queue.append(j)
+            count += 1
+
+        parent = list(range(count))
+
+        def find(c: int) -> int:
+            while parent[c] != c:
+                parent[c] = parent[parent[c]]
+                c = parent[c]
+            return c
+
+        for x, y, z in self.stairs:
+            i = self._index(x, y, z)
+            lower, upper = labels[i], labels[i + plane]
+            if lower >= 0 and upper >= 0:
+                parent[find(lower)] = find(upper)
+        roots: Dict[int, int] = {}
+        self.level_regions = [roots.setdefault(find(c), len(roots)) for c in range(count)]
+        self.level_labels = labels
+        self._region = array("i", (self.level_regions[c] if c >= 0 else -1 for c in labels))
+        self._touching = {}
+        level_sets: List[Set[int]] = [set() for _ in range(self.depth)]
+        for c, z in enumerate(level_of):
+            level_sets[z].add(self.level_regions[c])
+        self._level_sets = [frozenset(level) for level in level_sets]
+        self._labels_version = self.version
+
+    def field(self, goal: Coord3) -> Optional[FlowField]:
+        # The goal's flow field once the goal is hot, rebuilt if the grid changed since.
+        field = self._fields.get(goal)
+        if field is None:
+            if self._demand.get(goal, 0) < HOT_ROUTES or not self.in_bounds(goal):
+                return None
+        elif field.version == self.version:
+            self._fields.move_to_end(goal)
+            return field
+        field = self._fields[goal] = FlowField(goal, self.version, self._flow(goal))
+        self._fields.move_to_end(goal)
+        self.fields_built += 1
+        while len(self._fields) > self.field_budget:
+            self._fields.popitem(last=False)
+        return field
+
+    def _adjacency(self) -> List[Tuple[int, ...]]:
+        # Neighbour tile indexes of every tile (plane moves, then stairs); changes only with stairs.
+        if self._adjacent is None:
+            width, height, depth = self.width, self.height, self.depth
+            plane = width * height
+            up = self.up
+            adjacent: List[Tuple[int, ...]] = []
+            for z in range(depth):
+                for y in range(height):
+                    for x in range(width):
+                        i = len(adjacent)
+                        tiles = [i + dy * width + dx for dx, dy in PLANE_STEPS if 0 <= x + dx < width and 0 <= y + dy < height]
+                        if up[i] and z + 1 < depth:
+                            tiles.append(i + plane)
+                        if z > 0 and up[i - plane]:
+                            tiles.append(i - plane)
+                        adjacent.append(tuple(tiles))
+            self._adjacent = adjacent
+        return self._adjacent
+
+    def _flow(self, goal: Coord3) -> "array[int]":
+        adjacent = self._adjacency()
+        walkable, width = self.walkable, self.width
+        gx, gy, gz = goal
+        target = self._index(*goal)
+        dist = array("i", [-1]) * len(walkable)
+        dist[target] = 0
+        queue = deque([target])
+        while queue:
+            i = queue.popleft()
+            if i != target and not walkable[i]:
+                continue  # a walker may start on a blocked tile but never passes through one
+            d = dist[i] + 1
+            for j in adjacent[i]:
+                if dist[j] < 0:
+                    dist[j] = d
+                    queue.append(j)
+
+        step = array("i", [-1]) * len(walkable)
+        i = 0
+        for z in range(self.depth):
+            for y in range(self.height):
+                dy = 0 if gy == y else (1 if gy > y else -1)
+                for x in range(width):
+                    d = dist[i] - 1
+                    if d >= 0:
+                        if z == gz:
+                            j = i + dy * width + (0 if gx == x else (1 if gx > x else -1))
+                            if dist[j] == d and (walkable[j] or j == target):
+                                step[i] = j
+                                i += 1
+                                continue
+                        for j in adjacent[i]:
+                            if dist[j] == d and (walkable[j] or j == target):
+                                step[i] = j
+                                break
+                    i += 1
+        return step
+
+    def _line(self, start: Coord3, goal: Coord3) -> Optional[Route]:
+        x, y, z = start
+        tx, ty, tz = goal
+        if z != tz:
+            return None
+        tiles: List[Coord3] = [start]
+        while (x, y) != (tx, ty):
+            x += 0 if tx == x else (1 if tx > x else -1)
+            y += 0 if ty == y else (1 if ty > y else -1)
+            if (x, y) != (tx, ty) and not self.walkable[self._index(x, y, z)]:
+                return None
+            tiles.append((x, y, z))
+        return tuple(tiles)
+
+    def _search(self, start: Coord3, goal: Coord3) -> Optional[Route]:
+        width, height, depth = self.width, self.height, self.depth
+        plane = width * height
+        walkable, up = self.walkable, self.up
+        gx, gy, gz = goal
+        source, target = self._index(*start), self._index(*goal)
+
+        def estimate(x: int, y: int, z: int) -> int:
+            return max(abs(x - gx), abs(y - gy)) + abs(z - gz)
+
+        cost: Dict[int, int] = {source: 0}
+        came: Dict[int, int] = {}
+        h = estimate(*start)
+        heap: List[Tuple[int, int, int]] = [(h, h, source)]
+        while heap:
+            f, h, i = heappop(heap)
+            c = cost[i]
+            if c + h != f:
+                continue
+            if i == target:
+                tiles = [i]
+                while i != source:
+                    i = came[i]
+                    tiles.append(i)
+                return tuple(self._coord(t) for t in reversed(tiles))
+            z, rest = divmod(i, plane)
+            y, x = divmod(rest, width)
+            moves: List[Tuple[int, int, int, int]] = []
+            for dx, dy in PLANE_STEPS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    moves.append((i + dy * width + dx, nx, ny, z))
+            if up[i] and z + 1 < depth:
+                moves.append((i + plane, x, y, z + 1))
+            if z > 0 and up[i - plane]:
+                moves.append((i - plane, x, y, z - 1))
+            for j, nx, ny, nz in moves:
+                if not walkable[j] and j != target:
+                    continue
+                if c + 1 < cost.get(j, c + 2):
+                    cost[j] = c + 1
+                    came[j] = i
+                    nh = estimate(nx, ny, nz)
+                    heappush(heap, (c + 1 + nh, nh, j))
+        return None
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from fortress.models import Watched
+
+
+_entity_id = attrgetter("id")
+
+
+class EntityList(list):
+    """A list of id-bearing entities that keeps an id -> entity map in step with its contents.
+
+    Listeners (secondary indexes) receive `entity_added`, `entity_removed`, `entity_changed`
+    for watched field writes, and `reset` when the list is swapped out wholesale.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        super().__init__(iterable)
+        self.by_id: Dict[int, Any] = {}
+        self.listeners: List[Any] = []
+        for entity in self:
+            self._added(entity)
+
+    def get(self, entity_id: Optional[int]) -> Optional[Any]:
+        if entity_id is None:
+            return None
+        return self.by_id.get(entity_id)
+
+    def attach(self, listener: Any) -> None:
+        self.listeners.append(listener)
+        listener.reset(self)
+
+    def take_listeners(self, previous: "EntityList") -> None:
+        self.listeners, previous.listeners = previous.listeners, []
+        for listener in self.listeners:
+            listener.reset(self)
+
+    def _added(self, entity: Any) -> None:
+        self.by_id[entity.id] = entity
+        if isinstance(entity, Watched):
+            object.__setattr__(entity, "_watcher", self._changed)
+        for listener in self.listeners:
+            listener.entity_added(entity)
+
+    def _removed(self, entity: Any) -> None:
+        if self.by_id.get(entity.id) is entity:
+            del self.by_id[entity.id]
+        if isinstance(entity, Watched) and entity._watcher == self._changed:
+            object.__setattr__(entity, "_watcher", None)
+        for listener in self.listeners:
+            listener.entity_removed(entity)
+
+    def _changed(self, entity: Any, name: str, old: Any) -> None:
+        for listener in self.listeners:
+            listener.entity_changed(entity, name, old)
+
+    def _position(self, entity: Any) -> int:
+        # Entities are appended in id order, so a bisect nearly always lands on the right slot.
+        pos = bisect_left(self, entity.id, key=_entity_id)
+        if pos < len(self) and self[pos] is entity:
+            return pos
+        for pos, other in enumerate(self):
+            if other is entity:
+                return pos
+        raise ValueError("entity not in list")
+
+    def append(self, entity: Any) -> None:
+        super().append(entity)
+        self._added(entity)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        for entity in list(iterable):
+            self.append(entity)
+
+    def __iadd__(self, iterable: Iterable[Any]) -> "EntityList":
+        self.extend(iterable)
+        return self
+
+    def insert(self, index: int, entity: Any) -> None:
+        super().insert(index, entity)
+        self._added(entity)
+
+    def remove(self, entity: Any) -> None:
+        super().__delitem__(self._position(entity))
+        self._removed(entity)
+
+    def pop(self, index: int = -1) -> Any:
+        entity = super().pop(index)
+        self._removed(entity)
+        return entity
+
+    def clear(self) -> None:
+        for entity in list(self):
+            self._removed(entity)
+        super().clear()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            old = self[index]
+            new = list(value)
+        else:
+            old = [self[index]]
+            new = [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        for entity in old:
+            self._removed(entity)
+        for entity in new:
+            self._added(entity)
+
+    def __delitem__(self, index: Any) -> None:
+        old = self[index]
+        super().__delitem__(index)
+        for entity in old if isinstance(index, slice) else [old]:
+            self._removed(entity)
+
+    def discard_ids(self, ids: Iterable[int]) -> List[Any]:
+        doomed = {i for i in ids if i in self.by_id}
+        if not doomed:
+            return []
+        if len(doomed) <= 8:
+            # A handful of removals (consume, small spoilage batches) bisect instead of rebuilding.
+            removed = sorted((self.by_id[i] for i in doomed), key=_entity_id)
+            for entity in removed:
+                self.remove(entity)
+            return removed
+        kept: List[Any] = []
+        removed: List[Any] = []
+        for entity in self:
+            (removed if entity.id in doomed else kept).append(entity)
+        super().__setitem__(slice(None), kept)
+        for entity in removed:
+            self._removed(entity)
+        return removed
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from fortress.models import Coord3, Item, Zone
+
+
+CellKey = Tuple[int, int, int]
+
+
+class SpatialGrid:
+    """Uniform-grid spatial hash over entities with integer x/y/z.
+
+    Attached as a listener to an EntityList; entities are re-bucketed when their x/y/z
+    change. Query results are returned in id order, which matches list order.
+    """
+
+    def __init__(self, cell_size: int = 8) -> None:
+        self.cell_size = cell_size
+        self.reset(())
+
+    def reset(self, entities: Iterable[Any]) -> None:
+        self._cells: Dict[CellKey, Dict[int, Any]] = {}
+        self._where: Dict[int, CellKey] = {}
+        for entity in entities:
+            self.entity_added(entity)
+
+    def _key(self, x: int, y: int, z: int) -> CellKey:
+        return (x // self.cell_size, y // self.cell_size, z)
+
+    def entity_added(self, entity: Any) -> None:
+        key = self._key(entity.x, entity.y, entity.z)
+        self._cells.setdefault(key, {})[entity.id] = entity
+        self._where[entity.id] = key
+
+    def entity_removed(self, entity: Any) -> None:
+        key = self._where.pop(entity.id, None)
+        if key is None:
+            return
+        cell = self._cells.get(key)
+        if cell is not None:
+            cell.pop(entity.id, None)
+            if not cell:
+                del self._cells[key]
+
+    def entity_changed(self, entity: Any, name: str, old: object) -> None:
+        if name not in ("x", "y", "z"):
+            return
+        key = self._key(entity.x, entity.y, entity.z)
+        if self._where.get(entity.id) != key:
+            self.entity_removed(entity)
+            self._cells.setdefault(key, {})[entity.id] = entity
+            self._where[entity.id] = key
+
+    def at(self, x: int, y: int, z: int) -> List[Any]:
+        cell = self._cells.get(self._key(x, y, z))
+        if not cell:
+            return []
+        return sorted((e for e in cell.values() if e.x == x and e.y == y and e.z == z), key=_by_id)
+
+    def in_rect(self, x: int, y: int, z: int, w: int, h: int) -> List[Any]:
+        cs = self.cell_size
+        x2, y2 = x + w - 1, y + h - 1
+        found: List[Any] = []
+        for cy in range(y // cs, y2 // cs + 1):
+            for cx in range(x // cs, x2 // cs + 1):
+                cell = self._cells.get((cx, cy, z))
+                if not cell:
+                    continue
+                for e in cell.values():
+                    if x <= e.x <= x2 and y <= e.y <= y2 and e.z == z:
+                        found.append(e)
+        found.sort(key=_by_id)
+        return found
+
+    def in_radius(self, x: int, y: int, z: int, radius: int) -> List[Any]:
+        # Chebyshev radius: the square of side 2r+1 centred on (x, y).
+        return self.in_rect(x - radius, y - radius, z, 2 * radius + 1, 2 * radius + 1)
+
+    def on_level(self, z: int) -> List[Any]:
+        found = [e for (_, _, cz), cell in self._cells.items() if cz == z for e in cell.values()]
+        found.sort(key=_by_id)
+        return found
+
+
+class RectCoverage:
+    """Tile coverage for rectangular entities (rooms), rebuilt whenever the list changes.
+
+    `version` is bumped whenever the covered tile set changes so derived masks can be cached.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._tiles: Dict[Coord3, int] = {}
+
+    def reset(self, rects: Iterable[Any]) -> None:
+        tiles: Dict[Coord3, int] = {}
+        for rect in rects:
+            for tile in self._tiles_of(rect):
+                tiles[tile] = tiles.get(tile, 0) + 1
+        # Rooms are rebuilt wholesale on refresh; only a different footprint is a change.
+        if tiles.keys() != self._tiles.keys():
+            self.version += 1
+        self._tiles = tiles
+
+    def covers(self, pos: Coord3) -> bool:
+        return pos in self._tiles
+
+    def tiles(self) -> Iterable[Coord3]:
+        return self._tiles.keys()
+
+    def _tiles_of(self, rect: Any) -> Iterable[Coord3]:
+        return ((xx, yy, rect.z) for yy in range(rect.y, rect.y + rect.h) for xx in range(rect.x, rect.x + rect.w))
+
+    def entity_added(self, rect: Any) -> None:
+        self.version += 1
+        for tile in self._tiles_of(rect):
+            self._tiles[tile] = self._tiles.get(tile, 0) + 1
+
+    def entity_removed(self, rect: Any) -> None:
+        self.version += 1
+        for tile in self._tiles_of(rect):
+            count = self._tiles.get(tile, 0) - 1
+            if count > 0:
+                self._tiles[tile] = count
+            else:
+                self._tiles.pop(tile, None)
+
+    def entity_changed(self, rect: Any, name: str, old: object) -> None:
+        return
+
+
+def _by_id(entity: Any) -> int:
+    return entity.id
+
+
+ROOM_ZONE_KINDS = frozenset({"dormitory", "recreation"})
+
+
+class RoomZoneTracker:
+    """Dirty flags for room-bearing zones (dormitory, recreation).
+
+    Attached to `Game.zones`, `Game.items` and `Game.dwarves`. An item write that can change
+    a room (position, kind, carried state, value, quality) dirties the zones covering its old
+    and new tile; zone or dwarf list changes force a full rebuild. `zone_rooms` caches the
+    room specs derived from each zone between rebuilds.
+    """
+
+    ITEM_FIELDS = frozenset({"x", "y", "z", "kind", "carried_by", "value", "quality"})
+
+    def __init__(self) -> None:
+        self.full = True
+        self.dirty: Set[int] = set()
+        self.zone_rooms: Dict[int, List[Tuple[Any, ...]]] = {}
+        self._tiles: Dict[Coord3, List[int]] = {}
+
+    def rebuild(self, zones: Iterable[Any]) -> None:
+        self._tiles = {}
+        self.zone_rooms = {}
+        self.dirty = set()
+        for zone in zones:
+            if zone.kind not in ROOM_ZONE_KINDS:
+                continue
+            self.dirty.add(zone.id)
+            for yy in range(zone.y, zone.y + zone.h):
+                for xx in range(zone.x, zone.x + zone.w):
+                    self._tiles.setdefault((xx, yy, zone.z), []).append(zone.id)
+        self.full = False
+
+    def needs_refresh(self) -> bool:
+        return self.full or bool(self.dirty)
+
+    def _touch(self, pos: Coord3) -> None:
+        zone_ids = self._tiles.get(pos)
+        if zone_ids:
+            self.dirty.update(zone_ids)
+
+    def reset(self, entities: Iterable[Any]) -> None:
+        self.full = True
+
+    def entity_added(self, entity: Any) -> None:
+        if isinstance(entity, Item):
+            self._touch((entity.x, entity.y, entity.z))
+        else:
+            self.full = True
+
+    def entity_removed(self, entity: Any) -> None:
+        self.entity_added(entity)
+
+    def entity_changed(self, entity: Any, name: str, old: object) -> None:
+        if isinstance(entity, Item):
+            if name not in self.ITEM_FIELDS:
+                return
+            self._touch((entity.x, entity.y, entity.z))
+            if name in ("x", "y", "z"):
+                self._touch(
+                    (
+                        old if name == "x" else entity.x,
+                        old if name == "y" else entity.y,
+                        old if name == "z" else entity.z,
+                    )
+                )
+        elif isinstance(entity, Zone):
+            self.full = True
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from fortress.models import Item, weathered_perishability
+
+
+WEATHERS: Tuple[Tuple[bool, bool], ...] = ((False, False), (False, True), (True, False), (True, True))
+RESCHEDULE_FIELDS = frozenset({"kind", "x", "y", "z", "perishability", "carried_by", "container_id"})
+
+
+def weather_index(wet: bool, hot: bool) -> int:
+    return (2 if wet else 0) + (1 if hot else 0)
+
+
+class SpoilageSchedule:
+    """Expiry schedule for the scalar spoilage pass.
+
+    Ages are lazy: an attached item stores the aging tick it was "born" on, and `Item.age`
+    reads `clock - born` (see `ColumnBacked`), so advancing the clock ages every item at once.
+    Each loose item that can spoil where it lies is keyed by the aging tick at which
+    `age > effective perishability` under each of the four weather states (wet x hot), in one
+    min-heap per state. Each tick pops only the current state's heap into its expired set.
+
+    Items whose position, containment, kind or perishability change (or whose age is written)
+    are re-keyed on the next tick; a change in room coverage re-keys everything. Carried items
+    follow their carrier, so the game examines them directly every tick.
+    """
+
+    BACKED = ("age",)
+
+    def __init__(self) -> None:
+        self.clock = 0
+        self._born: Dict[int, int] = {}
+        self._items: Dict[int, Item] = {}
+        self._stamp: Dict[int, int] = {}
+        self._pending: Set[int] = set()
+        self._heaps: List[List[Tuple[int, int, int]]] = [[] for _ in WEATHERS]
+        self._expired: List[Dict[int, Item]] = [{} for _ in WEATHERS]
+        self._cover_version = -1
+        self._next_stamp = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def reset(self, items: Iterable[Item]) -> None:
+        for item in list(self._items.values()):
+            self._detach(item)
+        self._born.clear()
+        self._items.clear()
+        self._stamp.clear()
+        self._pending.clear()
+        self._heaps = [[] for _ in WEATHERS]
+        self._expired = [{} for _ in WEATHERS]
+        for item in items:
+            self.entity_added(item)
+
+    def get(self, item: Item, name: str) -> int:
+        return self.clock - self._born[item.id]
+
+    def set(self, item: Item, name: str, value: int) -> None:
+        self._born[item.id] = self.clock - value
+        self._pending.add(item.id)
+
+    def _detach(self, item: Item) -> None:
+        if item._columns is not self:
+            return
+        age = self.get(item, "age")
+        object.__setattr__(item, "_columns", None)
+        object.__setattr__(item, "age", age)
+
+    def entity_added(self, item: Item) -> None:
+        if item.id in self._items:
+            return
+        age = item.age
+        self._items[item.id] = item
+        self._born[item.id] = self.clock - age
+        self._pending.add(item.id)
+        object.__setattr__(item, "_columns", self)
+
+    def entity_removed(self, item: Item) -> None:
+        if item.id not in self._items:
+            return
+        self._detach(item)
+        self._unschedule(item.id)
+        del self._items[item.id]
+        del self._born[item.id]
+        self._pending.discard(item.id)
+
+    def entity_changed(self, item: Item, name: str, old: object) -> None:
+        if name not in RESCHEDULE_FIELDS or item.id not in self._items:
+            return
+        if item.carried_by is not None and name in ("x", "y", "z"):
+            return
+        self._pending.add(item.id)
+
+    def _unschedule(self, item_id: int) -> None:
+        # Heap entries are dropped lazily once the stamp no longer matches.
+        self._stamp.pop(item_id, None)
+        for expired in self._expired:
+            expired.pop(item_id, None)
+
+    def _schedule(self, item: Item, base: int) -> None:
+        self._unschedule(item.id)
+        if base <= 0 or item.carried_by is not None:
+            return
+        self._next_stamp += 1
+        stamp = self._next_stamp
+        self._stamp[item.id] = stamp
+        born = self._born[item.id]
+        for index, (wet, hot) in enumerate(WEATHERS):
+            due = born + weathered_perishability(base, wet, hot) + 1
+            if due <= self.clock:
+                self._expired[index][item.id] = item
+            else:
+                heap = self._heaps[index]
+                heappush(heap, (due, item.id, stamp))
+                if len(heap) > 2 * len(self._stamp) + 64:
+                    self._heaps[index] = self._rebuilt_heap(index)
+
+    def _rebuilt_heap(self, index: int) -> List[Tuple[int, int, int]]:
+        return sorted(e for e in self._heaps[index] if self._stamp.get(e[1]) == e[2])
+
+    def advance(self, base_perishability: Callable[[Item], int], wet: bool, hot: bool, cover_version: int) -> List[Item]:
+        # One aging tick: returns the loose items past their effective perishability, in id order.
+        self.clock += 1
+        if cover_version != self._cover_version:
+            self._cover_version = cover_version
+            self._pending.update(self._items)
+        for item_id in self._pending:
+            item = self._items[item_id]
+            self._schedule(item, base_perishability(item))
+        self._pending.clear()
+
+        index = weather_index(wet, hot)
+        heap = self._heaps[index]
+        expired = self._expired[index]
+        while heap and heap[0][0] <= self.clock:
+            _, item_id, stamp = heappop(heap)
+            if self._stamp.get(item_id) == stamp:
+                expired[item_id] = self._items[item_id]
+        return sorted(expired.values(), key=lambda i: i.id)
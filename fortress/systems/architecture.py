@@ -1,58 +1,28 @@
 from __future__ import annotations
 
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 
-from fortress.models import Room
+from fortress.models import Room, Zone
 
 
 class ArchitectureSystemsMixin:
     def _refresh_rooms_and_assignments(self) -> None:
+        tracker = self.room_tracker
+        if not tracker.needs_refresh():
+            return
+        if tracker.full:
+            tracker.rebuild(self.zones)
+        for zone_id in tracker.dirty:
+            zone = self.zones.get(zone_id)
+            if zone is not None:
+                tracker.zone_rooms[zone_id] = self._zone_room_specs(zone)
+        tracker.dirty.clear()
+
         rooms: List[Room] = []
         room_id = 1
-
         for zone in self.zones:
-            if zone.kind not in {"dormitory", "recreation"}:
-                continue
-
-            zone_items = [
-                i
-                for i in self.items
-                if i.z == zone.z and zone.x <= i.x < zone.x + zone.w and zone.y <= i.y < zone.y + zone.h and i.carried_by is None
-            ]
-            beds = [i for i in zone_items if i.kind == "bed"]
-
-            if zone.kind == "dormitory" and beds:
-                for bed in beds:
-                    value = self._room_value_from_items([i for i in zone_items if i.x == bed.x and i.y == bed.y], zone.kind)
-                    value += 10
-                    rooms.append(
-                        Room(
-                            id=room_id,
-                            kind="bedroom",
-                            x=bed.x,
-                            y=bed.y,
-                            z=zone.z,
-                            w=1,
-                            h=1,
-                            value=value,
-                            bed_item_id=bed.id,
-                        )
-                    )
-                    room_id += 1
-            else:
-                value = self._room_value_from_items(zone_items, zone.kind)
-                rooms.append(
-                    Room(
-                        id=room_id,
-                        kind="dormitory" if zone.kind == "dormitory" else "hall",
-                        x=zone.x,
-                        y=zone.y,
-                        z=zone.z,
-                        w=zone.w,
-                        h=zone.h,
-                        value=value,
-                    )
-                )
+            for kind, x, y, z, w, h, value, bed_item_id in tracker.zone_rooms.get(zone.id, ()):
+                rooms.append(Room(id=room_id, kind=kind, x=x, y=y, z=z, w=w, h=h, value=value, bed_item_id=bed_item_id))
                 room_id += 1
 
         prev_assignment = {d.id: d.assigned_room_id for d in self.dwarves if d.assigned_room_id is not None}
@@ -67,7 +37,7 @@ class ArchitectureSystemsMixin:
             previous = prev_assignment.get(dwarf.id)
             if previous is None:
                 continue
-            room = next((r for r in self.rooms if r.id == previous), None)
+            room = self.rooms.get(previous)
             if room and room.assigned_dwarf_id is None and room.kind == "bedroom":
                 room.assigned_dwarf_id = dwarf.id
                 dwarf.assigned_room_id = room.id
@@ -87,6 +57,21 @@ class ArchitectureSystemsMixin:
                 if dwarf.assigned_room_id is None:
                     dwarf.assigned_room_id = fallback.id
 
+    def _zone_room_specs(self, zone: Zone) -> List[Tuple]:
+        zone_items = [i for i in self.item_grid.in_rect(zone.x, zone.y, zone.z, zone.w, zone.h) if i.carried_by is None]
+        beds = [i for i in zone_items if i.kind == "bed"]
+
+        if zone.kind == "dormitory" and beds:
+            specs = []
+            for bed in beds:
+                value = self._room_value_from_items([i for i in zone_items if i.x == bed.x and i.y == bed.y], zone.kind)
+                value += 10
+                specs.append(("bedroom", bed.x, bed.y, zone.z, 1, 1, value, bed.id))
+            return specs
+        value = self._room_value_from_items(zone_items, zone.kind)
+        kind = "dormitory" if zone.kind == "dormitory" else "hall"
+        return [(kind, zone.x, zone.y, zone.z, zone.w, zone.h, value, None)]
+
     def _room_value_from_items(self, items: List[object], zone_kind: str) -> int:
         base = 12 if zone_kind == "dormitory" else 8
         value = base
@@ -103,9 +88,7 @@ class ArchitectureSystemsMixin:
         return value
 
     def _find_room(self, room_id: Optional[int]) -> Optional[Room]:
-        if room_id is None:
-            return None
-        return next((r for r in self.rooms if r.id == room_id), None)
+        return self.rooms.get(room_id)
 
     def _assigned_bed_for_dwarf(self, dwarf_id: int):
         dwarf = self._find_dwarf(dwarf_id)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from fortress.models import Flora, clamp
+from fortress.flora_species import FloraSpecies
+from fortress.flora_targets import CHOP_STAGES, FORAGE_STAGES
+from fortress.models import Dwarf, Flora, clamp
 
 
 class FloraSystemsMixin:
@@ -27,27 +30,27 @@ class FloraSystemsMixin:
             if (x, y, z) in used:
                 continue
             used.add((x, y, z))
-            if any(d.x == x and d.y == y and d.z == z for d in self.dwarves):
+            if self.dwarf_grid.at(x, y, z):
                 continue
             if any(w.x == x and w.y == y and w.z == z for w in self.workshops):
                 continue
             sp = self.rng.choice(species_pool)
-            stage = sp["stages"][0]
+            stage = sp.stages[0]
             if self.rng.random() < 0.35:
-                stage = sp["stages"][1]
-            self._spawn_flora(sp["id"], x, y, z, stage=stage)
+                stage = sp.stages[1]
+            self._spawn_flora(sp.id, x, y, z, stage=stage)
 
     def _spawn_flora(self, species_id: str, x: int, y: int, z: int, stage: Optional[str] = None) -> Optional[Flora]:
-        sp = self._flora_species().get(species_id)
+        sp = self.flora_table.get(species_id)
         if not sp:
             return None
-        stages = sp["stages"]
+        stages = sp.stages
         fl = Flora(
             id=self.next_flora_id,
             species_id=species_id,
-            common_name=sp["common_name"],
-            scientific_name=sp["scientific_name"],
-            kind=sp["kind"],
+            common_name=sp.common_name,
+            scientific_name=sp.scientific_name,
+            kind=sp.kind,
             x=x,
             y=y,
             z=z,
@@ -65,36 +68,31 @@ class FloraSystemsMixin:
     def _flora_species(self) -> Dict[str, Dict[str, object]]:
         return self.defs.get("flora_species", {})
 
-    def _flora_species_for_biome(self, biome: str) -> List[Dict[str, object]]:
-        out: List[Dict[str, object]] = []
-        for sp in self._flora_species().values():
-            if biome in sp.get("biomes", []):
-                out.append(sp)
-        return out
+    def _compile_flora_species(self) -> None:
+        self.flora_table.compile(self._flora_species())
+        self.flora_table.reset(self.floras)
+        self.flora_targets.reset(self.floras)
+        if self.flora_columns is not None:
+            self.flora_columns.reset(self.floras)
+
+    def _flora_species_for_biome(self, biome: str) -> List[FloraSpecies]:
+        return self.flora_table.for_biome(biome)
 
     def _is_forage_ready(self, flora: Flora) -> bool:
         if flora.dead or flora.kind != "plant":
             return False
-        return flora.stage in {"juvenile", "mature", "flowering", "seeded"}
+        return flora.stage in FORAGE_STAGES
 
     def _is_tree_choppable(self, flora: Flora) -> bool:
         if flora.dead or flora.kind != "tree":
             return False
-        return flora.stage in {"sapling", "young", "mature", "ancient"}
+        return flora.stage in CHOP_STAGES
 
-    def _find_forageable_flora(self, z: int) -> Optional[Flora]:
-        candidates = [fl for fl in self.floras if fl.z == z and fl.reserved_by is None and self._is_forage_ready(fl)]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda fl: (self._flora_stage_index(fl), fl.health, -fl.id), reverse=True)
-        return candidates[0]
+    def _find_forageable_flora(self, z: int, dwarf: Optional[Dwarf] = None) -> Optional[Flora]:
+        return self.flora_targets.best("forage", z, self._reachable_by(dwarf))
 
-    def _find_tree_for_chop(self, z: int) -> Optional[Flora]:
-        candidates = [fl for fl in self.floras if fl.z == z and fl.reserved_by is None and self._is_tree_choppable(fl)]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda fl: (self._flora_stage_index(fl), fl.health, -fl.id), reverse=True)
-        return candidates[0]
+    def _find_tree_for_chop(self, z: int, dwarf: Optional[Dwarf] = None) -> Optional[Flora]:
+        return self.flora_targets.best("chop", z, self._reachable_by(dwarf))
 
     def _flora_forage_yields(self, flora: Flora) -> List[Tuple[str, str, int, int]]:
         yields: List[Tuple[str, str, int, int]] = []
@@ -134,20 +132,10 @@ class FloraSystemsMixin:
         flora.spread_cooldown = max(flora.spread_cooldown, 45)
 
     def _flora_stage_index(self, flora: Flora) -> int:
-        stages = self._flora_species().get(flora.species_id, {}).get("stages", [])
-        try:
-            return stages.index(flora.stage)
-        except ValueError:
-            return 0
+        return flora.stage_index
 
     def _flora_density_at(self, x: int, y: int, z: int, radius: int) -> int:
-        count = 0
-        for fl in self.floras:
-            if fl.z != z or fl.dead:
-                continue
-            if abs(fl.x - x) <= radius and abs(fl.y - y) <= radius:
-                count += 1
-        return count
+        return sum(1 for fl in self.flora_grid.in_radius(x, y, z, radius) if not fl.dead)
 
     def _biome_modifiers(self) -> Tuple[float, float, float]:
         region = self._fortress_region()
@@ -163,37 +151,55 @@ class FloraSystemsMixin:
     def _flora_tick(self) -> None:
         if not self.floras:
             return
-        biome = self.world.biome
-        rain_mult, temp_mult, elev_mult = self._biome_modifiers()
         new_spawns: List[Tuple[str, int, int, int]] = []
         remove_ids: Set[int] = set()
+        if self.flora_columns is not None:
+            self._flora_tick_vectorized(new_spawns, remove_ids)
+        else:
+            self._flora_tick_scalar(new_spawns, remove_ids)
+
+        if new_spawns:
+            for sid, x, y, z in new_spawns:
+                if len(self.floras) >= self.max_flora:
+                    break
+                created = self._spawn_flora(sid, x, y, z)
+                if created and self.rng.random() < 0.12 and self._log_enabled("flora", 1):
+                    self._log("flora", "flora_sprouted", 1, flora=created.id, plant=created.common_name, scientific=created.scientific_name)
+
+        if remove_ids:
+            self.floras.discard_ids(remove_ids)
 
+    def _flora_tick_scalar(self, new_spawns: List[Tuple[str, int, int, int]], remove_ids: Set[int]) -> None:
+        biome = self.world.biome
+        rain_mult, temp_mult, elev_mult = self._biome_modifiers()
+        species = self.flora_table.species
+        season = self.world.season
+        weather = self.world.weather
+        temperature = self.world.temperature_c
         for fl in self.floras:
-            sp = self._flora_species().get(fl.species_id)
+            sp = species.get(fl.species_id)
             if not sp:
                 continue
             fl.age_ticks += 1
             if fl.spread_cooldown > 0:
                 fl.spread_cooldown -= 1
 
-            stage_idx = self._flora_stage_index(fl)
-            stage_count = len(sp["stages"])
+            stage_idx = fl.stage_index
+            stage_count = len(sp.stages)
 
-            season_mod = sp["season_mod"].get(self.world.season, 1.0)
-            weather_mod = sp["weather_mod"].get(self.world.weather, 1.0)
-            base_growth = float(sp["base_growth"])
-            growth_delta = base_growth * season_mod * weather_mod * rain_mult * temp_mult * elev_mult
+            season_mod = sp.season_mod.get(season, 1.0)
+            growth_delta = sp.growth_for(season, weather) * rain_mult * temp_mult * elev_mult
 
-            min_c = int(sp["temp_min"])
-            max_c = int(sp["temp_max"])
+            min_c = sp.temp_min
+            max_c = sp.temp_max
             stress = 0
-            if self.world.temperature_c < min_c:
-                stress += (min_c - self.world.temperature_c) // 2 + 2
-            if self.world.temperature_c > max_c:
-                stress += (self.world.temperature_c - max_c) // 2 + 2
-            if self.world.weather == "dry" and sp.get("dry_penalty", 0) > 0:
-                stress += int(sp["dry_penalty"])
-            if biome not in sp.get("biomes", []):
+            if temperature < min_c:
+                stress += (min_c - temperature) // 2 + 2
+            if temperature > max_c:
+                stress += (temperature - max_c) // 2 + 2
+            if weather == "dry" and sp.dry_penalty > 0:
+                stress += sp.dry_penalty
+            if biome not in sp.biomes:
                 stress += 4
 
             fl.stressed = stress > 0
@@ -213,69 +219,110 @@ class FloraSystemsMixin:
             if fl.health <= 0:
                 fl.dead = True
                 fl.stage = "dead"
-                self._log("flora", f"{fl.common_name} ({fl.scientific_name}) died off.", 1)
+                if self._log_enabled("flora", 1):
+                    self._log("flora", "flora_died", 1, flora=fl.id, plant=fl.common_name, scientific=fl.scientific_name)
                 continue
 
             growth_delta *= 0.55
             if stress >= 4:
                 growth_delta -= 0.7
             fl.growth_points += int(round(growth_delta))
-            threshold = int(sp["stage_threshold"])
+            threshold = sp.stage_threshold
 
             if fl.growth_points >= threshold and stage_idx < stage_count - 1:
                 fl.growth_points -= threshold
-                fl.stage = sp["stages"][stage_idx + 1]
-                if fl.stage in {"mature", "ancient", "flowering", "seeded"} and self.rng.random() < 0.12:
-                    self._log("flora", f"{fl.common_name} ({fl.scientific_name}) reached {fl.stage}.", 1)
+                fl.stage = sp.stages[stage_idx + 1]
+                if fl.stage in {"mature", "ancient", "flowering", "seeded"} and self.rng.random() < 0.12 and self._log_enabled("flora", 1):
+                    self._log("flora", "flora_stage", 1, flora=fl.id, plant=fl.common_name, scientific=fl.scientific_name, stage=fl.stage)
             elif fl.growth_points <= -threshold and stage_idx > 0:
                 fl.growth_points = 0
-                fl.stage = sp["stages"][stage_idx - 1]
-
-            if fl.kind == "plant" and self.world.season == "winter" and fl.stage in {"flowering", "seeded"}:
-                if self.rng.random() < 0.08:
-                    fl.stage = "withered"
-                    fl.growth_points = 0
-            if fl.kind == "plant" and fl.stage == "seeded" and self.world.season in {"autumn", "winter"}:
-                if self.rng.random() < 0.05:
-                    fl.stage = "withered"
-                    fl.growth_points = 0
-            if fl.kind == "plant" and self.world.season == "spring" and fl.stage == "withered" and fl.health >= 35:
-                if self.rng.random() < 0.18:
-                    fl.stage = "sprout"
-                    fl.growth_points = 0
-
-            spread_stage = int(sp["spread_stage_index"])
-            if (
-                self._flora_stage_index(fl) >= spread_stage
-                and fl.health >= 55
-                and not fl.dormant
-                and fl.spread_cooldown == 0
-                and len(self.floras) + len(new_spawns) < self.max_flora
-            ):
-                spread_chance = float(sp["spread_chance"])
-                spread_chance *= 0.22
-                if self.world.weather in {"rain", "storm"}:
-                    spread_chance *= 1.25
-                if self.world.weather == "dry":
-                    spread_chance *= 0.65
-                if self.rng.random() < spread_chance:
-                    radius = int(sp["spread_radius"])
-                    tx = clamp(fl.x + self.rng.randint(-radius, radius), 0, self.width - 1)
-                    ty = clamp(fl.y + self.rng.randint(-radius, radius), 0, self.height - 1)
-                    if self._flora_density_at(tx, ty, fl.z, 1) < 4:
-                        new_spawns.append((fl.species_id, tx, ty, fl.z))
-                        fl.spread_cooldown = int(sp["spread_cooldown"])
+                fl.stage = sp.stages[stage_idx - 1]
+
+            self._flora_seasons_and_spread(fl, sp, season, weather, new_spawns, self._flora_density_at)
+
+    def _flora_tick_vectorized(self, new_spawns: List[Tuple[str, int, int, int]], remove_ids: Set[int]) -> None:
+        # Same rules and RNG stream as `_flora_tick_scalar`. The draw-free growth pass runs over
+        # arrays; the rules that draw (removal, stage log, seasons, spread) then run per plant
+        # for only the rows that can draw, in list order, so the draws happen in the same order.
+        columns = self.flora_columns
+        season = self.world.season
+        weather = self.world.weather
+        growth = columns.grow(season, weather, self.world.temperature_c, self.world.biome, self._biome_modifiers())
+        species = self.flora_table.by_num
+        died: Set[int] = set()
+        for row in growth.died:
+            fl = columns.entity_at(row)
+            fl.dead = True
+            fl.stage = "dead"
+            died.add(fl.id)
+            if self._log_enabled("flora", 1):
+                self._log("flora", "flora_died", 1, flora=fl.id, plant=fl.common_name, scientific=fl.scientific_name)
+        for row, index in growth.staged:
+            fl = columns.entity_at(row)
+            fl.stage = species[columns.species[row]].stages[index]
+        self.flora_targets.touch_ids(growth.health_changed)
+
+        def density(x: int, y: int, z: int, radius: int, current: int) -> int:
+            # The scalar pass sees plants after `current` in their pre-tick state, still alive.
+            return sum(
+                1
+                for fl in self.flora_grid.in_radius(x, y, z, radius)
+                if not fl.dead or (fl.id in died and fl.id > current)
+            )
 
-        if new_spawns:
-            for sid, x, y, z in new_spawns:
-                if len(self.floras) >= self.max_flora:
-                    break
-                created = self._spawn_flora(sid, x, y, z)
-                if created and self.rng.random() < 0.12:
-                    self._log("flora", f"New {created.common_name} ({created.scientific_name}) sprouted.", 1)
+        for row in columns.draw_rows(growth, season):
+            fl = columns.entity_at(row)
+            if growth.was_dead[row]:
+                if self.rng.random() < 0.35:
+                    remove_ids.add(fl.id)
+                continue
+            if growth.notable[row] and self.rng.random() < 0.12 and self._log_enabled("flora", 1):
+                self._log("flora", "flora_stage", 1, flora=fl.id, plant=fl.common_name, scientific=fl.scientific_name, stage=fl.stage)
+            sp = species[columns.species[row]]
+            self._flora_seasons_and_spread(fl, sp, season, weather, new_spawns, partial(density, current=fl.id))
+
+    def _flora_seasons_and_spread(
+        self,
+        fl: Flora,
+        sp: FloraSpecies,
+        season: str,
+        weather: str,
+        new_spawns: List[Tuple[str, int, int, int]],
+        density: Callable[[int, int, int, int], int],
+    ) -> None:
+        if fl.kind == "plant" and season == "winter" and fl.stage in {"flowering", "seeded"}:
+            if self.rng.random() < 0.08:
+                fl.stage = "withered"
+                fl.growth_points = 0
+        if fl.kind == "plant" and fl.stage == "seeded" and season in {"autumn", "winter"}:
+            if self.rng.random() < 0.05:
+                fl.stage = "withered"
+                fl.growth_points = 0
+        if fl.kind == "plant" and season == "spring" and fl.stage == "withered" and fl.health >= 35:
+            if self.rng.random() < 0.18:
+                fl.stage = "sprout"
+                fl.growth_points = 0
 
-        if remove_ids:
-            self.floras = [fl for fl in self.floras if fl.id not in remove_ids]
+        if (
+            fl.stage_index >= sp.spread_stage_index
+            and fl.health >= 55
+            and not fl.dormant
+            and fl.spread_cooldown == 0
+            and len(self.floras) + len(new_spawns) < self.max_flora
+        ):
+            spread_chance = sp.spread_chance
+            spread_chance *= 0.22
+            if weather in {"rain", "storm"}:
+                spread_chance *= 1.25
+            if weather == "dry":
+                spread_chance *= 0.65
+            if self.rng.random() < spread_chance:
+                radius = sp.spread_radius
+                tx = clamp(fl.x + self.rng.randint(-radius, radius), 0, self.width - 1)
+                ty = clamp(fl.y + self.rng.randint(-radius, radius), 0, self.height - 1)
+                if density(tx, ty, fl.z, 1) < 4:
+                    new_spawns.append((fl.species_id, tx, ty, fl.z))
+                    fl.spread_cooldown = sp.spread_cooldown
 
     def _flora_glyph(self, flora: Flora) -> str:
         if flora.dead or flora.stage == "dead":
@@ -300,11 +347,7 @@ class FloraSystemsMixin:
         return plant_map.get(flora.stage, ",")
 
     def flora_at(self, x: int, y: int, z: int) -> str:
-        rows = [
-            fl
-            for fl in self.floras
-            if fl.x == x and fl.y == y and fl.z == z
-        ]
+        rows = self.flora_grid.at(x, y, z)
         if not rows:
             return "no flora at tile"
         lines = []
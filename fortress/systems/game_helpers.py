@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fortress.models import (
     CONTAINER_CAPACITY,
@@ -11,12 +11,14 @@ from fortress.models import (
     Flora,
     GeologyDeposit,
     Item,
+    ORGANIC_KINDS,
     Squad,
     Stockpile,
     Workshop,
     Zone,
     clamp,
     is_container_kind,
+    weathered_perishability,
 )
 
 
@@ -25,38 +27,29 @@ class GameHelpersMixin:
         return next((zz for zz in self.zones if zz.kind == kind and (z is None or zz.z == z)), None)
 
     def _find_workshop(self, workshop_id: Optional[int]) -> Optional[Workshop]:
-        if workshop_id is None:
-            return None
-        return next((w for w in self.workshops if w.id == workshop_id), None)
+        return self.workshops.get(workshop_id)
 
     def _find_stockpile(self, stockpile_id: Optional[int]) -> Optional[Stockpile]:
-        if stockpile_id is None:
-            return None
-        return next((s for s in self.stockpiles if s.id == stockpile_id), None)
+        return self.stockpiles.get(stockpile_id)
 
     def _find_dwarf(self, dwarf_id: int) -> Optional[Dwarf]:
-        return next((d for d in self.dwarves if d.id == dwarf_id), None)
+        return self.dwarves.get(dwarf_id)
 
     def _find_squad(self, squad_id: Optional[int]) -> Optional[Squad]:
-        if squad_id is None:
-            return None
-        return next((s for s in self.squads if s.id == squad_id), None)
+        return self.squads.get(squad_id)
 
     def _find_faction(self, faction_id: int) -> Optional[Faction]:
-        return next((f for f in self.factions if f.id == faction_id), None)
+        return self.factions.get(faction_id)
 
-    def _find_item(self, kind: str) -> Optional[Item]:
-        return next((i for i in self.items if i.kind == kind and i.reserved_by is None and i.carried_by is None), None)
+    def _find_item(self, kind: str, dwarf: Optional[Dwarf] = None) -> Optional[Item]:
+        # Lowest-id free item of `kind`; with `dwarf`, the lowest-id one that dwarf can reach.
+        return self.inventory.first_free(kind, self._reachable_by(dwarf))
 
     def _find_item_by_id(self, item_id: Optional[int]) -> Optional[Item]:
-        if item_id is None:
-            return None
-        return next((i for i in self.items if i.id == item_id), None)
+        return self.items.get(item_id)
 
     def _find_flora_by_id(self, flora_id: Optional[int]) -> Optional[Flora]:
-        if flora_id is None:
-            return None
-        return next((fl for fl in self.floras if fl.id == flora_id), None)
+        return self.floras.get(flora_id)
 
     def _find_geology_deposit_at(self, x: int, y: int, z: int) -> Optional[GeologyDeposit]:
         return next(
@@ -74,7 +67,7 @@ class GameHelpersMixin:
             if not dep.discovered:
                 dep.discovered = True
                 self.economy_stats["geology_discoveries"] = self.economy_stats.get("geology_discoveries", 0) + 1
-                self._log("geology", f"Discovered {dep.material} {dep.kind} deposit ({dep.rarity}) at ({x},{y},{z}).", 2)
+                self._log("geology", "deposit_discovered", 2, material=dep.material, deposit=dep.kind, rarity=dep.rarity, x=x, y=y, z=z)
             dep.remaining_yield = max(0, dep.remaining_yield - 1)
             if dep.kind == "ore":
                 ore_meta = self.defs.get("geology_ores", {}).get(dep.material, {})
@@ -91,7 +84,7 @@ class GameHelpersMixin:
             depth_key = f"geology_depth_{z}_extracted"
             self.economy_stats[depth_key] = self.economy_stats.get(depth_key, 0) + 1
             if dep.remaining_yield == 0:
-                self._log("geology", f"{dep.material} deposit at ({x},{y},{z}) is depleted.", 1)
+                self._log("geology", "deposit_depleted", 1, material=dep.material, x=x, y=y, z=z)
         else:
             self._spawn_item("stone", x, y, z, material="granite", value=1)
 
@@ -99,60 +92,69 @@ class GameHelpersMixin:
         if tile in self.geology_cavern_tiles and tile not in self.geology_breached_tiles:
             self.geology_breached_tiles.add(tile)
             self.economy_stats["caverns_breached"] = self.economy_stats.get("caverns_breached", 0) + 1
-            self._log("geology", f"Cavern breach at ({x},{y},{z})! Strange echoes from below...", 3)
+            self._log("geology", "cavern_breach", 3, x=x, y=y, z=z)
             for d in self.dwarves:
                 d.needs["safety"] = clamp(d.needs["safety"] + 12, 0, 100)
             if self.rng.random() < 0.35:
                 self.world.raid_active = True
                 self.world.threat_level = max(self.world.threat_level, 1)
-                self._log("geology", "Cavern wildlife has stirred and threatens the outpost.", 2)
+                self._log("geology", "cavern_wildlife", 2)
 
     def _find_farm_with_crops(self, z: Optional[int] = None) -> Optional[Zone]:
         return next((f for f in self.zones if f.kind == "farm" and f.crop_available > 0 and (z is None or f.z == z)), None)
 
+    def _add_workshop_order(self, ws: Workshop, recipe: str, amount: int) -> None:
+        ws.orders[recipe] = ws.orders.get(recipe, 0) + amount
+        if self.workshops.get(ws.id) is ws:
+            self.ready_workshops.refresh(ws)
+
     def _find_ordered_workshop_for_dwarf(self, dwarf: Dwarf) -> Tuple[Optional[Workshop], Optional[str]]:
-        candidates = [
-            w
-            for w in self.workshops
-            if w.built and w.z == dwarf.z and any(count > 0 for count in w.orders.values())
+        scored: List[Tuple[int, Workshop]] = [
+            (dwarf.labor_priority.get(labor, 3), ws)
+            for labor, ws in self.ready_workshops.at(dwarf.z)
+            if self._labor_allowed(dwarf, labor) and self._can_reach(dwarf, ws.pos)
         ]
-        if not candidates:
-            return None, None
-        scored: List[Tuple[int, Workshop]] = []
-        for ws in candidates:
-            labor = self._labor_for_workshop(ws.kind)
-            if not self._labor_allowed(dwarf, labor):
-                continue
-            scored.append((dwarf.labor_priority.get(labor, 3), ws))
         if not scored:
             return None, None
         scored.sort(key=lambda t: (t[0], -sum(t[1].orders.values())), reverse=True)
         ordered = [ws for _, ws in scored]
-        if ordered:
-            start = self.workshop_dispatch_cursor % len(ordered)
-            ordered = ordered[start:] + ordered[:start]
-            self.workshop_dispatch_cursor = (self.workshop_dispatch_cursor + 1) % max(1, len(self.workshops))
+        start = self.workshop_dispatch_cursor % len(ordered)
+        ordered = ordered[start:] + ordered[:start]
+        self.workshop_dispatch_cursor = (self.workshop_dispatch_cursor + 1) % max(1, len(self.workshops))
         for ws in ordered:
             recipe = next((r for r, c in ws.orders.items() if c > 0), None)
             if recipe:
-                ws.orders[recipe] -= 1
+                self._add_workshop_order(ws, recipe, -1)
                 return ws, recipe
         return None, None
 
-    def _find_haul_candidate(self) -> Tuple[Optional[Item], Optional[Stockpile], Optional[Item]]:
-        for item in self.items:
-            if item.reserved_by is not None or item.carried_by is not None:
-                continue
-            if item.stockpile_id is not None:
-                continue
-            if item.container_id is not None:
-                continue
-            stock, container = self._find_stockpile_for_item(item)
-            if stock:
-                return item, stock, container
-        return None, None, None
-
-    def _find_stockpile_for_item(self, item: Item) -> Tuple[Optional[Stockpile], Optional[Item]]:
+    def _find_haul_candidate(self, dwarf: Optional[Dwarf] = None) -> Tuple[Optional[Item], Optional[Stockpile], Optional[Item]]:
+        # With `dwarf`, only items and stockpiles that dwarf can reach are considered.
+        accept = self._reachable_by(dwarf)
+        levels = self.paths.reachable_levels(dwarf.pos) if dwarf is not None else None
+        found: Tuple[Optional[Item], Optional[Stockpile], Optional[Item]] = (None, None, None)
+        unplaced: List[Item] = []
+        for item in self.haul_queue.heads(accept, levels):
+            stock, container = self._find_stockpile_for_item(item, request_containers=False)
+            if stock and (dwarf is None or self._can_reach(dwarf, (stock.x, stock.y, stock.z))):
+                found = (item, stock, container)
+                break
+            unplaced.append(item)
+        if self._container_requests_due():
+            self._replay_container_requests(unplaced, found[0], accept)
+        return found
+
+    def _replay_container_requests(self, unplaced: List[Item], picked: Optional[Item], accept: Optional[Callable[[Item], bool]] = None) -> None:
+        # Issue the container orders a scan of every loose item up to `picked` would: each
+        # probe of a bucket requests the same orders, which saturate after two probes.
+        probes = [p for head in unplaced for p in self.haul_queue.lowest(head, 2, accept) if picked is None or p.id < picked.id]
+        probes.sort(key=lambda p: p.id)
+        if picked is not None:
+            probes.append(picked)
+        for probe in probes:
+            self._find_stockpile_for_item(probe)
+
+    def _find_stockpile_for_item(self, item: Item, request_containers: bool = True) -> Tuple[Optional[Stockpile], Optional[Item]]:
         if is_container_kind(item.kind):
             stock_targets = [
                 sp
@@ -177,7 +179,8 @@ class GameHelpersMixin:
                 if best is None or load < best[0]:
                     best = (load, sp, None)
                 continue
-            self._request_container_for_stockpile(sp, item.kind)
+            if request_containers:
+                self._request_container_for_stockpile(sp, item.kind)
         if best:
             return best[1], best[2]
         return None, None
@@ -214,7 +217,7 @@ class GameHelpersMixin:
         return False
 
     def _container_load(self, container: Item) -> int:
-        return sum(1 for i in self.items if i.container_id == container.id)
+        return len(self.inventory.contents_of(container.id))
 
     def _container_free_capacity(self, container: Item) -> int:
         cap = CONTAINER_CAPACITY.get(container.kind, 0)
@@ -222,11 +225,7 @@ class GameHelpersMixin:
 
     def _find_compatible_container(self, stockpile: Stockpile, item_kind: str) -> Optional[Item]:
         candidates: List[Item] = []
-        for item in self.items:
-            if item.stockpile_id != stockpile.id or item.container_id is not None:
-                continue
-            if not is_container_kind(item.kind):
-                continue
+        for item in self.inventory.containers_in(stockpile.id).values():
             if item.reserved_by is not None:
                 continue
             if not self._container_accepts_item(item.kind, item_kind, stockpile.kind):
@@ -239,8 +238,11 @@ class GameHelpersMixin:
         candidates.sort(key=lambda c: (self._container_load(c), c.id))
         return candidates[0]
 
+    def _container_requests_due(self) -> bool:
+        return self.tick_count % 20 == 0
+
     def _request_container_for_stockpile(self, stockpile: Stockpile, item_kind: str) -> None:
-        if self.tick_count % 20 != 0:
+        if not self._container_requests_due():
             return
         container_order = {
             "raw": ("carpenter", "barrel"),
@@ -256,56 +258,71 @@ class GameHelpersMixin:
         if not container_order:
             return
         ws_kind, recipe = container_order
-        ws = next((w for w in self.workshops if w.kind == ws_kind and w.built and w.z == stockpile.z), None)
+        ws = next((w for w in self.built_workshops.of_kind(ws_kind) if w.z == stockpile.z), None)
         if not ws:
             return
         if ws.orders.get(recipe, 0) >= 2:
             return
-        ws.orders[recipe] = ws.orders.get(recipe, 0) + 1
-        self._log("logistics", f"Queued {recipe} for stockpile #{stockpile.id} ({stockpile.kind}).", 1)
+        self._add_workshop_order(ws, recipe, 1)
+        self._log("logistics", "container_queued", 1, recipe=recipe, stockpile=stockpile.id, stockpile_kind=stockpile.kind)
 
     def _stockpile_loose_item_count(self, stockpile: Stockpile) -> int:
-        return sum(
-            1
-            for i in self.items
-            if i.stockpile_id == stockpile.id and i.container_id is None and not is_container_kind(i.kind)
-        )
+        return self.stockpile_occupancy.loose_count(stockpile.id)
 
     def _stockpile_used_slots(self, stockpile: Stockpile) -> int:
-        return sum(1 for i in self.items if i.stockpile_id == stockpile.id and i.container_id is None)
+        return self.stockpile_occupancy.used_slots(stockpile.id)
 
     def _stockpile_free_slots(self, stockpile: Stockpile) -> int:
         return stockpile.capacity - self._stockpile_used_slots(stockpile)
 
     def _choose_stockpile_drop_tile(self, stockpile: Stockpile) -> Coord3:
-        best = (stockpile.x, stockpile.y, stockpile.z)
-        best_load = 10**9
-        for yy in range(stockpile.y, stockpile.y + stockpile.h):
-            for xx in range(stockpile.x, stockpile.x + stockpile.w):
-                load = sum(
-                    1
-                    for i in self.items
-                    if i.stockpile_id == stockpile.id and i.container_id is None and i.x == xx and i.y == yy and i.z == stockpile.z
-                )
-                if load < best_load:
-                    best_load = load
-                    best = (xx, yy, stockpile.z)
-        return best
-
-    def _step_move_toward(self, dwarf: Dwarf, destination: Optional[Coord3]) -> None:
+        return self.stockpile_occupancy.drop_tile(stockpile)
+
+    def _can_reach(self, dwarf: Dwarf, destination: Optional[Coord3]) -> bool:
+        if destination is None:
+            return True
+        tx, ty, tz = destination
+        return self.paths.reachable(dwarf.pos, (tx, ty, tz))
+
+    def _reachable_by(self, dwarf: Optional[Dwarf]) -> Optional[Callable[[Any], bool]]:
+        # Filter passing items/flora on a tile `dwarf` can reach; None (no filter) without a dwarf.
+        if dwarf is None:
+            return None
+        return lambda e: self.paths.reachable(dwarf.pos, (e.x, e.y, e.z))
+
+    def _zone_tile_for(self, dwarf: Dwarf, kind: str, z: Optional[int] = None) -> Optional[Coord3]:
+        # A random tile of the first `kind` zone (on level `z`, if given), if `dwarf` can reach it.
+        zone = self._find_zone(kind, z)
+        if zone is None:
+            return None
+        tile = zone.random_tile(self.rng)
+        return tile if self._can_reach(dwarf, tile) else None
+
+    def _step_move_toward(self, dwarf: Dwarf, destination: Optional[Coord3]) -> bool:
+        # One step along the route to `destination`; False (and no move) when it cannot be reached.
         if destination is None:
             if self.rng.random() < 0.5:
                 nx = clamp(dwarf.x + self.rng.choice([-1, 0, 1]), 0, self.width - 1)
                 ny = clamp(dwarf.y + self.rng.choice([-1, 0, 1]), 0, self.height - 1)
-                dwarf.pos = (nx, ny, dwarf.z)
-            return
+                if self.paths.is_walkable((nx, ny, dwarf.z)):
+                    dwarf.pos = (nx, ny, dwarf.z)
+            return True
         tx, ty, tz = destination
-        if dwarf.z != tz:
-            dwarf.z += 1 if tz > dwarf.z else -1
-            return
-        dx = 0 if tx == dwarf.x else (1 if tx > dwarf.x else -1)
-        dy = 0 if ty == dwarf.y else (1 if ty > dwarf.y else -1)
-        dwarf.pos = (clamp(dwarf.x + dx, 0, self.width - 1), clamp(dwarf.y + dy, 0, self.height - 1), dwarf.z)
+        if dwarf.pos == (tx, ty, tz):
+            return True
+        if not self.paths.in_bounds((tx, ty, tz)):
+            # Off-grid goals are approached on the dwarf's own level as far as the grid allows.
+            dx = 0 if tx == dwarf.x else (1 if tx > dwarf.x else -1)
+            dy = 0 if ty == dwarf.y else (1 if ty > dwarf.y else -1)
+            nxt = (clamp(dwarf.x + dx, 0, self.width - 1), clamp(dwarf.y + dy, 0, self.height - 1), dwarf.z)
+            if self.paths.is_walkable(nxt):
+                dwarf.pos = nxt
+            return True
+        step = self.paths.next_step(dwarf.id, dwarf.pos, (tx, ty, tz))
+        if step is None:
+            return False
+        dwarf.pos = step
+        return True
 
     def _item_pos(self, item: Item) -> Coord3:
         if item.carried_by is not None:
@@ -342,29 +359,23 @@ class GameHelpersMixin:
 
     def _consume_item(self, item_id: int) -> None:
         remove_ids = {item_id}
-        contained = {i.id for i in self.items if i.container_id == item_id}
-        remove_ids |= contained
-        self.items = [i for i in self.items if i.id not in remove_ids]
+        remove_ids.update(self.inventory.contents_of(item_id))
+        self.items.discard_ids(remove_ids)
 
     def _sync_carried_items(self) -> None:
-        for i in self.items:
-            if i.carried_by is None:
-                continue
+        for i in list(self.inventory.carried.values()):
             d = self._find_dwarf(i.carried_by)
             if d:
                 i.x, i.y, i.z = d.x, d.y, d.z
 
-    def _log(self, kind: str, text: str, severity: int) -> None:
-        if kind == "flora":
+    def _log_enabled(self, kind: str, severity: int) -> bool:
+        # Hot paths check this before evaluating any event arguments.
+        return severity >= self.event_levels.get(kind, 0)
+
+    def _log(self, kind: str, template: str, severity: int, **data: Any) -> None:
+        if severity < self.event_levels.get(kind, 0):
             return
-        e = Event(tick=self.tick_count, kind=kind, text=text, severity=severity)
-        self.events.append(e)
-        if len(self.events) > 400:
-            self.events = self.events[-400:]
-        if severity >= 2:
-            self.alerts.append(f"t{self.tick_count} [{kind}] {text}")
-            if len(self.alerts) > 200:
-                self.alerts = self.alerts[-200:]
+        self.events.append(Event(tick=self.tick_count, kind=kind, template=template, severity=severity, data=data))
 
     def _validate_point(self, x: int, y: int, z: int) -> None:
         if not self._in_bounds(x, y, z):
@@ -380,38 +391,26 @@ class GameHelpersMixin:
         return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth
 
     def _effective_perishability(self, item: Item) -> int:
+        return weathered_perishability(self._base_perishability(item), *self._spoilage_weather())
+
+    def _spoilage_weather(self) -> Tuple[bool, bool]:
+        return self.world.weather in {"rain", "storm"}, self.world.temperature_c >= 24
+
+    def _base_perishability(self, item: Item) -> int:
+        # Perishability before weather; 0 when the item cannot spoil where it is.
         if item.container_id is not None:
             return 0
 
-        organic_kinds = {
-            "raw_food",
-            "cooked_food",
-            "alcohol",
-            "herb",
-            "berry",
-            "fiber",
-            "hide",
-            "leather",
-            "timber",
-            "wood",
-            "seed",
-            "flour",
-        }
-        is_organic = item.kind in organic_kinds
+        is_organic = item.kind in ORGANIC_KINDS
         if not is_organic and item.perishability <= 0:
             return 0
 
         x, y, z = self._item_pos(item)
-        sheltered = z > 0 or any(room.contains((x, y, z)) for room in self.rooms)
+        sheltered = z > 0 or self.room_cover.covers((x, y, z))
         if is_organic and sheltered:
             return 0
 
-        effective = item.perishability if item.perishability > 0 else 220
-        if self.world.weather in {"rain", "storm"}:
-            effective = int(effective * 0.78)
-        if self.world.temperature_c >= 24:
-            effective = int(effective * 0.85)
-        return max(1, effective)
+        return item.perishability if item.perishability > 0 else 220
 
     def _apply_nutrition_from_item(self, dwarf: Dwarf, item: Item) -> None:
         material = (item.material or "").lower()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Optional
 
+from fortress.job_board import BOARD_JOB_KINDS
 from fortress.models import Dwarf, Job, clamp
 from fortress.systems.jobs_execution import JobExecutionMixin
 
@@ -10,20 +11,20 @@ class JobSystemsMixin(JobExecutionMixin):
     def _assign_job(self, dwarf: Dwarf) -> Job:
         # Critical needs first.
         if dwarf.needs["hunger"] >= 75:
-            meal = self._find_item(kind="cooked_food")
+            meal = self._find_item(kind="cooked_food", dwarf=dwarf)
             if not meal and dwarf.needs["hunger"] >= 95:
-                meal = self._find_item(kind="raw_food")
+                meal = self._find_item(kind="raw_food", dwarf=dwarf)
             if not meal and dwarf.needs["hunger"] >= 90:
-                meal = self._find_item(kind="berry")
+                meal = self._find_item(kind="berry", dwarf=dwarf)
             if not meal and dwarf.needs["hunger"] >= 90:
-                meal = self._find_item(kind="herb")
+                meal = self._find_item(kind="herb", dwarf=dwarf)
             if not meal and dwarf.needs["hunger"] >= 95:
-                meal = self._find_item(kind="rare_plant")
+                meal = self._find_item(kind="rare_plant", dwarf=dwarf)
             if meal:
                 meal.reserved_by = dwarf.id
                 return self._new_job(kind="eat", labor="cook", item_id=meal.id, destination=self._item_pos(meal), phase="to_item")
             if dwarf.needs["hunger"] >= 90 and self._labor_allowed(dwarf, "harvest"):
-                forage_target = self._find_forageable_flora(dwarf.z)
+                forage_target = self._find_forageable_flora(dwarf.z, dwarf)
                 if forage_target:
                     forage_target.reserved_by = dwarf.id
                     return self._new_job(
@@ -42,7 +43,7 @@ class JobSystemsMixin(JobExecutionMixin):
                 )
 
         if dwarf.needs["alcohol"] >= 70 or dwarf.needs["thirst"] >= 78:
-            drink = self._find_item(kind="alcohol")
+            drink = self._find_item(kind="alcohol", dwarf=dwarf)
             if drink:
                 drink.reserved_by = dwarf.id
                 return self._new_job(kind="drink", labor="brew", item_id=drink.id, destination=self._item_pos(drink), phase="to_item")
@@ -51,33 +52,33 @@ class JobSystemsMixin(JobExecutionMixin):
 
         if dwarf.needs["sleep"] >= 82 and self._find_zone("dormitory"):
             bed = self._assigned_bed_for_dwarf(dwarf.id)
-            if bed and bed.reserved_by is None:
+            if bed and bed.reserved_by is None and self._can_reach(dwarf, self._item_pos(bed)):
                 bed.reserved_by = dwarf.id
                 return self._new_job(kind="sleep", labor="sleep", item_id=bed.id, destination=self._item_pos(bed), phase="to_bed", remaining=5)
-            bed = self._find_item(kind="bed")
+            bed = self._find_item(kind="bed", dwarf=dwarf)
             if bed and bed.reserved_by is None:
                 bed.reserved_by = dwarf.id
                 return self._new_job(kind="sleep", labor="sleep", item_id=bed.id, destination=self._item_pos(bed), phase="to_bed", remaining=5)
-            dorm = self._find_zone("dormitory")
-            if dorm:
-                return self._new_job(kind="sleep", labor="sleep", destination=dorm.random_tile(self.rng), phase="sleeping", remaining=5)
+            dorm_tile = self._zone_tile_for(dwarf, "dormitory")
+            if dorm_tile:
+                return self._new_job(kind="sleep", labor="sleep", destination=dorm_tile, phase="sleeping", remaining=5)
 
         # Stress relief before non-critical work to keep day-to-day cadence human.
         if dwarf.stress >= 70:
-            if dwarf.needs["entertainment"] >= 45 and self._find_zone("recreation", dwarf.z):
-                rec = self._find_zone("recreation", dwarf.z)
-                return self._new_job(kind="recreate", labor="recreate", destination=rec.random_tile(self.rng), remaining=3)
+            rec_tile = self._zone_tile_for(dwarf, "recreation", dwarf.z) if dwarf.needs["entertainment"] >= 45 else None
+            if rec_tile:
+                return self._new_job(kind="recreate", labor="recreate", destination=rec_tile, remaining=3)
             if dwarf.needs["social"] >= 45:
-                peer = next((p for p in self.dwarves if p.id != dwarf.id and p.z == dwarf.z and p.hp > 0), None)
+                peer = self._find_peer(dwarf)
                 if peer:
                     return self._new_job(kind="socialize", labor="social", target_id=peer.id, destination=peer.pos, remaining=2)
-            if dwarf.needs["worship"] >= 55 and self._find_zone("temple", dwarf.z):
-                temple = self._find_zone("temple", dwarf.z)
-                return self._new_job(kind="worship", labor="worship", destination=temple.random_tile(self.rng), remaining=3)
+            temple_tile = self._zone_tile_for(dwarf, "temple", dwarf.z) if dwarf.needs["worship"] >= 55 else None
+            if temple_tile:
+                return self._new_job(kind="worship", labor="worship", destination=temple_tile, remaining=3)
 
         # Keep baseline survival loops running even when players do long unattended runs.
         if self._available_food_items() <= 2:
-            forage_target = self._find_forageable_flora(dwarf.z) if self._labor_allowed(dwarf, "harvest") else None
+            forage_target = self._find_forageable_flora(dwarf.z, dwarf) if self._labor_allowed(dwarf, "harvest") else None
             if forage_target:
                 forage_target.reserved_by = dwarf.id
                 return self._new_job(
@@ -90,23 +91,27 @@ class JobSystemsMixin(JobExecutionMixin):
                 )
             if self._labor_allowed(dwarf, "harvest"):
                 farm = self._find_farm_with_crops(z=dwarf.z)
-                if farm:
+                farm_tile = farm.random_tile(self.rng) if farm else None
+                if farm and self._can_reach(dwarf, farm_tile):
                     farm.crop_available -= 1
                     return self._new_job(
                         kind="harvest",
                         labor="harvest",
                         target_id=farm.id,
-                        destination=farm.random_tile(self.rng),
+                        destination=farm_tile,
                         remaining=3,
                     )
 
         # Hospital / medical.
-        if dwarf.hp < 60 and self._find_zone("hospital") and self._labor_allowed(dwarf, "medical"):
-            return self._new_job(kind="recover", labor="medical", destination=self._find_zone("hospital").random_tile(self.rng), remaining=4)
+        if dwarf.hp < 60 and self._labor_allowed(dwarf, "medical"):
+            ward_tile = self._zone_tile_for(dwarf, "hospital")
+            if ward_tile:
+                return self._new_job(kind="recover", labor="medical", destination=ward_tile, remaining=4)
 
         # Combat response.
-        if self.world.raid_active and dwarf.squad_id and self._labor_allowed(dwarf, "combat"):
-            return self._new_job(kind="defend", labor="combat", destination=(self.width - 2, self.height // 2, dwarf.z), remaining=4)
+        post = (self.width - 2, self.height // 2, dwarf.z)
+        if self.world.raid_active and dwarf.squad_id and self._labor_allowed(dwarf, "combat") and self._can_reach(dwarf, post):
+            return self._new_job(kind="defend", labor="combat", destination=post, remaining=4)
 
         # Global queued jobs.
         build_job = self._pop_global_job_for_labor(dwarf, "build")
@@ -120,39 +125,27 @@ class JobSystemsMixin(JobExecutionMixin):
         ws, recipe = self._find_ordered_workshop_for_dwarf(dwarf)
         if ws and recipe:
             spec = self.defs["recipes"][ws.kind][recipe]
-            consumed: List[int] = []
-            for kind, qty in spec["inputs"].items():
-                for _ in range(qty):
-                    it = self._find_item(kind=kind)
-                    if not it:
-                        for cid in consumed:
-                            found = self._find_item_by_id(cid)
-                            if found:
-                                found.reserved_by = None
-                        ws.orders[recipe] += 1
-                        break
-                    it.reserved_by = dwarf.id
-                    consumed.append(it.id)
-                else:
-                    continue
-                break
+            inputs = self.inventory.reserve_free(spec["inputs"], dwarf.id, self._reachable_by(dwarf))
+            if inputs is None:
+                self._add_workshop_order(ws, recipe, 1)
             else:
-                primary_item = consumed[0] if consumed else None
+                primary = inputs[0] if inputs else None
                 return self._new_job(
                     kind="workshop_task",
                     labor=self._labor_for_workshop(ws.kind),
                     target_id=ws.id,
-                    item_id=primary_item,
+                    item_id=primary.id if primary else None,
                     recipe=recipe,
-                    destination=self._item_pos(self._find_item_by_id(primary_item)) if primary_item else ws.pos,
-                    phase="to_input" if primary_item else "to_workshop",
+                    destination=self._item_pos(primary) if primary else ws.pos,
+                    phase="to_input" if primary else "to_workshop",
                     remaining=spec.get("time", 4),
+                    reserved_ids=[i.id for i in inputs],
                 )
 
         # Farming and gathering.
         if self._labor_allowed(dwarf, "harvest"):
             if self._count_item_kind("timber") < 4 and dwarf.needs["hunger"] < 70 and dwarf.needs["thirst"] < 75 and self.rng.random() < 0.25:
-                tree_target = self._find_tree_for_chop(dwarf.z)
+                tree_target = self._find_tree_for_chop(dwarf.z, dwarf)
                 if tree_target:
                     tree_target.reserved_by = dwarf.id
                     return self._new_job(
@@ -164,7 +157,7 @@ class JobSystemsMixin(JobExecutionMixin):
                         remaining=4,
                     )
             if self._available_food_items() < 10 and self.rng.random() < 0.20:
-                forage_target = self._find_forageable_flora(dwarf.z)
+                forage_target = self._find_forageable_flora(dwarf.z, dwarf)
                 if forage_target:
                     forage_target.reserved_by = dwarf.id
                     return self._new_job(
@@ -176,7 +169,7 @@ class JobSystemsMixin(JobExecutionMixin):
                         remaining=3,
                     )
             if self._count_item_kind("timber") < 6 and self.rng.random() < 0.12:
-                tree_target = self._find_tree_for_chop(dwarf.z)
+                tree_target = self._find_tree_for_chop(dwarf.z, dwarf)
                 if tree_target:
                     tree_target.reserved_by = dwarf.id
                     return self._new_job(
@@ -188,13 +181,14 @@ class JobSystemsMixin(JobExecutionMixin):
                         remaining=4,
                     )
             farm = self._find_farm_with_crops(z=dwarf.z)
-            if farm:
+            farm_tile = farm.random_tile(self.rng) if farm else None
+            if farm and self._can_reach(dwarf, farm_tile):
                 farm.crop_available -= 1
-                return self._new_job(kind="harvest", labor="harvest", target_id=farm.id, destination=farm.random_tile(self.rng), remaining=3)
+                return self._new_job(kind="harvest", labor="harvest", target_id=farm.id, destination=farm_tile, remaining=3)
 
         # Hauling.
         if self._labor_allowed(dwarf, "haul"):
-            item, stock, container = self._find_haul_candidate()
+            item, stock, container = self._find_haul_candidate(dwarf)
             if item and stock:
                 item.reserved_by = dwarf.id
                 if container:
@@ -210,16 +204,16 @@ class JobSystemsMixin(JobExecutionMixin):
                 )
 
         # Recreation, social, worship.
-        if dwarf.needs["entertainment"] >= 60 and self._find_zone("recreation", dwarf.z):
-            rec = self._find_zone("recreation", dwarf.z)
-            return self._new_job(kind="recreate", labor="recreate", destination=rec.random_tile(self.rng), remaining=3)
+        rec_tile = self._zone_tile_for(dwarf, "recreation", dwarf.z) if dwarf.needs["entertainment"] >= 60 else None
+        if rec_tile:
+            return self._new_job(kind="recreate", labor="recreate", destination=rec_tile, remaining=3)
         if dwarf.needs["social"] >= 60:
-            peer = next((p for p in self.dwarves if p.id != dwarf.id and p.z == dwarf.z and p.hp > 0), None)
+            peer = self._find_peer(dwarf)
             if peer:
                 return self._new_job(kind="socialize", labor="social", target_id=peer.id, destination=peer.pos, remaining=2)
-        if dwarf.needs["worship"] >= 60 and self._find_zone("temple", dwarf.z):
-            temple = self._find_zone("temple", dwarf.z)
-            return self._new_job(kind="worship", labor="worship", destination=temple.random_tile(self.rng), remaining=3)
+        temple_tile = self._zone_tile_for(dwarf, "temple", dwarf.z) if dwarf.needs["worship"] >= 60 else None
+        if temple_tile:
+            return self._new_job(kind="worship", labor="worship", destination=temple_tile, remaining=3)
 
         # Combat training when idle.
         if dwarf.squad_id and self._labor_allowed(dwarf, "combat") and self.rng.random() < 0.2:
@@ -234,10 +228,7 @@ class JobSystemsMixin(JobExecutionMixin):
             return
 
         if not self._labor_allowed(dwarf, job.labor):
-            self._release_job_item(dwarf, job)
-            self._release_job_flora(dwarf, job)
-            dwarf.job = None
-            dwarf.state = "idle"
+            self._abandon_job(dwarf, job)
             return
 
         # Emergency preemption: survival needs can interrupt non-essential workshop throughput.
@@ -271,9 +262,13 @@ class JobSystemsMixin(JobExecutionMixin):
             self._perform_need_job_step(dwarf, job)
             return
 
-        self._step_move_toward(dwarf, job.destination)
-        job.remaining -= 1
+        if not self._step_move_toward(dwarf, job.destination):
+            self._abandon_job(dwarf, job)
+            return
         dwarf.state = job.kind
+        if job.kind == "dig_stairs" and dwarf.pos != job.destination:
+            return
+        job.remaining -= 1
         if job.remaining > 0:
             return
 
@@ -283,11 +278,13 @@ class JobSystemsMixin(JobExecutionMixin):
                 ws.built = True
                 self._gain_skill(dwarf, "build", 1)
         elif job.kind == "dig_stairs":
-            to_z = job.target_id if job.target_id is not None else dwarf.z
-            dwarf.z = clamp(to_z, 0, self.depth - 1)
+            x, y, from_z = job.destination
+            to_z = clamp(job.target_id if job.target_id is not None else from_z, 0, self.depth - 1)
+            self.paths.add_stairs(x, y, from_z, to_z)
+            dwarf.pos = (x, y, to_z)
             self._gain_skill(dwarf, "mine", 1)
             self._resolve_geology_mining(dwarf.x, dwarf.y, dwarf.z, miner=dwarf)
-            self._log("mining", f"A stairway was dug at ({dwarf.x},{dwarf.y}) to z={dwarf.z}", 1)
+            self._log("mining", "stairway_dug", 1, dwarf=dwarf.id, x=dwarf.x, y=dwarf.y, z=dwarf.z)
         elif job.kind == "harvest":
             self._spawn_item("raw_food", dwarf.x, dwarf.y, dwarf.z, material="plump-helmet", perishability=130, value=2)
             self._spawn_item("raw_food", dwarf.x, dwarf.y, dwarf.z, material="plump-helmet", perishability=130, value=2)
@@ -318,7 +315,7 @@ class JobSystemsMixin(JobExecutionMixin):
             dwarf.morale = clamp(dwarf.morale + 6, 0, 100)
             dwarf.stress = clamp(dwarf.stress - 4, 0, 100)
         elif job.kind == "socialize":
-            peer = next((p for p in self.dwarves if p.id == job.target_id), None)
+            peer = self._find_dwarf(job.target_id)
             if peer:
                 dwarf.needs["social"] = clamp(dwarf.needs["social"] - 25, 0, 100)
                 dwarf.relationships[peer.id] = clamp(dwarf.relationships.get(peer.id, 0) + 2, -100, 100)
@@ -341,14 +338,29 @@ class JobSystemsMixin(JobExecutionMixin):
     def _pop_global_job_for_labor(self, dwarf: Dwarf, labor: str) -> Optional[Job]:
         if not self._labor_allowed(dwarf, labor):
             return None
-        candidates = [j for j in self.jobs if j.labor == labor]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda j: j.id)
-        job = candidates[0]
-        self.jobs.remove(job)
+        job = self.job_board.take(labor, lambda j: self._can_reach(dwarf, j.destination), self.paths.reachable_levels(dwarf.pos))
+        if job is not None:
+            self.jobs.remove(job)
         return job
 
+    def _requeue_board_job(self, dwarf: Dwarf) -> None:
+        # A designated job released unfinished goes back on the board with its progress.
+        job = dwarf.job
+        if job is not None and job.kind in BOARD_JOB_KINDS and job.id not in self.jobs.by_id:
+            self.jobs.append(job)
+            dwarf.job = None
+
+    def _find_peer(self, dwarf: Dwarf) -> Optional[Dwarf]:
+        return next((p for p in self.dwarves if p.id != dwarf.id and p.z == dwarf.z and p.hp > 0 and self._can_reach(dwarf, p.pos)), None)
+
+    def _abandon_job(self, dwarf: Dwarf, job: Job) -> None:
+        # Hand back everything the job holds (designations go back on the board) and idle.
+        self._requeue_board_job(dwarf)
+        self._release_job_item(dwarf, job)
+        self._release_job_flora(dwarf, job)
+        dwarf.job = None
+        dwarf.state = "idle"
+
     def _new_job(self, **kwargs: Any) -> Job:
         j = Job(id=self.next_job_id, **kwargs)
         self.next_job_id += 1
@@ -396,11 +408,11 @@ class JobSystemsMixin(JobExecutionMixin):
         dwarf.skills[labor] = dwarf.skills.get(labor, 0) + amount
 
     def _count_item_kind(self, kind: str) -> int:
-        return sum(1 for i in self.items if i.kind == kind)
+        return self.inventory.count(kind)
 
     def _available_food_items(self) -> int:
-        edible = {"raw_food", "cooked_food", "berry", "herb", "rare_plant"}
-        return sum(1 for i in self.items if i.kind in edible)
+        count = self.inventory.count
+        return count("raw_food") + count("cooked_food") + count("berry") + count("herb") + count("rare_plant")
 
     def _release_job_flora(self, dwarf: Dwarf, job: Job) -> None:
         flora = self._find_flora_by_id(job.target_id)
@@ -417,7 +429,9 @@ class JobSystemsMixin(JobExecutionMixin):
             return
         job.destination = (flora.x, flora.y, flora.z)
         if job.phase == "to_flora":
-            self._step_move_toward(dwarf, job.destination)
+            if not self._step_move_toward(dwarf, job.destination):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == job.destination:
                 job.phase = "gathering"
                 job.remaining = 2
@@ -438,7 +452,8 @@ class JobSystemsMixin(JobExecutionMixin):
                     self.economy_stats["foraged_rare"] = self.economy_stats.get("foraged_rare", 0) + 1
             self._apply_forage_to_flora(flora)
             self._gain_skill(dwarf, "harvest", 1)
-            self._log("economy", f"{dwarf.name} harvested flora from {flora.common_name}.", 1)
+            if self._log_enabled("economy", 1):
+                self._log("economy", "flora_harvested", 1, dwarf=dwarf.id, name=dwarf.name, flora=flora.id, plant=flora.common_name)
             dwarf.job = None
             dwarf.state = "idle"
 
@@ -457,7 +472,9 @@ class JobSystemsMixin(JobExecutionMixin):
             return
         job.destination = (flora.x, flora.y, flora.z)
         if job.phase == "to_tree":
-            self._step_move_toward(dwarf, job.destination)
+            if not self._step_move_toward(dwarf, job.destination):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == job.destination:
                 job.phase = "chopping"
                 job.remaining = 3
@@ -474,9 +491,10 @@ class JobSystemsMixin(JobExecutionMixin):
             self.economy_stats["trees_felled_recent"] = self.economy_stats.get("trees_felled_recent", 0) + 1
             self._apply_tree_chop(flora)
             if self.economy_stats.get("trees_felled_recent", 0) >= 6:
-                self._log("economy", "Overharvest warning: tree felling is outpacing regrowth.", 2)
+                self._log("economy", "overharvest", 2)
                 self.economy_stats["trees_felled_recent"] = 0
             self._gain_skill(dwarf, "harvest", 1)
-            self._log("economy", f"{dwarf.name} felled {flora.common_name} for timber.", 1)
+            if self._log_enabled("economy", 1):
+                self._log("economy", "tree_felled", 1, dwarf=dwarf.id, name=dwarf.name, flora=flora.id, plant=flora.common_name)
             dwarf.job = None
             dwarf.state = "idle"
@@ -17,7 +17,9 @@ class JobExecutionMixin:
 
         if job.phase == "to_item":
             job.destination = self._item_pos(item)
-            self._step_move_toward(dwarf, job.destination)
+            if not self._step_move_toward(dwarf, job.destination):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == self._item_pos(item):
                 item.carried_by = dwarf.id
                 item.stockpile_id = None
@@ -49,7 +51,9 @@ class JobExecutionMixin:
                     dwarf.job = None
                     dwarf.state = "idle"
                     return
-            self._step_move_toward(dwarf, job.destination)
+            if not self._step_move_toward(dwarf, job.destination):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == job.destination:
                 item.carried_by = None
                 item.reserved_by = None
@@ -88,7 +92,9 @@ class JobExecutionMixin:
 
         if job.phase == "to_input" and primary:
             job.destination = self._item_pos(primary)
-            self._step_move_toward(dwarf, job.destination)
+            if not self._step_move_toward(dwarf, job.destination):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == self._item_pos(primary):
                 primary.carried_by = dwarf.id
                 primary.stockpile_id = None
@@ -98,7 +104,9 @@ class JobExecutionMixin:
             return
 
         if job.phase == "to_workshop":
-            self._step_move_toward(dwarf, ws.pos)
+            if not self._step_move_toward(dwarf, ws.pos):
+                self._abandon_job(dwarf, job)
+                return
             if dwarf.pos == ws.pos:
                 job.phase = "crafting"
                 job.remaining = spec.get("time", 4)
@@ -110,15 +118,10 @@ class JobExecutionMixin:
                 job.remaining -= 1
             if job.remaining > 0:
                 return
-            # Consume required inputs.
-            for input_kind, qty in spec.get("inputs", {}).items():
-                for _ in range(qty):
-                    found = next(
-                        (i for i in self.items if i.kind == input_kind and (i.reserved_by in {None, dwarf.id})),
-                        None,
-                    )
-                    if found:
-                        self._consume_item(found.id)
+            # Consume the inputs reserved at assignment.
+            for item_id in job.reserved_ids:
+                if self._find_item_by_id(item_id):
+                    self._consume_item(item_id)
             # Produce outputs.
             for output_kind, qty in spec.get("outputs", {}).items():
                 for _ in range(qty):
@@ -145,7 +148,9 @@ class JobExecutionMixin:
                 return
             if job.phase == "to_item":
                 job.destination = self._item_pos(item)
-                self._step_move_toward(dwarf, job.destination)
+                if not self._step_move_toward(dwarf, job.destination):
+                    self._abandon_job(dwarf, job)
+                    return
                 if dwarf.pos == self._item_pos(item):
                     item.carried_by = dwarf.id
                     item.stockpile_id = None
@@ -179,7 +184,9 @@ class JobExecutionMixin:
         if job.kind == "sleep":
             if job.phase == "to_bed" and item:
                 job.destination = self._item_pos(item)
-                self._step_move_toward(dwarf, job.destination)
+                if not self._step_move_toward(dwarf, job.destination):
+                    self._abandon_job(dwarf, job)
+                    return
                 if dwarf.pos == self._item_pos(item):
                     job.phase = "sleeping"
                     job.remaining = 5
@@ -205,6 +212,10 @@ class JobExecutionMixin:
             if item.carried_by == dwarf.id:
                 item.carried_by = None
                 item.x, item.y, item.z = dwarf.pos
+        for item_id in job.reserved_ids:
+            reserved = self._find_item_by_id(item_id)
+            if reserved and reserved.reserved_by == dwarf.id and reserved.carried_by is None:
+                reserved.reserved_by = None
         container = self._find_item_by_id(job.container_id)
         if container and container.reserved_by == dwarf.id:
             container.reserved_by = None
@@ -9,7 +9,7 @@ class JusticeSystemsMixin:
         if unresolved and self.rng.random() < 0.2:
             case = unresolved[0]
             case.resolved = True
-            self._log("justice", f"Crime {case.kind} by dwarf #{case.dwarf_id} was resolved.", 1)
+            self._log("justice", "crime_resolved", 1, crime=case.kind, dwarf=case.dwarf_id)
 
         for d in self.dwarves:
             if d.hp <= 0:
@@ -21,7 +21,7 @@ class JusticeSystemsMixin:
                     self._consume_item(meal.id)
                 d.needs["hunger"] = clamp(d.needs["hunger"] - 30, 0, 100)
                 d.stress = clamp(d.stress - 5, 0, 100)
-                self._log("justice", f"{d.name} stole food due to desperation.", 2)
+                self._log("justice", "food_stolen", 2, dwarf=d.id, name=d.name)
 
     def _record_crime(self, dwarf_id: int, kind: str) -> None:
         c = Crime(id=self.next_crime_id, tick=self.tick_count, dwarf_id=dwarf_id, kind=kind)
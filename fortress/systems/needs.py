@@ -1,94 +1,140 @@
 from __future__ import annotations
 
-from fortress.models import clamp
+from fortress.models import Dwarf, clamp
+from fortress.needs_clock import NeedFlags, need_flags
 
 
 class NeedsSystemsMixin:
     def _update_needs_moods_stress(self) -> None:
+        if self.dwarf_columns is not None:
+            self._update_needs_batched()
+            return
+        # Needs rise lazily in the clock; only the flags derived from them are needed here.
+        clock = self.needs_clock
+        clock.advance(self.tick_count, self.world.raid_active)
         for d in self.dwarves:
             if d.hp <= 0:
+                clock.freeze(d)
                 continue
             if d.rested_bonus > 0:
                 d.rested_bonus -= 1
+            self._apply_need_pressure(d, clock.flags(d))
+
+    def _update_needs_batched(self) -> None:
+        # Same rules, RNG stream and event order as the per-dwarf loop. The numeric rules run
+        # over the arrays; logs and mood changes then run per dwarf, in list order, for the
+        # dwarves that can need them. A tantrum can destroy the last drink, which the loop
+        # would see for the dwarves after it: those are rolled back and redone one by one.
+        columns = self.dwarf_columns
+        drinks = self.drinks
+        snapshot = columns.snapshot()
+        result = columns.update_needs(self.tick_count, self.world.raid_active, drinks == 0)
+        for row in result.visit:
+            d = columns.entity_at(row)
+            if result.roll_only[row] and d.mood not in ("tantrum", "disturbed"):
+                if self.rng.random() < 0.03:
+                    d.mood = "inspired"
+                    self._log("mood", "inspired", 1, dwarf=d.id, name=d.name)
+                continue
+            if result.deprived[row]:
+                self._log("health", "deprivation", 2, dwarf=d.id, name=d.name)
+            if result.withdrawal[row]:
+                self._log("withdrawal", "withdrawal", 2, dwarf=d.id, name=d.name)
+            self._update_dwarf_mood(d)
+            if drinks and not self.drinks:
+                rest = [later for later in result.rows if later > row]
+                if rest:
+                    columns.restore(snapshot, rest[0])
+                    for later in rest:
+                        self._update_dwarf_needs(columns.entity_at(later))
+                return
+
+    def _update_dwarf_needs(self, d: Dwarf) -> None:
+        if d.rested_bonus > 0:
+            d.rested_bonus -= 1
+        if self.tick_count % 2 == 0:
+            d.needs["hunger"] = clamp(d.needs["hunger"] + 1, 0, 100)
+            d.needs["thirst"] = clamp(d.needs["thirst"] + 1, 0, 100)
+        if self.tick_count % 4 == 0:
+            alcohol_pressure = max(0, d.alcohol_dependency // 45)
+            d.needs["alcohol"] = clamp(d.needs["alcohol"] + alcohol_pressure, 0, 100)
+            d.needs["sleep"] = clamp(d.needs["sleep"] + 1, 0, 100)
+        if self.tick_count % 5 == 0:
+            d.needs["social"] = clamp(d.needs["social"] + 1, 0, 100)
+            d.needs["worship"] = clamp(d.needs["worship"] + 1, 0, 100)
+            d.needs["entertainment"] = clamp(d.needs["entertainment"] + 1, 0, 100)
+        if self.tick_count % 4 == 0:
+            d.nutrition["protein"] = clamp(d.nutrition["protein"] + 1, 0, 100)
+            d.nutrition["fiber"] = clamp(d.nutrition["fiber"] + 1, 0, 100)
+            d.nutrition["variety"] = clamp(d.nutrition["variety"] + 1, 0, 100)
+        if self.world.raid_active:
             if self.tick_count % 2 == 0:
-                d.needs["hunger"] = clamp(d.needs["hunger"] + 1, 0, 100)
-                d.needs["thirst"] = clamp(d.needs["thirst"] + 1, 0, 100)
-            if self.tick_count % 4 == 0:
-                alcohol_pressure = max(0, d.alcohol_dependency // 45)
-                d.needs["alcohol"] = clamp(d.needs["alcohol"] + alcohol_pressure, 0, 100)
-                d.needs["sleep"] = clamp(d.needs["sleep"] + 1, 0, 100)
-            if self.tick_count % 5 == 0:
-                d.needs["social"] = clamp(d.needs["social"] + 1, 0, 100)
-                d.needs["worship"] = clamp(d.needs["worship"] + 1, 0, 100)
-                d.needs["entertainment"] = clamp(d.needs["entertainment"] + 1, 0, 100)
-            if self.tick_count % 4 == 0:
-                d.nutrition["protein"] = clamp(d.nutrition["protein"] + 1, 0, 100)
-                d.nutrition["fiber"] = clamp(d.nutrition["fiber"] + 1, 0, 100)
-                d.nutrition["variety"] = clamp(d.nutrition["variety"] + 1, 0, 100)
-            if self.world.raid_active:
-                if self.tick_count % 2 == 0:
-                    d.needs["safety"] = clamp(d.needs["safety"] + 1, 0, 100)
-            else:
-                d.needs["safety"] = clamp(d.needs["safety"] - 1, 0, 100)
+                d.needs["safety"] = clamp(d.needs["safety"] + 1, 0, 100)
+        else:
+            d.needs["safety"] = clamp(d.needs["safety"] - 1, 0, 100)
+        self._apply_need_pressure(d, need_flags(d.needs, d.nutrition))
 
-            avg_nutrition_pressure = sum(d.nutrition.values()) / len(d.nutrition)
-            if avg_nutrition_pressure >= 85 and self.tick_count % 3 == 0:
-                d.stress = clamp(d.stress + 1, 0, 100)
-                d.morale = clamp(d.morale - 1, 0, 100)
+    def _apply_need_pressure(self, d: Dwarf, flags: NeedFlags) -> None:
+        overfed, starving, parched, exhausted, craving, high_needs = flags
+        if overfed and self.tick_count % 3 == 0:
+            d.stress = clamp(d.stress + 1, 0, 100)
+            d.morale = clamp(d.morale - 1, 0, 100)
 
-            # Sustained deprivation should eventually become lethal, but slowly.
-            if d.needs["hunger"] >= 96 and self.tick_count % 6 == 0:
-                d.hp = clamp(d.hp - 1, 0, 100)
-                d.morale = clamp(d.morale - 1, 0, 100)
-            if d.needs["thirst"] >= 96 and self.tick_count % 4 == 0:
-                d.hp = clamp(d.hp - 2, 0, 100)
-                d.morale = clamp(d.morale - 1, 0, 100)
-            if d.needs["sleep"] >= 98 and self.tick_count % 8 == 0:
-                d.hp = clamp(d.hp - 1, 0, 100)
-            if d.needs["hunger"] >= 96 or d.needs["thirst"] >= 96:
-                if self.tick_count % 10 == 0:
-                    self._log("health", f"{d.name} is physically weakening from deprivation.", 2)
+        # Sustained deprivation should eventually become lethal, but slowly.
+        if starving and self.tick_count % 6 == 0:
+            d.hp = clamp(d.hp - 1, 0, 100)
+            d.morale = clamp(d.morale - 1, 0, 100)
+        if parched and self.tick_count % 4 == 0:
+            d.hp = clamp(d.hp - 2, 0, 100)
+            d.morale = clamp(d.morale - 1, 0, 100)
+        if exhausted and self.tick_count % 8 == 0:
+            d.hp = clamp(d.hp - 1, 0, 100)
+        if starving or parched:
+            if self.tick_count % 10 == 0:
+                self._log("health", "deprivation", 2, dwarf=d.id, name=d.name)
 
-            if d.alcohol_dependency >= 45 and self.drinks == 0 and d.needs["alcohol"] >= 85:
-                d.withdrawal_ticks += 1
-                if self.tick_count % 3 == 0:
-                    d.stress = clamp(d.stress + max(1, d.alcohol_dependency // 65), 0, 100)
-                if d.withdrawal_ticks % 10 == 0:
-                    d.morale = clamp(d.morale - 1, 0, 100)
-                if d.withdrawal_ticks in {1, 20, 50}:
-                    self._log("withdrawal", f"{d.name} is suffering alcohol withdrawal.", 2)
-            else:
-                d.withdrawal_ticks = 0
+        if d.alcohol_dependency >= 45 and self.drinks == 0 and craving:
+            d.withdrawal_ticks += 1
+            if self.tick_count % 3 == 0:
+                d.stress = clamp(d.stress + max(1, d.alcohol_dependency // 65), 0, 100)
+            if d.withdrawal_ticks % 10 == 0:
+                d.morale = clamp(d.morale - 1, 0, 100)
+            if d.withdrawal_ticks in {1, 20, 50}:
+                self._log("withdrawal", "withdrawal", 2, dwarf=d.id, name=d.name)
+        else:
+            d.withdrawal_ticks = 0
 
-            critical_need_keys = ("hunger", "thirst", "sleep", "safety")
-            high_needs = sum(1 for key in critical_need_keys if d.needs.get(key, 0) >= 90)
-            if high_needs == 0:
-                d.stress = clamp(d.stress - 1, 0, 100)
-                if d.stress < 40 and self.tick_count % 6 == 0:
-                    d.morale = clamp(d.morale + 1, 0, 100)
-            else:
-                d.stress = clamp(d.stress + high_needs - (1 if d.morale > 60 else 0), 0, 100)
-                if high_needs >= 2 and self.tick_count % 4 == 0:
-                    d.morale = clamp(d.morale - 1, 0, 100)
-            if d.stress >= 85 and self.tick_count % 3 == 0:
+        if high_needs == 0:
+            d.stress = clamp(d.stress - 1, 0, 100)
+            if d.stress < 40 and self.tick_count % 6 == 0:
+                d.morale = clamp(d.morale + 1, 0, 100)
+        else:
+            d.stress = clamp(d.stress + high_needs - (1 if d.morale > 60 else 0), 0, 100)
+            if high_needs >= 2 and self.tick_count % 4 == 0:
                 d.morale = clamp(d.morale - 1, 0, 100)
-            if d.stress >= 96 and d.mood != "tantrum":
-                d.mood = "tantrum"
-                self._log("mood", f"{d.name} is having a tantrum.", 2)
-                if self.items and self.rng.random() < 0.1:
-                    non_essentials = [i for i in self.items if i.kind not in {"raw_food", "cooked_food", "alcohol", "seed"}]
-                    pool = non_essentials if non_essentials else self.items
-                    lost = self.rng.choice(pool)
-                    self._consume_item(lost.id)
-                    self._record_crime(d.id, "vandalism")
-                    self._log("justice", f"{d.name} destroyed property in a tantrum.", 2)
-            elif d.stress <= 25 and d.mood in {"tantrum", "disturbed"}:
-                d.mood = "steady"
-            elif d.stress >= 75 and d.mood == "steady":
-                d.mood = "disturbed"
-            elif d.stress < 20 and self.rng.random() < 0.03:
-                d.mood = "inspired"
-                self._log("mood", f"{d.name} feels inspired.", 1)
+        if d.stress >= 85 and self.tick_count % 3 == 0:
+            d.morale = clamp(d.morale - 1, 0, 100)
+        self._update_dwarf_mood(d)
 
-            if d.hp <= 0:
-                self._log("death", f"{d.name} has died.", 3)
+    def _update_dwarf_mood(self, d: Dwarf) -> None:
+        if d.stress >= 96 and d.mood != "tantrum":
+            d.mood = "tantrum"
+            self._log("mood", "tantrum", 2, dwarf=d.id, name=d.name)
+            if self.items and self.rng.random() < 0.1:
+                non_essentials = [i for i in self.items if i.kind not in {"raw_food", "cooked_food", "alcohol", "seed"}]
+                pool = non_essentials if non_essentials else self.items
+                lost = self.rng.choice(pool)
+                self._consume_item(lost.id)
+                self._record_crime(d.id, "vandalism")
+                self._log("justice", "tantrum_damage", 2, dwarf=d.id, name=d.name)
+        elif d.stress <= 25 and d.mood in {"tantrum", "disturbed"}:
+            d.mood = "steady"
+        elif d.stress >= 75 and d.mood == "steady":
+            d.mood = "disturbed"
+        elif d.stress < 20 and self.rng.random() < 0.03:
+            d.mood = "inspired"
+            self._log("mood", "inspired", 1, dwarf=d.id, name=d.name)
+
+        if d.hp <= 0:
+            self._requeue_board_job(d)
+            self._log("death", "death", 3, dwarf=d.id, name=d.name)
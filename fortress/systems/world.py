@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Set
+from typing import Optional, Set
 
-from fortress.models import Mandate, clamp
+from fortress.models import Mandate, Workshop, clamp
 
 
 class WorldSystemsMixin:
-    def _built_workshop(self, kind: str):
-        return next((w for w in self.workshops if w.kind == kind and w.built), None)
+    def _built_workshop(self, kind: str) -> Optional[Workshop]:
+        return self.built_workshops.first(kind)
 
     def _queue_workshop_recipe(self, workshop_kind: str, recipe: str, max_queue: int = 2) -> bool:
         ws = self._built_workshop(workshop_kind)
@@ -18,7 +18,7 @@ class WorldSystemsMixin:
             return False
         if ws.orders.get(recipe, 0) >= max_queue:
             return False
-        ws.orders[recipe] = ws.orders.get(recipe, 0) + 1
+        self._add_workshop_order(ws, recipe, 1)
         return True
 
     def _plan_workshop_orders(self) -> None:
@@ -91,13 +91,13 @@ class WorldSystemsMixin:
             seasons = ["spring", "summer", "autumn", "winter"]
             idx = seasons.index(self.world.season)
             self.world.season = seasons[(idx + 1) % len(seasons)]
-            self._log("season", f"Season changed to {self.world.season}", 1)
+            self._log("season", "season_changed", 1, season=self.world.season)
             if self.world.season in {"spring", "autumn"}:
                 self._caravan_arrival()
         weather_choices = ["clear", "rain", "storm", "dry", "fog"]
         if self.rng.random() < 0.08:
             self.world.weather = self.rng.choice(weather_choices)
-            self._log("weather", f"Weather is now {self.world.weather}", 1)
+            self._log("weather", "weather_changed", 1, weather=self.world.weather)
         base_temp = {"winter": 0, "spring": 10, "summer": 24, "autumn": 12}[self.world.season]
         if self.world.weather == "storm":
             base_temp -= 2
@@ -113,7 +113,7 @@ class WorldSystemsMixin:
                     z.crop_available += 1
             if z.kind == "pasture" and self.rng.random() < 0.015:
                 self.add_animal("goat", z.x, z.y, z.z)
-                self._log("animal", "A goat kid was born in the pasture.", 1)
+                self._log("animal", "goat_born", 1)
 
     def _update_threats_and_factions(self) -> None:
         if self.tick_count < 300:
@@ -123,7 +123,7 @@ class WorldSystemsMixin:
         if hostile and not self.world.raid_active and self.rng.random() < raid_chance:
             self.world.raid_active = True
             self.world.threat_level = self.rng.randint(1, 4)
-            self._log("raid", f"Raid detected: threat level {self.world.threat_level}", 3)
+            self._log("raid", "raid_detected", 3, threat=self.world.threat_level)
         if self.world.raid_active:
             total_training = sum(s.training for s in self.squads)
             militia = sum(len(s.members) for s in self.squads)
@@ -131,7 +131,7 @@ class WorldSystemsMixin:
             if defense > self.world.threat_level * 10 and self.rng.random() < 0.2:
                 self.world.raid_active = False
                 self.world.threat_level = 0
-                self._log("raid", "Raid repelled.", 2)
+                self._log("raid", "raid_repelled", 2)
                 for f in self.factions:
                     if f.stance == "hostile":
                         f.reputation -= 2
@@ -141,11 +141,11 @@ class WorldSystemsMixin:
                     victim.wounds.append("bruised")
                     victim.hp = max(5, victim.hp - self.rng.randint(4, 12))
                     victim.needs["safety"] = clamp(victim.needs["safety"] + 20, 0, 100)
-                    self._log("combat", f"{victim.name} was injured during a skirmish.", 2)
+                    self._log("combat", "skirmish_injury", 2, dwarf=victim.id, name=victim.name)
             elif self.rng.random() < 0.03:
                 self.world.raid_active = False
                 self.world.threat_level = 0
-                self._log("raid", "Raiders dispersed before a full assault.", 1)
+                self._log("raid", "raid_dispersed", 1)
 
     def _animal_tick(self) -> None:
         pasture = self._find_zone("pasture")
@@ -166,7 +166,7 @@ class WorldSystemsMixin:
                 a.x, a.y = nx, ny
             if a.hunger >= 95:
                 self._spawn_item("hide", a.x, a.y, a.z, material=f"{a.species}-hide", value=2)
-                self._log("animal", f"A {a.species} died of neglect.", 2)
+                self._log("animal", "animal_neglected", 2, animal=a.id, species=a.species)
                 a.hunger = 40
 
     def _fluid_tick(self) -> None:
@@ -179,18 +179,45 @@ class WorldSystemsMixin:
 
     def _item_tick(self) -> None:
         remove_ids: Set[int] = set()
-        for item in self.items:
-            item.age += 1
-            effective_perishability = self._effective_perishability(item)
-            if effective_perishability > 0 and item.age > effective_perishability:
+        if self.item_columns is not None:
+            expired = self.item_columns.age_and_expire(
+                self.room_cover,
+                (self.depth, self.height, self.width),
+                ((i, self._item_pos(i)) for i in self.inventory.carried.values()),
+                self.world.weather in {"rain", "storm"},
+                self.world.temperature_c >= 24,
+            )
+            for item in expired:
+                if self.rng.random() < 0.15:
+                    remove_ids.add(item.id)
+        else:
+            wet, hot = self._spoilage_weather()
+            expired = self.spoilage.advance(self._base_perishability, wet, hot, self.room_cover.version)
+            for item in self.inventory.carried.values():
+                effective_perishability = self._effective_perishability(item)
+                if effective_perishability > 0 and item.age > effective_perishability:
+                    expired.append(item)
+            expired.sort(key=lambda i: i.id)
+            for item in expired:
                 if self.rng.random() < 0.15:
                     remove_ids.add(item.id)
         if remove_ids:
-            self.items = [i for i in self.items if i.id not in remove_ids]
-            self._log("spoilage", f"{len(remove_ids)} perishable item(s) spoiled.", 1)
+            self.items.discard_ids(remove_ids)
+            self._log("spoilage", "items_spoiled", 1, count=len(remove_ids))
+
+    def _ledger_wealth(self) -> int:
+        return self.inventory.wealth + self.economy_stats.get("mandate_wealth_earned", 0)
+
+    def _verify_wealth(self) -> int:
+        ledger = self._ledger_wealth()
+        scanned = sum(i.value + i.quality for i in self.items) + self.economy_stats.get("mandate_wealth_earned", 0)
+        drift = ledger - scanned
+        if drift:
+            self._log("debug", "wealth_drift", 2, drift=drift, ledger=ledger, scan=scanned)
+        return drift
 
     def _caravan_arrival(self) -> None:
-        self._log("trade", "A caravan arrived with trade goods.", 1)
+        self._log("trade", "caravan_arrived", 1)
         self._spawn_item("wood", self.width - 3, 2, 0, material="oak", value=2)
         self._spawn_item("medicine", self.width - 3, 3, 0, material="herbs", value=4)
         friendly = next((f for f in self.factions if f.name == "River Guild"), None)
@@ -204,14 +231,7 @@ class WorldSystemsMixin:
             for sp in self.stockpiles:
                 if self._stockpile_loose_item_count(sp) < 4:
                     continue
-                loose = next(
-                    (
-                        i
-                        for i in self.items
-                        if i.stockpile_id == sp.id and i.container_id is None and i.kind not in {"chest", "barrel", "bin", "crate", "bag"}
-                    ),
-                    None,
-                )
+                loose = self.stockpile_occupancy.first_loose(sp.id)
                 if not loose:
                     continue
                 if self._find_compatible_container(sp, loose.kind):
@@ -225,7 +245,7 @@ class WorldSystemsMixin:
         for mandate in self.mandates:
             if mandate.fulfilled or mandate.failed:
                 continue
-            available = sum(1 for i in self.items if i.kind == mandate.requested_item_kind)
+            available = self.inventory.count(mandate.requested_item_kind)
             mandate.delivered_amount = min(available, mandate.requested_amount)
             if mandate.delivered_amount >= mandate.requested_amount:
                 mandate.fulfilled = True
@@ -238,8 +258,11 @@ class WorldSystemsMixin:
                 self.economy_stats["mandates_fulfilled"] = self.economy_stats.get("mandates_fulfilled", 0) + 1
                 self._log(
                     "mandate",
-                    f"Mandate #{mandate.id} fulfilled ({mandate.requested_item_kind} x{mandate.requested_amount}).",
+                    "mandate_fulfilled",
                     1,
+                    mandate=mandate.id,
+                    item=mandate.requested_item_kind,
+                    amount=mandate.requested_amount,
                 )
             elif self.tick_count > mandate.due_tick:
                 mandate.failed = True
@@ -250,8 +273,11 @@ class WorldSystemsMixin:
                 self.economy_stats["mandates_failed"] = self.economy_stats.get("mandates_failed", 0) + 1
                 self._log(
                     "mandate",
-                    f"Mandate #{mandate.id} expired ({mandate.requested_item_kind} x{mandate.requested_amount}).",
+                    "mandate_expired",
                     2,
+                    mandate=mandate.id,
+                    item=mandate.requested_item_kind,
+                    amount=mandate.requested_amount,
                 )
 
     def _generate_mandate(self) -> None:
@@ -283,6 +309,12 @@ class WorldSystemsMixin:
         self.mandates.append(mandate)
         self._log(
             "mandate",
-            f"New {kind} mandate from {issuer.name}: {item_kind} x{amount} by t{mandate.due_tick}.",
+            "mandate_issued",
             1,
+            mandate=mandate.id,
+            mandate_kind=kind,
+            issuer=issuer.name,
+            item=item_kind,
+            amount=amount,
+            due=mandate.due_tick,
         )
@@ -0,0 +1,124 @@
+import random
+import unittest
+
+from fortress.engine import Game
+from fortress.models import Workshop
+from fortress.pathing import PathFinder
+
+
+def wall(x: int, height: int, z: int, start_id: int = 1) -> list:
+    return [Workshop(id=start_id + y, kind="mason", x=x, y=y, z=z, built=True) for y in range(height)]
+
+
+class ConnectivityTests(unittest.TestCase):
+    def test_levels_are_joined_only_through_stairs(self) -> None:
+        paths = PathFinder(10, 6, 3)
+        self.assertFalse(paths.reachable((0, 0, 0), (0, 0, 1)))
+        self.assertEqual(len(set(paths.level_regions)), 3)
+        paths.add_stairs(4, 4, 0, 2)
+        self.assertTrue(paths.reachable((0, 0, 0), (9, 5, 2)))
+        self.assertEqual(paths.region((0, 0, 0)), paths.region((9, 5, 2)))
+        self.assertEqual(len(paths.level_regions), 3)
+        self.assertEqual(len(set(paths.level_regions)), 1)
+        self.assertFalse(paths.reachable((0, 0, 0), (10, 0, 0)))
+
+    def test_walls_split_a_level(self) -> None:
+        paths = PathFinder(10, 6, 2, block_workshops=True)
+        paths.reset(wall(5, 6, 0))
+        self.assertFalse(paths.reachable((0, 0, 0), (9, 0, 0)))
+        self.assertIsNone(paths.route((0, 0, 0), (9, 0, 0)))
+        # A blocked tile is reachable from either side it borders.
+        self.assertTrue(paths.reachable((0, 0, 0), (5, 3, 0)))
+        self.assertTrue(paths.reachable((9, 0, 0), (5, 3, 0)))
+        self.assertEqual(paths.region((5, 3, 0)), -1)
+        paths.add_stairs(1, 1, 0, 1)
+        paths.add_stairs(8, 1, 0, 1)
+        self.assertTrue(paths.reachable((0, 0, 0), (9, 0, 0)))
+        self.assertEqual(len(paths.route((0, 0, 0), (9, 0, 0))), 12)
+
+    def test_reachable_agrees_with_search(self) -> None:
+        r = random.Random(19)
+        paths = PathFinder(12, 8, 3, block_workshops=True)
+        paths.reset([Workshop(id=i, kind="mason", x=r.randrange(12), y=r.randrange(8), z=r.randrange(3), built=True) for i in range(90)])
+        paths.add_stairs(2, 2, 0, 1)
+        paths.add_stairs(9, 5, 1, 2)
+        for _ in range(300):
+            start = (r.randrange(12), r.randrange(8), r.randrange(3))
+            goal = (r.randrange(12), r.randrange(8), r.randrange(3))
+            found = paths._line(start, goal) or paths._search(start, goal)
+            self.assertEqual(paths.reachable(start, goal), found is not None, (start, goal))
+
+    def test_unreachable_jobs_wait_for_stairs(self) -> None:
+        g = Game(rng_seed=191)
+        g.queue_build_workshop("mason", 6, 6, 1)
+        build = next(j for j in g.jobs if j.kind == "build_workshop")
+        g.tick(20)
+        self.assertIn(build, g.jobs)
+        self.assertTrue(all(d.pos[2] == 0 for d in g.dwarves))
+        g.queue_dig(3, 3, 0, 1)
+        for _ in range(200):
+            g.tick()
+            if build not in g.jobs:
+                break
+        self.assertEqual(g.paths.stairs, {(3, 3, 0)})
+        self.assertNotIn(build, g.jobs)
+
+    def test_reachable_levels(self) -> None:
+        paths = PathFinder(10, 6, 3, block_workshops=True)
+        paths.reset(wall(5, 6, 1))
+        self.assertEqual(paths.reachable_levels((0, 0, 0)), {0})
+        paths.add_stairs(8, 1, 0, 1)
+        self.assertEqual(paths.reachable_levels((0, 0, 0)), {0, 1})
+        self.assertEqual(paths.reachable_levels((0, 0, 1)), {1})
+        self.assertEqual(paths.reachable_levels((5, 2, 1)), {0, 1})
+
+    def test_assignment_skips_unreachable_targets(self) -> None:
+        g = Game(rng_seed=192, blocking_workshops=True)
+        g.items = []
+        g.floras = []
+        g.zones = []
+        g.stockpiles = []
+        for x in (7, 8, 9):
+            for y in (7, 8, 9):
+                if (x, y) != (8, 8):
+                    g.queue_build_workshop("mason", x, y, 0).built = True
+        g.jobs = []
+        d = g.dwarves[0]
+        d.pos = (2, 2, 0)
+        for key in d.needs:
+            d.needs[key] = 0
+        d.stress = 0
+        upstairs = g._spawn_item("cooked_food", 2, 2, 1, value=2)
+        walled = g._spawn_item("cooked_food", 8, 8, 0, value=2)
+        meal = g._spawn_item("cooked_food", 12, 3, 0, value=2)
+        d.needs["hunger"] = 80
+        job = g._assign_job(d)
+        self.assertEqual((job.kind, job.item_id), ("eat", meal.id))
+        self.assertEqual([i.reserved_by for i in (upstairs, walled)], [None, None])
+        g._release_job_item(d, job)
+        d.needs["hunger"] = 0
+
+        g.add_stockpile("general", 20, 2, 1, 2, 2)
+        self.assertEqual(g._find_haul_candidate(d), (None, None, None))
+        self.assertIs(g._find_haul_candidate()[0], upstairs)
+        near = g.add_stockpile("general", 20, 8, 0, 2, 2)
+        self.assertEqual(g._find_haul_candidate(d), (meal, near, None))
+
+        g.add_zone("recreation", 8, 8, 0, 1, 1)
+        d.needs["entertainment"] = 70
+        d.allowed_labors.discard("haul")
+        self.assertNotEqual(g._assign_job(d).kind, "recreate")
+        g.zones = []
+        g.add_zone("recreation", 14, 2, 0, 2, 2)
+        self.assertEqual(g._assign_job(d).kind, "recreate")
+        d.needs["entertainment"] = 0
+
+        walled_herb = g._spawn_flora("allium_canadense", 8, 8, 0, stage="seeded")
+        self.assertIsNone(g._find_forageable_flora(0, d))
+        self.assertIs(g._find_forageable_flora(0), walled_herb)
+        herb = g._spawn_flora("allium_canadense", 4, 12, 0, stage="juvenile")
+        self.assertIs(g._find_forageable_flora(0, d), herb)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from fortress.engine import Game
+
+
+def scan_load(g: Game, container_id: int) -> int:
+    return sum(1 for i in g.items if i.container_id == container_id)
+
+
+class ContainerIndexTests(unittest.TestCase):
+    def test_contents_follow_packing_unpacking_and_consume(self) -> None:
+        g = Game(rng_seed=621)
+        g.items = []
+        sp = g.add_stockpile("raw", 5, 5, 0, 1, 1)
+        bag = g._spawn_item("bag", 5, 5, 0, material="cloth", value=3)
+        bag.stockpile_id = sp.id
+        seeds = [g._spawn_item("seed", 5, 5, 0, material="spawn", value=1) for _ in range(3)]
+        for seed in seeds:
+            seed.stockpile_id = sp.id
+            seed.container_id = bag.id
+        self.assertEqual(g._container_load(bag), 3)
+        self.assertEqual(g._container_free_capacity(bag), 5)
+        self.assertIs(g._find_compatible_container(sp, "seed"), bag)
+
+        seeds[0].container_id = None
+        self.assertEqual(g._container_load(bag), scan_load(g, bag.id))
+
+        g._consume_item(bag.id)
+        self.assertEqual([i.id for i in g.items], [seeds[0].id])
+        self.assertEqual(g._container_load(bag), 0)
+
+    def test_full_or_unstockpiled_containers_are_not_offered(self) -> None:
+        g = Game(rng_seed=622)
+        g.items = []
+        sp = g.add_stockpile("drink", 6, 5, 0, 1, 1)
+        barrel = g._spawn_item("barrel", 6, 5, 0, material="oak", value=3)
+        self.assertIsNone(g._find_compatible_container(sp, "alcohol"))
+        barrel.stockpile_id = sp.id
+        self.assertIs(g._find_compatible_container(sp, "alcohol"), barrel)
+        for _ in range(12):
+            g._spawn_item("alcohol", 6, 5, 0, material="ale", value=2).container_id = barrel.id
+        self.assertIsNone(g._find_compatible_container(sp, "alcohol"))
+        self.assertIn(f"[{barrel.id}] barrel stockpile={sp.id} load=12", g.panel("stocks"))
+
+    def test_contents_match_scan_after_hauling_ticks(self) -> None:
+        g = Game(rng_seed=623)
+        sp = g.add_stockpile("raw", 8, 8, 0, 2, 2)
+        bag = g._spawn_item("bag", 8, 8, 0, material="cloth", value=3)
+        bag.stockpile_id = sp.id
+        for _ in range(6):
+            g._spawn_item("seed", 3, 3, 0, material="spawn", value=1)
+        g.tick(80)
+        for container in [i for i in g.items if i.kind in {"chest", "barrel", "bin", "crate", "bag"}]:
+            self.assertEqual(g._container_load(container), scan_load(g, container.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
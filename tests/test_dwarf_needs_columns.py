@@ -0,0 +1,82 @@
+import copy
+import os
+import random
+import tempfile
+import unittest
+from dataclasses import asdict
+
+from fortress.columns import numpy_available
+from fortress.engine import Game
+
+
+def colony(vectorized: bool, seed: int, essentials_only: bool = False) -> Game:
+    g = Game(rng_seed=seed, vectorized_needs=vectorized)
+    r = random.Random(seed)
+    for _ in range(120):
+        d = g.add_dwarf()
+        for key in list(d.needs):
+            d.needs[key] = r.randint(40, 100)
+        for key in list(d.nutrition):
+            d.nutrition[key] = r.randint(60, 100)
+        d.stress = r.randint(0, 100)
+        d.morale = r.randint(0, 100)
+        d.hp = r.randint(1, 100)
+        d.alcohol_dependency = r.randint(20, 95)
+        d.rested_bonus = r.randint(0, 5)
+    if essentials_only:
+        # Tantrums then destroy drinks, which dwarves later in the same tick must notice.
+        for item in list(g.items):
+            if item.kind not in {"raw_food", "cooked_food", "alcohol", "seed"}:
+                g.items.remove(item)
+        g._spawn_item("alcohol", 1, 1, 0, value=1)
+    for t in range(160):
+        g.tick_count += 1
+        g.world.raid_active = (t // 40) % 2 == 1
+        g._update_needs_moods_stress()
+    return g
+
+
+def outcome(g: Game) -> tuple:
+    return (
+        [asdict(d) for d in g.dwarves],
+        [(e.tick, e.kind, e.text) for e in g.events],
+        [asdict(i) for i in g.items],
+        g.rng.random(),
+    )
+
+
+@unittest.skipUnless(numpy_available(), "numpy not installed")
+class DwarfNeedsColumnsTests(unittest.TestCase):
+    def test_batched_pass_matches_per_dwarf_loop(self) -> None:
+        for seed, essentials_only in ((731, False), (732, True), (733, True)):
+            scalar, batched = colony(False, seed, essentials_only), colony(True, seed, essentials_only)
+            self.assertIsNotNone(batched.dwarf_columns)
+            self.assertEqual(outcome(batched), outcome(scalar))
+
+    def test_needs_are_views_of_the_matrix(self) -> None:
+        g = Game(rng_seed=734, vectorized_needs=True)
+        d = g.dwarves[0]
+        d.needs["hunger"] = 77
+        row = g.dwarf_columns._row[d.id]
+        self.assertEqual(g.dwarf_columns.needs[row, 0], 77)
+        self.assertEqual(g.handle_command(f"set need {d.id} thirst 88"), f"set dwarf {d.id} need thirst=88")
+        self.assertEqual(copy.deepcopy(d.needs), dict(d.needs))
+        self.assertEqual(asdict(d)["needs"]["hunger"], 77)
+        self.assertNotIn("gold", d.needs)
+        g.dwarves.remove(d)
+        self.assertIsInstance(d.needs, dict)
+        self.assertEqual((d.needs["hunger"], d.needs["thirst"]), (77, 88))
+
+    def test_save_round_trip(self) -> None:
+        g = Game(rng_seed=735, vectorized_needs=True)
+        g.tick(30)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual([d.needs for d in loaded.dwarves], [dict(d.needs) for d in g.dwarves])
+        self.assertEqual([d.stress for d in loaded.dwarves], [d.stress for d in g.dwarves])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+
+from fortress.engine import Game
+from fortress.registry import EntityList
+
+
+class EntityRegistryTests(unittest.TestCase):
+    def test_finders_follow_spawn_consume_and_reassignment(self) -> None:
+        g = Game(rng_seed=601)
+        barrel = g._spawn_item("barrel", 4, 4, 0, material="oak", value=3)
+        ale = g._spawn_item("alcohol", 4, 4, 0, material="ale", value=2)
+        ale.container_id = barrel.id
+        self.assertIs(g._find_item_by_id(ale.id), ale)
+
+        g._consume_item(barrel.id)
+        self.assertIsNone(g._find_item_by_id(barrel.id))
+        self.assertIsNone(g._find_item_by_id(ale.id))
+
+        g.items = [i for i in g.items if i.kind != "wood"]
+        self.assertIsInstance(g.items, EntityList)
+        self.assertTrue(all(g._find_item_by_id(i.id) is i for i in g.items))
+        self.assertEqual(len(g.items.by_id), len(g.items))
+
+    def test_entity_list_tracks_list_mutations(self) -> None:
+        g = Game(rng_seed=602)
+        d = g.dwarves[1]
+        self.assertIs(g._find_dwarf(d.id), d)
+        g.dwarves.remove(d)
+        self.assertIsNone(g._find_dwarf(d.id))
+        g.dwarves.insert(0, d)
+        self.assertIs(g._find_dwarf(d.id), d)
+        del g.dwarves[0]
+        self.assertIsNone(g._find_dwarf(d.id))
+        g.dwarves[0] = d
+        self.assertIs(g._find_dwarf(d.id), d)
+        self.assertEqual(set(g.dwarves.by_id), {x.id for x in g.dwarves})
+
+    def test_load_rebuilds_registry_and_save_is_byte_stable(self) -> None:
+        g = Game(rng_seed=603)
+        g.add_stockpile("raw", 5, 5, 0, 3, 3)
+        g.tick(40)
+        with tempfile.TemporaryDirectory() as tmp:
+            first = os.path.join(tmp, "first.json")
+            second = os.path.join(tmp, "second.json")
+            g.save_json(first)
+            loaded = Game.load_json(first)
+            for name in ("items", "dwarves", "workshops", "stockpiles", "floras", "squads"):
+                entities = getattr(loaded, name)
+                self.assertIsInstance(entities, EntityList)
+                self.assertTrue(all(entities.get(e.id) is e for e in entities))
+            loaded.save_json(second)
+            with open(first, "r", encoding="utf-8") as a, open(second, "r", encoding="utf-8") as b:
+                self.assertEqual(a.read(), b.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from dataclasses import asdict
+
+from fortress.engine import Game
+from fortress.event_log import EventLog
+from fortress.models import Event
+
+
+class EventLogTests(unittest.TestCase):
+    def test_rings_keep_the_latest_events(self) -> None:
+        log = EventLog(capacity=5, kind_capacity=2, alert_capacity=3)
+        for tick in range(12):
+            log.append(Event(tick=tick, kind="raid" if tick % 3 == 0 else "mood", template=f"e{tick}", severity=3 if tick % 2 else 1))
+        self.assertEqual([e.tick for e in log], [7, 8, 9, 10, 11])
+        self.assertEqual([e.tick for e in log[-2:]], [10, 11])
+        self.assertEqual([e.tick for e in log.recent(3)], [9, 10, 11])
+        self.assertEqual([e.tick for e in log.recent(5, kind="raid")], [6, 9])
+        self.assertEqual(log.recent(5, kind="flora"), [])
+        self.assertEqual([e.tick for e in log.recent_alerts(10)], [7, 9, 11])
+
+    def test_game_log_alerts_and_panels(self) -> None:
+        g = Game(rng_seed=241)
+        for n in range(450):
+            g._log("test", f"note {n}", 2 if n % 2 else 1, n=n)
+        self.assertEqual(len(g.events), 400)
+        self.assertEqual(g.events[-1].data, {"n": 449})
+        self.assertEqual(len(g.alerts), 200)
+        self.assertEqual(g.alerts[-1], "t0 [test] note 449")
+        self.assertEqual(g.alerts_dump().splitlines()[0], "t0 [test] note 411")
+        self.assertEqual(g.panel("events").splitlines()[-1], "t0 [test] sev=2 note 449")
+        g._trigger_game_over()
+        self.assertIn("- t0 [game_over] No dwarves remain. The fortress has fallen.", g.game_over_summary())
+
+    def test_save_round_trip(self) -> None:
+        g = Game(rng_seed=242)
+        g.tick(40)
+        g._log("raid", "Raid detected: threat level 2", 3, threat=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertIsInstance(loaded.events, EventLog)
+        self.assertEqual([asdict(e) for e in loaded.events], [asdict(e) for e in g.events])
+        self.assertEqual(loaded.events.recent(1, kind="raid")[0].data, {"threat": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
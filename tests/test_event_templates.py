@@ -0,0 +1,62 @@
+import glob
+import json
+import os
+import re
+import tempfile
+import unittest
+
+from fortress.engine import Game
+from fortress.event_log import DEFAULT_EVENT_LEVELS
+from fortress.event_templates import EVENT_TEMPLATES
+from fortress.io.persistence import load_event
+from fortress.models import Event
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class EventTemplateTests(unittest.TestCase):
+    def test_logged_templates_exist(self) -> None:
+        used = set()
+        for path in glob.glob(os.path.join(ROOT, "fortress", "**", "*.py"), recursive=True):
+            with open(path) as f:
+                used.update(re.findall(r'_log\(\s*"[a-z_]+",\s*"([a-z_]+)"', f.read()))
+        self.assertGreater(len(used), 30)
+        self.assertEqual(used - set(EVENT_TEMPLATES), set())
+
+    def test_text_renders_on_demand(self) -> None:
+        g = Game(rng_seed=251)
+        d = g.dwarves[0]
+        g._log("death", "death", 3, dwarf=d.id, name=d.name)
+        event = g.events[-1]
+        self.assertEqual((event.template, event.data), ("death", {"dwarf": d.id, "name": d.name}))
+        self.assertEqual(event.text, f"{d.name} has died.")
+        self.assertEqual(g.alerts[-1], f"t0 [death] {d.name} has died.")
+        self.assertEqual(Event(tick=1, kind="debug", template="a literal note").text, "a literal note")
+        legacy = load_event({"tick": 3, "kind": "trade", "text": "A caravan arrived with trade goods.", "severity": 1})
+        self.assertEqual((legacy.template, legacy.text, legacy.data), (legacy.text, "A caravan arrived with trade goods.", {}))
+
+    def test_severity_filter(self) -> None:
+        g = Game(rng_seed=252)
+        self.assertFalse(g._log_enabled("flora", 3))
+        g.tick(60)
+        self.assertEqual([e for e in g.events if e.kind == "flora"], [])
+        self.assertEqual(g.handle_command("set loglevel flora 1"), "set loglevel flora=1")
+        self.assertEqual(g.handle_command("set loglevel weather 2"), "set loglevel weather=2")
+        g._log("weather", "weather_changed", 1, weather="fog")
+        g._log("flora", "flora_died", 1, flora=1, plant="Oak", scientific="Quercus")
+        self.assertEqual([e.text for e in g.events.recent(1)], ["Oak (Quercus) died off."])
+        self.assertEqual(g.events.recent(5, kind="weather")[-1:], [e for e in g.events if e.kind == "weather"][-1:])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            self.assertEqual(Game.load_json(path).event_levels, {"flora": 1, "weather": 2})
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            del data["event_levels"]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertEqual(Game.load_json(path).event_levels, DEFAULT_EVENT_LEVELS)
+
+
+if __name__ == "__main__":
+    unittest.main()
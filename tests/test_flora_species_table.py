@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import unittest
+
+from fortress.engine import Game
+
+
+class FloraSpeciesTableTests(unittest.TestCase):
+    def test_table_mirrors_species_defs(self) -> None:
+        g = Game(rng_seed=711)
+        raw = g.defs["flora_species"]
+        self.assertEqual(list(g.flora_table.species), list(raw))
+        for num, (species_id, spec) in enumerate(raw.items()):
+            sp = g.flora_table.get(species_id)
+            self.assertEqual(sp.num, num)
+            self.assertEqual(sp.stages, tuple(spec["stages"]))
+            expected = float(spec["base_growth"]) * spec["season_mod"]["spring"] * spec["weather_mod"]["rain"]
+            self.assertEqual(sp.growth_for("spring", "rain"), expected)
+        self.assertEqual(
+            [sp.id for sp in g._flora_species_for_biome("temperate-forest")],
+            [sid for sid, spec in raw.items() if "temperate-forest" in spec["biomes"]],
+        )
+
+    def test_stage_index_follows_stage_writes(self) -> None:
+        g = Game(rng_seed=712)
+        tree = g._spawn_flora("quercus_alba", 30, 1, 0, stage="seedling")
+        assert tree is not None
+        self.assertEqual(tree.stage_index, 0)
+        tree.stage = "mature"
+        self.assertEqual(tree.stage_index, 3)
+        tree.stage = "dead"
+        self.assertEqual(tree.stage_index, 0)
+        g.tick(80)
+        for fl in g.floras:
+            stages = g.defs["flora_species"][fl.species_id]["stages"]
+            self.assertEqual(fl.stage_index, stages.index(fl.stage) if fl.stage in stages else 0)
+
+    def test_load_defs_recompiles_table(self) -> None:
+        g = Game(rng_seed=713)
+        shrub = g._spawn_flora("allium_canadense", 30, 1, 0, stage="mature")
+        assert shrub is not None
+        patch = {"flora_species": {"allium_canadense": {"stages": ["mature", "sprout", "juvenile", "flowering", "seeded"], "stage_threshold": 3}}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "defs.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(patch, f)
+            g.handle_command(f"load_defs {path}")
+        self.assertEqual(g.flora_table.get("allium_canadense").stage_threshold, 3)
+        self.assertEqual(shrub.stage_index, 0)
+
+    def test_forage_candidates_prefer_later_stages(self) -> None:
+        g = Game(rng_seed=714)
+        g.floras = []
+        young = g._spawn_flora("allium_canadense", 2, 2, 0, stage="juvenile")
+        ripe = g._spawn_flora("allium_canadense", 3, 2, 0, stage="juvenile")
+        assert young is not None and ripe is not None
+        self.assertIs(g._find_forageable_flora(0), young if young.health >= ripe.health else ripe)
+        ripe.stage = "seeded"
+        self.assertIs(g._find_forageable_flora(0), ripe)
+
+    def test_saves_leave_stage_index_derived(self) -> None:
+        g = Game(rng_seed=715)
+        tree = g._spawn_flora("quercus_alba", 30, 1, 0, stage="mature")
+        assert tree is not None
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertTrue(all("stage_index" not in fl for fl in data["floras"]))
+            data["floras"][-1]["stage_index"] = 0
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            loaded = Game.load_json(path)
+        self.assertEqual(loaded._find_flora_by_id(tree.id).stage_index, 3)
+        self.assertEqual([fl.stage_index for fl in loaded.floras], [fl.stage_index for fl in g.floras])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from fortress.columns import numpy_available
+from fortress.engine import Game
+
+
+def brute_best(g: Game, kind: str, z: int):
+    ready = g._is_forage_ready if kind == "forage" else g._is_tree_choppable
+    candidates = [fl for fl in g.floras if fl.z == z and fl.reserved_by is None and ready(fl)]
+    candidates.sort(key=lambda fl: (fl.stage_index, fl.health, -fl.id), reverse=True)
+    return candidates[0] if candidates else None
+
+
+class FloraTargetsTests(unittest.TestCase):
+    def assert_matches_scan(self, g: Game) -> None:
+        for z in range(g.depth):
+            self.assertIs(g._find_forageable_flora(z), brute_best(g, "forage", z))
+            self.assertIs(g._find_tree_for_chop(z), brute_best(g, "chop", z))
+
+    def test_writes_keep_candidates_in_order(self) -> None:
+        g = Game(rng_seed=721, depth=2)
+        r = random.Random(5)
+        for _ in range(400):
+            fl = r.choice(g.floras)
+            op = r.randrange(6)
+            if op == 0:
+                fl.reserved_by = None if fl.reserved_by is not None else 1
+            elif op == 1:
+                fl.health = r.randint(0, 100)
+            elif op == 2:
+                sp = g.flora_table.get(fl.species_id)
+                fl.stage = r.choice(sp.stages)
+            elif op == 3:
+                fl.z = r.randrange(2)
+            elif op == 4:
+                if fl.kind == "plant":
+                    g._apply_forage_to_flora(fl)
+                else:
+                    g._apply_tree_chop(fl)
+            else:
+                fl.dead = not fl.dead
+            self.assert_matches_scan(g)
+
+    def test_matches_scan_through_ticks(self) -> None:
+        g = Game(rng_seed=722)
+        g.add_zone("farm", 1, 8, 0, 6, 3)
+        g.world.temperature_c = 3
+        for _ in range(120):
+            g.tick()
+            self.assert_matches_scan(g)
+
+    @unittest.skipUnless(numpy_available(), "numpy not installed")
+    def test_vectorized_health_updates_are_seen(self) -> None:
+        g = Game(rng_seed=723, vectorized_flora=True)
+        g.world.temperature_c = -4
+        for _ in range(30):
+            g._flora_tick()
+            self.assert_matches_scan(g)
+
+    def test_reserved_and_removed_plants_leave_the_queue(self) -> None:
+        g = Game(rng_seed=724)
+        g.floras = []
+        a = g._spawn_flora("allium_canadense", 2, 2, 0, stage="mature")
+        b = g._spawn_flora("allium_canadense", 4, 2, 0, stage="juvenile")
+        assert a is not None and b is not None
+        self.assertIs(g._find_forageable_flora(0), a)
+        a.reserved_by = 7
+        self.assertIs(g._find_forageable_flora(0), b)
+        g.floras.remove(b)
+        self.assertIsNone(g._find_forageable_flora(0))
+        a.reserved_by = None
+        self.assertIs(g._find_forageable_flora(0), a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+from dataclasses import asdict
+
+from fortress.columns import numpy_available
+from fortress.engine import Game
+
+
+def grow(vectorized: bool, seed: int, temperatures: list) -> Game:
+    g = Game(rng_seed=seed, width=48, height=32, vectorized_flora=vectorized)
+    g.max_flora = 300
+    for t in range(600):
+        if t % 50 == 0:
+            g.world.temperature_c = temperatures[(t // 50) % len(temperatures)]
+        if t % 37 == 0:
+            g.world.season = ("spring", "summer", "autumn", "winter")[(t // 37) % 4]
+            g.world.weather = ("clear", "rain", "storm", "dry", "fog")[(t // 37) % 5]
+        g._flora_tick()
+    return g
+
+
+@unittest.skipUnless(numpy_available(), "numpy not installed")
+class VectorizedFloraTests(unittest.TestCase):
+    def test_matches_scalar_engine_and_rng_stream(self) -> None:
+        for temperatures in ([12, 6, 22, 28, 15, 1, 18], [12, 3, 25, 34, 8, -6]):
+            scalar, vectorized = grow(False, 691, temperatures), grow(True, 691, temperatures)
+            self.assertIsNotNone(vectorized.flora_columns)
+            self.assertGreater(scalar.next_flora_id, 60)
+            self.assertEqual(vectorized.next_flora_id, scalar.next_flora_id)
+            self.assertEqual([asdict(f) for f in vectorized.floras], [asdict(f) for f in scalar.floras])
+            self.assertEqual(vectorized.rng.random(), scalar.rng.random())
+
+    def test_fields_live_in_columns_and_return_on_removal(self) -> None:
+        g = Game(rng_seed=692, vectorized_flora=True)
+        fl = next(f for f in g.floras if f.kind == "plant")
+        fl.health = 42
+        self.assertEqual(g.flora_columns.get(fl, "health"), 42)
+        g._apply_forage_to_flora(fl)
+        self.assertEqual(g.flora_columns.get(fl, "health"), 34)
+        g.floras.remove(fl)
+        self.assertIsNone(fl._columns)
+        self.assertEqual((fl.health, fl.growth_points), (34, 0))
+
+    def test_large_forest(self) -> None:
+        g = Game(rng_seed=693, width=120, height=120, vectorized_flora=True)
+        g.max_flora = 12000
+        species = list(g.flora_table.species)
+        r = random.Random(1)
+        while len(g.floras) < 10000:
+            g._spawn_flora(r.choice(species), r.randrange(120), r.randrange(120), 0)
+        ages = [fl.age_ticks for fl in g.floras]
+        g._flora_tick()
+        self.assertEqual([fl.age_ticks for fl in g.floras[: len(ages)]], [a + 1 for a in ages])
+
+
+class VectorizedFloraFallbackTests(unittest.TestCase):
+    def test_scalar_engine_by_default(self) -> None:
+        g = Game(rng_seed=694)
+        self.assertIsNone(g.flora_columns)
+        g.tick(5)
+        self.assertTrue(all(fl.age_ticks >= 5 for fl in g.floras if not fl.dead))
+
+
+if __name__ == "__main__":
+    unittest.main()
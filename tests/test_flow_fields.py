@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from fortress.engine import Game
+from fortress.models import Workshop
+from fortress.pathing import HOT_ROUTES, PathFinder
+
+
+def warm(paths: PathFinder, goal: tuple) -> None:
+    for walker in range(HOT_ROUTES):
+        paths.next_step(1000 + walker, (0, 0, 0), goal)
+    paths.field(goal)
+
+
+class FlowFieldTests(unittest.TestCase):
+    def test_goal_gets_a_field_once_hot(self) -> None:
+        paths = PathFinder(12, 8, 2)
+        goal = (9, 5, 0)
+        for walker in range(HOT_ROUTES):
+            self.assertIsNone(paths.field(goal))
+            paths.next_step(walker, (walker, 0, 0), goal)
+        self.assertIsNotNone(paths.field(goal))
+        self.assertEqual(paths.fields_built, 1)
+        # Open ground: the field walks the same straight line as the route.
+        pos, steps = (0, 0, 0), []
+        while pos != goal:
+            pos = paths.next_step(99, pos, goal)
+            steps.append(pos)
+        self.assertEqual(tuple(steps), paths.route((0, 0, 0), goal)[1:])
+
+    def test_field_steps_are_shortest_routes(self) -> None:
+        r = random.Random(9)
+        paths = PathFinder(16, 10, 3, block_workshops=True)
+        paths.reset([Workshop(id=i, kind="mason", x=r.randrange(16), y=r.randrange(10), z=r.randrange(3), built=True) for i in range(60)])
+        paths.add_stairs(4, 4, 0, 2)
+        paths.add_stairs(12, 7, 1, 2)
+        for _ in range(6):
+            goal = (r.randrange(16), r.randrange(10), r.randrange(3))
+            warm(paths, goal)
+            for _ in range(40):
+                start = (r.randrange(16), r.randrange(10), r.randrange(3))
+                route = paths.route(start, goal)
+                pos, walked = start, 0
+                while pos != goal and walked < 200:
+                    pos = paths.next_step(7, pos, goal)
+                    if pos is None:
+                        break
+                    walked += 1
+                if route is None:
+                    self.assertIsNone(pos)
+                else:
+                    self.assertEqual((pos, walked), (goal, len(route) - 1))
+
+    def test_budget_and_lazy_rebuild(self) -> None:
+        paths = PathFinder(10, 6, 1, field_budget=2, block_workshops=True)
+        goals = [(9, 5, 0), (0, 5, 0), (5, 0, 0)]
+        for goal in goals:
+            warm(paths, goal)
+        self.assertEqual(list(paths._fields), goals[1:])
+        built = paths.fields_built
+        paths.reset([Workshop(id=1, kind="mason", x=3, y=3, z=0, built=True)])
+        self.assertEqual(paths.fields_built, built)
+        self.assertEqual(paths.next_step(1, (0, 3, 0), (0, 5, 0)), (0, 4, 0))
+        self.assertEqual(paths.fields_built, built + 1)
+
+    def test_shared_fields_in_a_running_game(self) -> None:
+        g = Game(rng_seed=41)
+        for _ in range(5):
+            g.add_dwarf()
+        g.handle_command("stockpile food 20 10 0 3 3")
+        g.handle_command("build workshop kitchen 11 7 0")
+        g.tick(300)
+        self.assertGreater(g.paths.fields_built, 0)
+        self.assertLessEqual(len(g.paths._fields), g.paths.field_budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
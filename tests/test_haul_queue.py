@@ -0,0 +1,98 @@
+import unittest
+
+from fortress.engine import Game
+
+
+class HaulQueueTests(unittest.TestCase):
+    def test_queue_tracks_loose_unreserved_unstockpiled_items(self) -> None:
+        g = Game(rng_seed=651)
+        g.items = []
+        sp = g.add_stockpile("materials", 4, 4, 0, 2, 2)
+        stone = g._spawn_item("stone", 1, 1, 0, material="granite", value=1)
+        wood = g._spawn_item("wood", 1, 2, 0, material="oak", value=1)
+        self.assertEqual(len(g.haul_queue), 2)
+
+        stone.reserved_by = 1
+        self.assertEqual(g.haul_queue.heads(), [wood])
+        stone.reserved_by = None
+        stone.stockpile_id = sp.id
+        self.assertEqual(g.haul_queue.heads(), [wood])
+        stone.stockpile_id = None
+        self.assertEqual(g.haul_queue.heads(), [stone, wood])
+
+        wood.carried_by = 2
+        wood.reserved_by = 2
+        self.assertEqual(len(g.haul_queue), 1)
+        d = g.dwarves[0]
+        job = g._new_job(kind="haul", labor="haul", item_id=wood.id, target_id=sp.id)
+        wood.reserved_by = d.id
+        wood.carried_by = d.id
+        g._release_job_item(d, job)
+        self.assertEqual(len(g.haul_queue), 2)
+
+    def test_candidate_skips_kinds_without_a_stockpile(self) -> None:
+        g = Game(rng_seed=652)
+        g.items = []
+        sp = g.add_stockpile("materials", 4, 4, 0, 2, 2)
+        g._spawn_item("craft_good", 1, 1, 0, value=3)
+        g._spawn_item("craft_good", 1, 2, 0, value=3)
+        stone = g._spawn_item("stone", 1, 3, 0, material="granite", value=1)
+        g._spawn_item("stone", 1, 4, 1, material="granite", value=1)
+        item, stock, container = g._find_haul_candidate()
+        self.assertIs(item, stone)
+        self.assertIs(stock, sp)
+        self.assertIsNone(container)
+
+    def test_hauling_drains_queue(self) -> None:
+        g = Game(rng_seed=653)
+        g.add_stockpile("general", 8, 8, 0, 5, 5)
+        g.tick(150)
+        waiting = [
+            i
+            for i in g.items
+            if i.reserved_by is None and i.carried_by is None and i.stockpile_id is None and i.container_id is None
+        ]
+        self.assertEqual(len(g.haul_queue), len(waiting))
+        self.assertTrue(all(head in waiting for head in g.haul_queue.heads()))
+        self.assertTrue(any(i.stockpile_id is not None for i in g.items))
+
+    def test_container_orders_match_a_scan_of_every_loose_item(self) -> None:
+        def setup() -> Game:
+            g = Game(rng_seed=654)
+            g.items = []
+            g.workshops = []
+            g.queue_build_workshop("carpenter", 20, 12, 0).built = True
+            for kind, x in (("raw", 2), ("food", 4), ("materials", 6)):
+                sp = g.add_stockpile(kind, x, 2, 0, 1, 1)
+                filler = g._spawn_item("seed" if kind != "materials" else "stone", x, 2, 0, value=1)
+                filler.stockpile_id = sp.id
+            g.add_stockpile("goods", 8, 2, 0, 2, 2)
+            for kind in ("raw_food", "stone", "raw_food", "raw_food", "stone", "craft_good", "stone"):
+                g._spawn_item(kind, 12, 12, 0, value=1)
+            g.tick_count = 40
+            return g
+
+        reference = setup()
+        picked = None
+        for item in list(reference.items):
+            if item.reserved_by is None and item.carried_by is None and item.stockpile_id is None and item.container_id is None:
+                stock, _ = reference._find_stockpile_for_item(item)
+                if stock:
+                    picked = item
+                    break
+        g = setup()
+        item, stock, _ = g._find_haul_candidate()
+        self.assertEqual((item.id, item.kind), (picked.id, "craft_good"))
+        orders = [dict(ws.orders) for ws in g.workshops]
+        self.assertEqual(orders, [dict(ws.orders) for ws in reference.workshops])
+        self.assertEqual(orders, [{"barrel": 2, "bin": 2}])
+        self.assertEqual([(e.template, e.data) for e in g.events], [(e.template, e.data) for e in reference.events])
+        g.tick_count = 41
+        for ws in g.workshops:
+            ws.orders.clear()
+        self.assertIs(g._find_haul_candidate()[0], item)
+        self.assertEqual(g.workshops[0].orders, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+
+from fortress.engine import Game
+
+
+def kitchen_game(seed: int):
+    g = Game(rng_seed=seed)
+    ws = g.queue_build_workshop("kitchen_advanced", 10, 10, 0)
+    ws.built = True
+    g.jobs.clear()
+    cook = g.dwarves[0]
+    cook.allowed_labors = {"cook"}
+    for key in list(cook.needs):
+        cook.needs[key] = 0
+    cook.stress = 0
+    return g, ws, cook
+
+
+class InputReservationTests(unittest.TestCase):
+    def test_reservation_is_all_or_nothing(self) -> None:
+        g, ws, cook = kitchen_game(221)
+        g.order_workshop(ws.id, "preserves", 1)
+        reserved_before = [i.id for i in g.items if i.reserved_by is not None]
+        self.assertIsNone(g.inventory.reserve_free({"raw_food": 1, "alcohol": 1}, cook.id))
+        job = g._assign_job(cook)
+        self.assertNotEqual(job.kind, "workshop_task")
+        self.assertEqual([i.id for i in g.items if i.reserved_by is not None], reserved_before)
+        self.assertEqual(ws.orders["preserves"], 1)
+
+    def test_completion_consumes_exactly_the_reserved_inputs(self) -> None:
+        g, ws, cook = kitchen_game(222)
+        g.order_workshop(ws.id, "stew", 1)
+        raw = sorted(i.id for i in g.items if i.kind == "raw_food")
+        g._find_item_by_id(raw[0]).reserved_by = g.dwarves[1].id
+        job = g._assign_job(cook)
+        self.assertEqual((job.kind, job.reserved_ids, job.item_id), ("workshop_task", raw[1:3], raw[1]))
+        self.assertTrue(all(g._find_item_by_id(i).reserved_by == cook.id for i in raw[1:3]))
+        g._find_item_by_id(raw[0]).reserved_by = None
+        cook.job = job
+        job.phase, job.remaining = "crafting", 1
+        g._perform_workshop_task_step(cook, job)
+        self.assertIsNone(cook.job)
+        self.assertEqual(sorted(i.id for i in g.items if i.kind == "raw_food"), [raw[0], raw[3]])
+
+    def test_released_jobs_free_every_input_and_round_trip(self) -> None:
+        g, ws, cook = kitchen_game(223)
+        g._spawn_item("alcohol", 3, 3, 0, material="ale", value=2)
+        g.order_workshop(ws.id, "preserves", 2)
+        job = g._assign_job(cook)
+        self.assertEqual(len(job.reserved_ids), 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            cook.job = job
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual(loaded.dwarves[0].job.reserved_ids, job.reserved_ids)
+        g._release_job_item(cook, job)
+        self.assertTrue(all(g._find_item_by_id(i).reserved_by is None for i in job.reserved_ids))
+        self.assertEqual(g.inventory.free_count("alcohol"), 1)
+
+    def test_saves_without_reserved_ids_recover_the_inputs(self) -> None:
+        g, ws, cook = kitchen_game(224)
+        g.order_workshop(ws.id, "stew", 1)
+        job = g._assign_job(cook)
+        cook.job = job
+        stray = g._spawn_item("timber", 3, 3, 0)
+        stray.reserved_by = cook.id
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for dd in data["dwarves"]:
+                if dd["job"]:
+                    del dd["job"]["reserved_ids"]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            loaded = Game.load_json(path)
+        cook = loaded.dwarves[0]
+        self.assertEqual(sorted(cook.job.reserved_ids), sorted(job.reserved_ids))
+        cook.job.phase, cook.job.remaining = "crafting", 1
+        loaded._perform_workshop_task_step(cook, cook.job)
+        self.assertTrue(all(loaded._find_item_by_id(i) is None for i in job.reserved_ids))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
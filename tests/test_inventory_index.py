@@ -0,0 +1,57 @@
+import unittest
+
+from fortress.engine import Game
+
+
+def scan_first_free(g: Game, kind: str):
+    return next((i for i in g.items if i.kind == kind and i.reserved_by is None and i.carried_by is None), None)
+
+
+class InventoryIndexTests(unittest.TestCase):
+    def test_counts_follow_spawn_consume_and_spoilage(self) -> None:
+        g = Game(rng_seed=611)
+        base_raw = g.raw_food
+        meal = g._spawn_item("raw_food", 6, 6, 0, material="wild-herb", perishability=100, value=1)
+        self.assertEqual(g.raw_food, base_raw + 1)
+        self.assertEqual(g._count_item_kind("raw_food"), base_raw + 1)
+
+        g._consume_item(meal.id)
+        self.assertEqual(g.raw_food, base_raw)
+
+        rotten = g._spawn_item("berry", 6, 6, 0, material="wild-berry", perishability=50, value=1)
+        rotten.age = 200
+        g.rng.random = lambda: 0.0
+        g._item_tick()
+        self.assertEqual(g._count_item_kind("berry"), 0)
+        self.assertEqual(g._available_food_items(), sum(1 for i in g.items if i.kind in {"raw_food", "cooked_food", "berry", "herb", "rare_plant"}))
+
+    def test_first_free_matches_list_scan_under_reservations(self) -> None:
+        g = Game(rng_seed=612)
+        first, second = [i for i in g.items if i.kind == "raw_food"][:2]
+        self.assertIs(g._find_item("raw_food"), first)
+
+        first.reserved_by = 1
+        self.assertIs(g._find_item("raw_food"), second)
+        second.carried_by = 2
+        self.assertIs(g._find_item("raw_food"), scan_first_free(g, "raw_food"))
+
+        first.reserved_by = None
+        self.assertIs(g._find_item("raw_food"), first)
+        first.kind = "flour"
+        self.assertIs(g._find_item("flour"), first)
+        self.assertIs(g._find_item("raw_food"), scan_first_free(g, "raw_food"))
+
+    def test_index_survives_list_reassignment_and_ticks(self) -> None:
+        g = Game(rng_seed=613)
+        g.items = [i for i in g.items if i.kind != "raw_food"]
+        self.assertEqual(g.raw_food, 0)
+        self.assertIsNone(g._find_item("raw_food"))
+        g.add_stockpile("raw", 8, 8, 0, 4, 3)
+        g.tick(120)
+        for kind in {i.kind for i in g.items} | {"raw_food", "alcohol"}:
+            self.assertEqual(g._count_item_kind(kind), sum(1 for i in g.items if i.kind == kind))
+            self.assertIs(g._find_item(kind), scan_first_free(g, kind))
+
+
+if __name__ == "__main__":
+    unittest.main()
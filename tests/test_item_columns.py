@@ -0,0 +1,70 @@
+import unittest
+from dataclasses import asdict
+
+from fortress.columns import numpy_available
+from fortress.engine import Game
+
+
+def scenario(columnar: bool) -> Game:
+    g = Game(rng_seed=681, columnar_items=columnar)
+    g.add_zone("recreation", 5, 5, 0, 3, 3)
+    g.add_stockpile("raw", 8, 8, 0, 4, 3)
+    barrel = g._spawn_item("barrel", 9, 9, 0, material="oak", value=2)
+    for n in range(30):
+        item = g._spawn_item("raw_food" if n % 3 else "stone", 2 + n % 20, 3 + n % 7, 0, perishability=40 + n, value=1)
+        if n % 5 == 0:
+            item.container_id = barrel.id
+    g.world.weather = "rain"
+    g.world.temperature_c = 26
+    g.tick(120)
+    return g
+
+
+@unittest.skipUnless(numpy_available(), "numpy not installed")
+class ItemColumnsTests(unittest.TestCase):
+    def test_columnar_tick_matches_scalar_tick(self) -> None:
+        scalar, columnar = scenario(False), scenario(True)
+        self.assertIsNotNone(columnar.item_columns)
+        self.assertEqual([asdict(i) for i in columnar.items], [asdict(i) for i in scalar.items])
+        self.assertEqual(columnar.rng.random(), scalar.rng.random())
+
+    def test_age_reads_and_writes_go_through_the_row(self) -> None:
+        g = Game(rng_seed=682, columnar_items=True)
+        item = g._spawn_item("raw_food", 6, 6, 0, material="wild-herb", perishability=100, value=1)
+        item.age = 120
+        self.assertEqual(g.item_columns.get(item, "age"), 120)
+        g.rng.random = lambda: 0.0
+        g._item_tick()
+        self.assertIsNone(g._find_item_by_id(item.id))
+        self.assertEqual(item.age, 121)
+        self.assertIsNone(item._columns)
+
+    def test_shelter_and_containment_masks(self) -> None:
+        g = Game(rng_seed=683, depth=3, columnar_items=True)
+        g.add_zone("recreation", 5, 5, 0, 3, 3)
+        g._refresh_rooms_and_assignments()
+        barrel = g._spawn_item("barrel", 1, 1, 0, material="oak", value=2)
+        roofed = g._spawn_item("raw_food", 6, 6, 0, perishability=100, value=1)
+        underground = g._spawn_item("raw_food", 6, 6, 1, perishability=100, value=1)
+        contained = g._spawn_item("raw_food", 1, 1, 0, perishability=100, value=1)
+        contained.container_id = barrel.id
+        outdoors = g._spawn_item("raw_food", 12, 12, 0, perishability=100, value=1)
+        for item in (roofed, underground, contained, outdoors):
+            item.age = 500
+        g.rng.random = lambda: 0.0
+        g._item_tick()
+        self.assertEqual([i.id for i in (roofed, underground, contained) if g._find_item_by_id(i.id)], [roofed.id, underground.id, contained.id])
+        self.assertIsNone(g._find_item_by_id(outdoors.id))
+
+
+class ItemColumnsFallbackTests(unittest.TestCase):
+    def test_scalar_store_by_default(self) -> None:
+        g = Game(rng_seed=684)
+        self.assertIsNone(g.item_columns)
+        item = g._spawn_item("stone", 1, 1, 0)
+        item.age = 5
+        self.assertEqual(asdict(item)["age"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
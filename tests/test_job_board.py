@@ -0,0 +1,98 @@
+import os
+import random
+import tempfile
+import unittest
+
+from fortress.engine import Game
+
+
+def reference_pop(g: Game, dwarf, labor: str):
+    candidates = [j for j in g.jobs if j.labor == labor and g._can_reach(dwarf, j.destination)]
+    return min(candidates, key=lambda j: j.id) if candidates else None
+
+
+class JobBoardTests(unittest.TestCase):
+    def test_pops_match_the_list_scan(self) -> None:
+        r = random.Random(20)
+        g = Game(rng_seed=201)
+        g.paths.add_stairs(8, 8, 0, 1)
+        for _ in range(300):
+            g.queue_dig(r.randrange(g.width), r.randrange(g.height), r.randrange(g.depth), 0)
+        dwarf = g.dwarves[0]
+        for _ in range(400):
+            dwarf.pos = (r.randrange(g.width), r.randrange(g.height), r.randrange(2))
+            expected = reference_pop(g, dwarf, "mine")
+            job = g._pop_global_job_for_labor(dwarf, "mine")
+            self.assertIs(job, expected)
+            if job is not None:
+                self.assertNotIn(job.id, g.jobs.by_id)
+        dwarf.pos = (0, 0, 0)
+        self.assertIsNone(g._pop_global_job_for_labor(dwarf, "mine"))
+        self.assertEqual(g.job_board.depth("mine"), len(g.jobs))
+        self.assertTrue(all(j.destination[2] == 2 for j in g.jobs))
+
+    def test_released_and_cancelled_jobs(self) -> None:
+        g = Game(rng_seed=202)
+        ws = g.queue_build_workshop("mason", 10, 10, 0)
+        g.queue_dig(4, 4, 0, 1)
+        builder = g.dwarves[0]
+        job = g._pop_global_job_for_labor(builder, "build")
+        builder.job = job
+        self.assertEqual(g.job_board.depth("build"), 0)
+        g.handle_command(f"forbid {builder.id} build")
+        g._perform_job_step(builder)
+        self.assertIsNone(builder.job)
+        self.assertIn(job.id, g.jobs.by_id)
+        self.assertEqual(g.job_board.depth("build"), 1)
+        self.assertEqual(g.handle_command(f"cancel job {job.id}"), f"cancelled job [{job.id}] build_workshop")
+        self.assertIsNone(g._find_workshop(ws.id))
+        self.assertEqual([j.kind for j in g.jobs], ["dig_stairs"])
+        miner = g.dwarves[1]
+        miner.job = g._pop_global_job_for_labor(miner, "mine")
+        miner.hp = 0
+        g._update_dwarf_mood(miner)
+        self.assertIsNone(miner.job)
+        self.assertEqual(g.job_board.depth("mine"), 1)
+
+    def test_panel_and_save_round_trip(self) -> None:
+        g = Game(rng_seed=203)
+        for x in range(3):
+            g.queue_dig(x + 5, 5, 0, 1)
+        g.tick_count += 4
+        g.queue_dig(12, 5, 1, 0)
+        panel = g.panel("jobs")
+        self.assertIn("mine: queued=4 oldest_wait=4 mean_wait=0.0", panel)
+        g.tick(3)
+        self.assertIn("mean_wait=", g.panel("jobs"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual(len(loaded.job_board), len(g.jobs))
+        self.assertEqual([j.id for j in loaded.jobs], [j.id for j in g.jobs])
+
+    def test_jobs_on_cut_off_levels_are_not_examined(self) -> None:
+        g = Game(rng_seed=204)
+        for i in range(500):
+            g.queue_dig(i % g.width, (i // g.width) % g.height, 1, 2)
+        g.queue_dig(4, 4, 0, 1)
+        examined = []
+
+        def accept(job) -> bool:
+            examined.append(job.id)
+            return False
+
+        dwarf = g.dwarves[0]
+        self.assertEqual(g.paths.reachable_levels(dwarf.pos), {0})
+        self.assertIsNone(g.job_board.take("mine", accept, g.paths.reachable_levels(dwarf.pos)))
+        self.assertEqual(len(examined), 1)
+        job = g._pop_global_job_for_labor(dwarf, "mine")
+        self.assertEqual(job.destination, (4, 4, 0))
+        self.assertIsNone(g._pop_global_job_for_labor(dwarf, "mine"))
+        self.assertEqual(g.job_board.depth("mine"), 500)
+        g.paths.add_stairs(4, 4, 0, 1)
+        self.assertEqual(g._pop_global_job_for_labor(dwarf, "mine").destination, (0, 0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
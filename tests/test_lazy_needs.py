@@ -0,0 +1,129 @@
+import copy
+import os
+import random
+import tempfile
+import unittest
+from dataclasses import asdict
+
+from fortress.engine import Game
+
+
+class EagerNeedsGame(Game):
+    # Reference: needs kept as plain dicts and advanced one pass at a time.
+    def _build_indexes(self) -> None:
+        super()._build_indexes()
+        self.dwarves.listeners.remove(self.needs_clock)
+        self.needs_clock.reset(())
+
+    def _update_needs_moods_stress(self) -> None:
+        for d in self.dwarves:
+            if d.hp <= 0:
+                continue
+            self._update_dwarf_needs(d)
+
+
+def colony(cls: type, seed: int) -> Game:
+    g = cls(rng_seed=seed)
+    r = random.Random(seed)
+    for _ in range(40):
+        d = g.add_dwarf()
+        for key in list(d.needs):
+            d.needs[key] = r.randint(40, 100)
+        for key in list(d.nutrition):
+            d.nutrition[key] = r.randint(60, 100)
+        d.stress = r.randint(0, 100)
+        d.hp = r.randint(1, 100)
+        d.alcohol_dependency = r.randint(20, 95)
+    for t in range(240):
+        g.tick_count += 1 if t != 120 else 7
+        g.world.raid_active = (t // 50) % 2 == 1
+        g._update_needs_moods_stress()
+        d = g.dwarves[r.randrange(len(g.dwarves))]
+        if t % 3 == 0:
+            d.needs["hunger"] = clamp_down(d.needs["hunger"], r.randint(0, 60))
+        if t % 7 == 0:
+            d.nutrition = {"protein": 20, "fiber": r.randint(0, 100), "variety": 50}
+        if t % 11 == 0:
+            d.alcohol_dependency = r.randint(20, 95)
+        if t % 13 == 0:
+            d.hp = 0 if d.hp > 0 else 40
+    return g
+
+
+def clamp_down(value: int, amount: int) -> int:
+    return max(0, value - amount)
+
+
+def outcome(g: Game) -> tuple:
+    return (
+        [asdict(d) for d in g.dwarves],
+        [(e.tick, e.kind, e.text) for e in g.events],
+        g.rng.random(),
+    )
+
+
+class LazyNeedsTests(unittest.TestCase):
+    def test_lazy_pass_matches_eager_pass(self) -> None:
+        for seed in (811, 812):
+            eager, lazy = colony(EagerNeedsGame, seed), colony(Game, seed)
+            self.assertIsInstance(eager.dwarves[0].needs, dict)
+            self.assertNotIsInstance(lazy.dwarves[0].needs, dict)
+            self.assertEqual(outcome(lazy), outcome(eager))
+
+    def test_full_runs_match_eager_pass(self) -> None:
+        eager, lazy = EagerNeedsGame(rng_seed=813), Game(rng_seed=813)
+        for g in (eager, lazy):
+            g.handle_command("zone dormitory 12 10 0 6 3")
+            g.handle_command("stockpile food 8 8 0 4 3")
+            g.tick(300)
+        self.assertEqual(outcome(lazy), outcome(eager))
+
+    def test_flags_wake_when_a_need_crosses_a_threshold(self) -> None:
+        g = Game(rng_seed=814)
+        g.world.raid_active = False
+        d = g.dwarves[0]
+        for key in list(d.needs):
+            d.needs[key] = 10
+        d.needs["hunger"] = 80
+        g.tick_count = 100
+        g._update_needs_moods_stress()
+        clock = g.needs_clock
+        # hunger rises every 2 ticks: 81 at tick 100, 90 at tick 118
+        self.assertEqual(d.needs["hunger"], 81)
+        self.assertEqual(clock._wake[d.id], 118)
+        self.assertEqual(clock._flags[d.id][5], 0)
+        for _ in range(18):
+            g.tick_count += 1
+            g._update_needs_moods_stress()
+        self.assertEqual(d.needs["hunger"], 90)
+        self.assertEqual(clock._flags[d.id][5], 1)
+
+    def test_needs_read_as_views(self) -> None:
+        g = Game(rng_seed=815)
+        d = g.dwarves[0]
+        g.tick(10)
+        d.needs["hunger"] = 77
+        self.assertEqual(g.handle_command(f"set need {d.id} thirst 88"), f"set dwarf {d.id} need thirst=88")
+        self.assertEqual(copy.deepcopy(d.needs), dict(d.needs))
+        self.assertEqual(repr(d.nutrition), repr(dict(d.nutrition)))
+        self.assertEqual(asdict(d)["needs"]["hunger"], 77)
+        self.assertIn("hu=77,th=88", g.status())
+        g.dwarves.remove(d)
+        self.assertIsInstance(d.needs, dict)
+        self.assertEqual((d.needs["hunger"], d.needs["thirst"]), (77, 88))
+
+    def test_save_round_trip(self) -> None:
+        g = Game(rng_seed=816)
+        g.tick(30)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual([dict(d.needs) for d in loaded.dwarves], [dict(d.needs) for d in g.dwarves])
+        loaded.tick(5)
+        g.tick(5)
+        self.assertEqual([dict(d.needs) for d in loaded.dwarves], [dict(d.needs) for d in g.dwarves])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from collections import deque
+
+from fortress.engine import Game
+from fortress.models import Workshop
+from fortress.pathing import PLANE_STEPS, PathFinder
+
+
+def bfs_length(paths: PathFinder, start: tuple, goal: tuple) -> int:
+    seen = {start: 0}
+    queue = deque([start])
+    while queue:
+        pos = queue.popleft()
+        if pos == goal:
+            return seen[pos]
+        x, y, z = pos
+        moves = [(x + dx, y + dy, z) for dx, dy in PLANE_STEPS]
+        if (x, y, z) in paths.stairs:
+            moves.append((x, y, z + 1))
+        if (x, y, z - 1) in paths.stairs:
+            moves.append((x, y, z - 1))
+        for nxt in moves:
+            if nxt in seen or not paths.in_bounds(nxt):
+                continue
+            if nxt != goal and not paths.is_walkable(nxt):
+                continue
+            seen[nxt] = seen[pos] + 1
+            queue.append(nxt)
+    return -1
+
+
+class PathFinderTests(unittest.TestCase):
+    def test_open_ground_route_is_the_greedy_line(self) -> None:
+        paths = PathFinder(10, 8, 2)
+        self.assertEqual(paths.route((0, 0, 0), (4, 2, 0)), ((0, 0, 0), (1, 1, 0), (2, 2, 0), (3, 2, 0), (4, 2, 0)))
+        paths.route((0, 0, 0), (4, 2, 0))
+        self.assertEqual((paths.hits, paths.misses), (1, 1))
+        self.assertIsNone(paths.route((0, 0, 0), (4, 2, 1)))
+
+    def test_routes_are_shortest_around_workshops_and_through_stairs(self) -> None:
+        r = random.Random(5)
+        paths = PathFinder(14, 9, 3, block_workshops=True)
+        workshops = [Workshop(id=i, kind="mason", x=r.randrange(14), y=r.randrange(9), z=r.randrange(3), built=True) for i in range(70)]
+        paths.reset(workshops)
+        paths.add_stairs(3, 3, 0, 2)
+        paths.add_stairs(11, 6, 1, 2)
+        for _ in range(200):
+            start = (r.randrange(14), r.randrange(9), r.randrange(3))
+            goal = (r.randrange(14), r.randrange(9), r.randrange(3))
+            route = paths.route(start, goal)
+            expected = bfs_length(paths, start, goal)
+            if route is None:
+                self.assertEqual(expected, -1)
+                continue
+            self.assertEqual(len(route) - 1, expected)
+            self.assertEqual((route[0], route[-1]), (start, goal))
+            for a, b in zip(route, route[1:]):
+                if a[2] == b[2]:
+                    self.assertLessEqual(max(abs(a[0] - b[0]), abs(a[1] - b[1])), 1)
+                else:
+                    self.assertEqual(a[:2], b[:2])
+                    self.assertIn((a[0], a[1], min(a[2], b[2])), paths.stairs)
+            for tile in route[1:-1]:
+                self.assertTrue(paths.is_walkable(tile))
+
+    def test_grid_changes_invalidate_cached_routes(self) -> None:
+        g = Game(rng_seed=17, blocking_workshops=True)
+        line = g.paths.route((0, 5, 0), (6, 5, 0))
+        self.assertIn((3, 5, 0), line)
+        ws = g.queue_build_workshop("mason", 3, 5, 0)
+        self.assertEqual(g.paths.route((0, 5, 0), (6, 5, 0)), line)
+        ws.built = True
+        detour = g.paths.route((0, 5, 0), (6, 5, 0))
+        self.assertNotIn((3, 5, 0), detour)
+        self.assertEqual(len(detour), len(line))
+        g.workshops.remove(ws)
+        self.assertEqual(g.paths.route((0, 5, 0), (6, 5, 0)), line)
+
+    def test_workshops_are_walkable_by_default(self) -> None:
+        g = Game(rng_seed=17)
+        line = g.paths.route((0, 5, 0), (6, 5, 0))
+        g.queue_build_workshop("mason", 3, 5, 0).built = True
+        self.assertTrue(g.paths.is_walkable((3, 5, 0)))
+        self.assertEqual(g.paths.route((0, 5, 0), (6, 5, 0)), line)
+
+    def test_dwarves_use_dug_stairs(self) -> None:
+        g = Game(rng_seed=18)
+        d = g.dwarves[0]
+        for other in g.dwarves[1:]:
+            other.allowed_labors = set()
+        g.queue_dig(5, 5, 0, 1)
+        for _ in range(60):
+            g.tick()
+            if (5, 5, 0) in g.paths.stairs:
+                break
+        self.assertIn((5, 5, 0), g.paths.stairs)
+        d.pos = (9, 9, 1)
+        g.jobs.clear()
+        d.job = None
+        d.allowed_labors = set()
+        seen = []
+        for _ in range(12):
+            g._step_move_toward(d, (1, 1, 0))
+            seen.append(d.pos)
+        self.assertIn((5, 5, 1), seen)
+        self.assertIn((5, 5, 0), seen)
+        self.assertEqual(d.pos, (1, 1, 0))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual(loaded.paths.stairs, g.paths.stairs)
+
+    def test_saves_without_stairs_keep_occupied_levels_connected(self) -> None:
+        g = Game(rng_seed=18)
+        g.dwarves[0].pos = (5, 5, 1)
+        g.queue_build_workshop("mason", 8, 2, 2).built = True
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            del data["stairs"]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            loaded = Game.load_json(path)
+        self.assertEqual(loaded.paths.stairs, {(5, 5, 0), (8, 2, 0), (8, 2, 1)})
+        self.assertEqual(loaded.paths.reachable_levels((5, 5, 1)), {0, 1, 2})
+
+    def test_unreachable_levels_are_not_entered(self) -> None:
+        g = Game(rng_seed=19, blocking_workshops=True)
+        stash = []
+        for _ in range(4):
+            stash.append(g._spawn_item("cooked_food", 4, 4, 2, value=2, perishability=150))
+            stash.append(g._spawn_item("alcohol", 4, 5, 2, value=2, perishability=150))
+        for d in g.dwarves:
+            d.needs["hunger"] = 90
+            d.needs["thirst"] = 90
+        levels = set()
+        for _ in range(40):
+            g.tick()
+            for d in g.dwarves:
+                levels.add(d.z)
+            self.assertTrue(all(i.carried_by is None for i in stash))
+        self.assertEqual(levels, {0})
+        for dx, dy in PLANE_STEPS:
+            g.queue_build_workshop("mason", 10 + dx, 10 + dy, 0).built = True
+        d = g.dwarves[0]
+        d.pos = (12, 12, 0)
+        self.assertFalse(g._step_move_toward(d, (10, 10, 0)))
+        self.assertFalse(g._step_move_toward(d, (4, 4, 2)))
+        self.assertEqual(d.pos, (12, 12, 0))
+        self.assertTrue(g._step_move_toward(d, (40, 12, 5)))
+        self.assertEqual(d.pos, (13, 12, 0))
+
+    def test_stairs_are_dug_at_the_designated_tile(self) -> None:
+        g = Game(rng_seed=3)
+        g.queue_dig(31, 15, 0, 1)
+        job = g.jobs[0]
+        miner = None
+        for _ in range(80):
+            g.tick()
+            miner = miner or next((d for d in g.dwarves if d.job is job), None)
+            if g.paths.stairs:
+                break
+        self.assertEqual(g.paths.stairs, {(31, 15, 0)})
+        self.assertEqual(miner.pos, (31, 15, 1))
+        self.assertTrue(g.paths.reachable((0, 0, 0), (5, 5, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+from typing import Optional, Tuple
+
+from fortress.engine import Game
+from fortress.models import Workshop
+
+
+def reference_pick(g: Game, dwarf) -> Tuple[Optional[int], Optional[str]]:
+    # The previous full scan over every workshop.
+    candidates = [w for w in g.workshops if w.built and w.z == dwarf.z and any(c > 0 for c in w.orders.values())]
+    scored = []
+    for ws in candidates:
+        labor = g._labor_for_workshop(ws.kind)
+        if g._labor_allowed(dwarf, labor):
+            scored.append((dwarf.labor_priority.get(labor, 3), ws))
+    if not scored:
+        return None, None
+    scored.sort(key=lambda t: (t[0], -sum(t[1].orders.values())), reverse=True)
+    ordered = [ws for _, ws in scored]
+    start = g.workshop_dispatch_cursor % len(ordered)
+    ws = (ordered[start:] + ordered[:start])[0]
+    return ws.id, next(r for r, c in ws.orders.items() if c > 0)
+
+
+class ReadyWorkshopTests(unittest.TestCase):
+    def test_dispatch_matches_full_scan(self) -> None:
+        r = random.Random(21)
+        g = Game(rng_seed=211)
+        kinds = ["kitchen", "brewery", "carpenter", "mason", "butcher", "apothecary", "loom"]
+        for i in range(40):
+            g.workshops.append(Workshop(id=100 + i, kind=r.choice(kinds), x=r.randrange(g.width), y=r.randrange(g.height), z=r.randrange(2)))
+        for dwarf in g.dwarves:
+            dwarf.labor_priority.update({labor: r.randint(0, 5) for labor in dwarf.labor_priority})
+        for _ in range(500):
+            ws = g.workshops[r.randrange(len(g.workshops))]
+            roll = r.random()
+            if roll < 0.2:
+                ws.built = not ws.built
+            elif roll < 0.6 and ws.built:
+                recipe = r.choice(sorted(g.defs["recipes"][ws.kind]))
+                g.order_workshop(ws.id, recipe, r.randint(1, 3))
+            dwarf = r.choice(g.dwarves)
+            dwarf.z = r.randrange(2)
+            expected = reference_pick(g, dwarf)
+            ws, recipe = g._find_ordered_workshop_for_dwarf(dwarf)
+            self.assertEqual((ws.id if ws else None, recipe), expected)
+        self.assertEqual(
+            sorted(ws.id for z in range(2) for _, ws in g.ready_workshops.at(z)),
+            [w.id for w in g.workshops if w.built and any(c > 0 for c in w.orders.values())],
+        )
+
+    def test_round_robin_shares_equal_workshops(self) -> None:
+        g = Game(rng_seed=212)
+        dwarf = g.dwarves[0]
+        shops = []
+        for x in (4, 8, 12):
+            ws = g.queue_build_workshop("carpenter", x, 12, 0)
+            ws.built = True
+            g.order_workshop(ws.id, "bed", 5)
+            shops.append(ws)
+        picked = [g._find_ordered_workshop_for_dwarf(dwarf)[0].id for _ in range(6)]
+        self.assertEqual(sorted(picked), sorted([ws.id for ws in shops] * 2))
+        self.assertEqual(sum(sum(ws.orders.values()) for ws in shops), 9)
+        g.workshops.remove(shops[0])
+        self.assertNotIn(shops[0], [ws for _, ws in g.ready_workshops.at(0)])
+        shops[1].orders["bed"] = 1
+        g._find_ordered_workshop_for_dwarf(dwarf)
+        g._find_ordered_workshop_for_dwarf(dwarf)
+        self.assertEqual([ws.id for _, ws in g.ready_workshops.at(0)], [shops[2].id])
+
+
+if __name__ == "__main__":
+    unittest.main()
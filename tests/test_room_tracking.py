@@ -0,0 +1,67 @@
+import unittest
+
+from fortress.engine import Game
+
+
+def room_snapshot(g: Game) -> tuple:
+    rooms = [(r.id, r.kind, r.x, r.y, r.z, r.w, r.h, r.value, r.bed_item_id, r.assigned_dwarf_id) for r in g.rooms]
+    return rooms, [(d.id, d.assigned_room_id) for d in g.dwarves]
+
+
+class RoomTrackingTests(unittest.TestCase):
+    def test_refresh_is_skipped_until_a_room_zone_changes(self) -> None:
+        g = Game(rng_seed=661)
+        g.add_zone("dormitory", 12, 10, 0, 6, 3)
+        g._refresh_rooms_and_assignments()
+        rooms = g.rooms
+        g._spawn_item("stone", 2, 2, 0, material="granite", value=1)
+        g._refresh_rooms_and_assignments()
+        self.assertIs(g.rooms, rooms)
+
+        bed = g._spawn_item("bed", 13, 11, 0, material="oak", value=4)
+        self.assertTrue(g.room_tracker.needs_refresh())
+        g._refresh_rooms_and_assignments()
+        self.assertEqual([(r.kind, r.bed_item_id) for r in g.rooms], [("bedroom", bed.id)])
+        self.assertEqual(g.rooms[0].assigned_dwarf_id, g.dwarves[0].id)
+
+        bed.carried_by = g.dwarves[1].id
+        g._refresh_rooms_and_assignments()
+        self.assertEqual([r.kind for r in g.rooms], ["dormitory"])
+
+    def test_zone_and_dwarf_changes_force_rebuild(self) -> None:
+        g = Game(rng_seed=662)
+        zone = g.add_zone("recreation", 5, 5, 0, 3, 3)
+        g._refresh_rooms_and_assignments()
+        self.assertFalse(g.room_tracker.needs_refresh())
+        zone.w = 5
+        g._refresh_rooms_and_assignments()
+        self.assertEqual((g.rooms[0].w, g.rooms[0].kind), (5, "hall"))
+        g.handle_command("add dwarf")
+        g._refresh_rooms_and_assignments()
+        self.assertEqual(g.dwarves[-1].assigned_room_id, g.rooms[0].id)
+
+    def test_incremental_rooms_match_full_rebuild(self) -> None:
+        g = Game(rng_seed=663)
+        g.add_zone("dormitory", 12, 10, 0, 6, 3)
+        g.add_zone("recreation", 20, 1, 0, 5, 3)
+        g.add_stockpile("materials", 1, 12, 0, 8, 3)
+        beds = [g._spawn_item("bed", 12 + n, 10, 0, material="oak", value=4 + n) for n in range(3)]
+        steps = [
+            lambda: g._spawn_item("chair", 21, 2, 0, material="oak", value=3),
+            lambda: g._spawn_item("artifact", 13, 10, 0, material="gold", value=9),
+            lambda: setattr(beds[2], "y", 14),
+            lambda: g._consume_item(beds[0].id),
+            lambda: setattr(beds[1], "quality", 3),
+            lambda: g.handle_command("add dwarf"),
+        ]
+        for step in steps:
+            step()
+            g.tick(15)
+            incremental = room_snapshot(g)
+            g.room_tracker.full = True
+            g._refresh_rooms_and_assignments()
+            self.assertEqual(room_snapshot(g), incremental)
+        self.assertEqual([r.bed_item_id for r in g.rooms if r.kind == "bedroom"], [beds[1].id])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+from dataclasses import asdict, fields, make_dataclass
+
+from fortress.engine import Game
+from fortress.models import Crime, Event, Flora, GeologyDeposit, Item, Job
+
+
+SAMPLES = {
+    Item: dict(id=1, kind="stone", x=1, y=2, z=0, material="granite", value=2),
+    Flora: dict(id=1, species_id="oak", common_name="Oak", scientific_name="Quercus", kind="tree", x=1, y=2, z=0, stage="mature"),
+    Job: dict(id=1, kind="haul", labor="haul", item_id=4, target_id=2),
+    Event: dict(tick=5, kind="trade", template="caravan_arrived", severity=1),
+    Crime: dict(id=1, tick=5, dwarf_id=2, kind="theft"),
+    GeologyDeposit: dict(id=1, x=1, y=2, z=1, kind="ore", material="hematite", rarity="common", total_yield=9, remaining_yield=9),
+}
+
+
+def unslotted(cls: type) -> type:
+    return make_dataclass(f"Dict{cls.__name__}", [(f.name, f.type, f) for f in fields(cls)])
+
+
+def bytes_per_entity(cls: type, kwargs: dict, n: int = 2000) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [cls(**kwargs) for _ in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del entities
+    return allocated / n
+
+
+class SlottedModelTests(unittest.TestCase):
+    def test_entities_have_no_instance_dict(self) -> None:
+        for cls, kwargs in SAMPLES.items():
+            entity = cls(**kwargs)
+            self.assertFalse(hasattr(entity, "__dict__"), cls.__name__)
+            self.assertEqual(cls(**asdict(entity)), entity)
+            with self.assertRaises(AttributeError):
+                entity.not_a_field = 1
+
+    def test_slotted_entities_are_smaller(self) -> None:
+        # Memory benchmark: bytes per entity, plain dataclass (`__dict__`) vs slotted.
+        rows = []
+        for cls, kwargs in SAMPLES.items():
+            before = bytes_per_entity(unslotted(cls), kwargs)
+            after = bytes_per_entity(cls, kwargs)
+            rows.append(f"{cls.__name__:<15} dict={before:7.1f} B  slots={after:7.1f} B")
+            self.assertLess(after, before, cls.__name__)
+        if os.environ.get("FORTRESS_BENCH"):
+            print("\n" + "\n".join(rows))
+
+    def test_save_load_round_trip(self) -> None:
+        g = Game(rng_seed=701)
+        g.add_stockpile("raw", 8, 8, 0, 4, 3)
+        g.tick(40)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            loaded = Game.load_json(path)
+        self.assertEqual([asdict(i) for i in loaded.items], [asdict(i) for i in g.items])
+        self.assertEqual([asdict(f) for f in loaded.floras], [asdict(f) for f in g.floras])
+        self.assertEqual([asdict(e) for e in loaded.events], [asdict(e) for e in g.events])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from fortress.engine import Game
+from fortress.spatial import SpatialGrid
+
+
+class SpatialGridTests(unittest.TestCase):
+    def test_grid_queries_match_brute_force_after_ticks(self) -> None:
+        g = Game(rng_seed=641)
+        g.add_zone("dormitory", 12, 10, 0, 6, 3)
+        g.add_stockpile("raw", 8, 8, 0, 4, 3)
+        g.tick(60)
+        for grid, entities in ((g.item_grid, g.items), (g.dwarf_grid, g.dwarves), (g.animal_grid, g.animals), (g.flora_grid, g.floras)):
+            expected = [e.id for e in entities if e.z == 0 and 3 <= e.x <= 14 and 2 <= e.y <= 9]
+            self.assertEqual([e.id for e in grid.in_rect(3, 2, 0, 12, 8)], expected)
+            self.assertEqual([e.id for e in grid.on_level(0)], [e.id for e in entities if e.z == 0])
+        for fl in g.floras:
+            expected = sum(1 for o in g.floras if o.z == fl.z and not o.dead and abs(o.x - fl.x) <= 1 and abs(o.y - fl.y) <= 1)
+            self.assertEqual(g._flora_density_at(fl.x, fl.y, fl.z, 1), expected)
+
+    def test_moves_rebucket_entities(self) -> None:
+        g = Game(rng_seed=642)
+        d = g.dwarves[0]
+        d.pos = (20, 12, 0)
+        self.assertIn(d, g.dwarf_grid.at(20, 12, 0))
+        self.assertNotIn(d, g.dwarf_grid.at(2, 2, 0))
+        g._step_move_toward(d, (25, 12, 0))
+        self.assertEqual(g.dwarf_grid.at(21, 12, 0), [d])
+
+        fl = g._spawn_flora("allium_canadense", 30, 1, 0, stage="mature")
+        assert fl is not None
+        self.assertIn(f"[{fl.id}]", g.flora_at(30, 1, 0))
+        g.floras.remove(fl)
+        self.assertEqual(g.flora_at(30, 1, 0), "no flora at tile")
+
+    def test_room_coverage_shelters_items(self) -> None:
+        g = Game(rng_seed=643)
+        item = g._spawn_item("raw_food", 6, 6, 0, material="wild-herb", perishability=100, value=1)
+        self.assertGreater(g._effective_perishability(item), 0)
+        g.add_zone("recreation", 5, 5, 0, 3, 3)
+        g._refresh_rooms_and_assignments()
+        self.assertEqual(g._effective_perishability(item), 0)
+
+    def test_radius_query_handles_map_edges(self) -> None:
+        grid = SpatialGrid(cell_size=4)
+        g = Game(rng_seed=644)
+        g.floras = []
+        g.floras.attach(grid)
+        a = g._spawn_flora("allium_canadense", 0, 0, 0)
+        b = g._spawn_flora("allium_canadense", 2, 1, 0)
+        self.assertEqual(grid.in_radius(0, 0, 0, 1), [a])
+        self.assertEqual(grid.in_radius(1, 1, 0, 1), [a, b])
+
+
+if __name__ == "__main__":
+    unittest.main()
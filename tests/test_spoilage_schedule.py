@@ -0,0 +1,63 @@
+import unittest
+from dataclasses import asdict
+
+from fortress.engine import Game
+
+
+def scan_expired(g: Game) -> list:
+    return [i.id for i in g.items if 0 < g._effective_perishability(i) < i.age]
+
+
+class SpoilageScheduleTests(unittest.TestCase):
+    def test_ages_are_lazy_but_observable(self) -> None:
+        g = Game(rng_seed=691)
+        stone = g._spawn_item("stone", 3, 3, 0, value=1)
+        stone.age = 4
+        g.rng.random = lambda: 0.99
+        for _ in range(3):
+            g._item_tick()
+        self.assertEqual(stone.age, 7)
+        self.assertEqual(asdict(stone)["age"], 7)
+        g._consume_item(stone.id)
+        g._item_tick()
+        self.assertEqual(stone.age, 7)
+        self.assertIsNone(stone._columns)
+
+    def test_expiry_follows_weather_containment_and_shelter(self) -> None:
+        g = Game(rng_seed=692)
+        g.rng.random = lambda: 0.99
+        g.world.weather, g.world.temperature_c = "clear", 10
+        barrel = g._spawn_item("barrel", 1, 1, 0, material="oak", value=2)
+        food = g._spawn_item("raw_food", 6, 6, 0, perishability=100, value=1)
+        food.age = 90
+        g._item_tick()
+        self.assertEqual(g.spoilage.advance(g._base_perishability, False, False, g.room_cover.version), [])
+        g.world.weather = "rain"
+        g._item_tick()
+        self.assertIn(food.id, scan_expired(g))
+        self.assertEqual([i.id for i in g.spoilage.advance(g._base_perishability, True, False, g.room_cover.version)], [food.id])
+
+        food.container_id = barrel.id
+        self.assertEqual(g.spoilage.advance(g._base_perishability, True, False, g.room_cover.version), [])
+        food.container_id = None
+        g.add_zone("recreation", 5, 5, 0, 3, 3)
+        g._refresh_rooms_and_assignments()
+        self.assertEqual(g.spoilage.advance(g._base_perishability, True, True, g.room_cover.version), [])
+        food.x = 12
+        self.assertEqual([i.id for i in g.spoilage.advance(g._base_perishability, True, True, g.room_cover.version)], [food.id])
+
+    def test_schedule_matches_full_scan_over_a_run(self) -> None:
+        g = Game(rng_seed=693)
+        g.add_zone("dormitory", 12, 10, 0, 6, 3)
+        g.add_stockpile("raw", 8, 8, 0, 4, 3)
+        for n in range(24):
+            g._spawn_item("raw_food", 2 + n, 3 + n % 5, 0, perishability=30 + 3 * n, value=1)
+        for _ in range(12):
+            g.tick(10)
+            scheduled = g.spoilage.advance(g._base_perishability, *g._spoilage_weather(), g.room_cover.version)
+            carried = g.inventory.carried
+            self.assertEqual([i.id for i in scheduled], [i for i in scan_expired(g) if i not in carried])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from fortress.engine import Game
+from fortress.models import is_container_kind
+
+
+def scan_drop_tile(g: Game, sp) -> tuple:
+    best, best_load = (sp.x, sp.y, sp.z), 10**9
+    for yy in range(sp.y, sp.y + sp.h):
+        for xx in range(sp.x, sp.x + sp.w):
+            load = sum(1 for i in g.items if i.stockpile_id == sp.id and i.container_id is None and (i.x, i.y, i.z) == (xx, yy, sp.z))
+            if load < best_load:
+                best, best_load = (xx, yy, sp.z), load
+    return best
+
+
+class StockpileOccupancyTests(unittest.TestCase):
+    def test_drop_tile_fills_least_loaded_tiles_in_row_order(self) -> None:
+        g = Game(rng_seed=631)
+        g.items = []
+        sp = g.add_stockpile("materials", 4, 4, 0, 2, 2)
+        chosen = []
+        for _ in range(6):
+            tile = g._choose_stockpile_drop_tile(sp)
+            chosen.append(tile)
+            stone = g._spawn_item("stone", *tile, material="granite", value=1)
+            stone.stockpile_id = sp.id
+        self.assertEqual(chosen[:4], [(4, 4, 0), (5, 4, 0), (4, 5, 0), (5, 5, 0)])
+        self.assertEqual(chosen[4:], [(4, 4, 0), (5, 4, 0)])
+        self.assertEqual(g._stockpile_used_slots(sp), 6)
+        self.assertEqual(g._stockpile_free_slots(sp), -2)
+
+        moved = next(i for i in g.items if (i.x, i.y) == (5, 5))
+        moved.carried_by = 1
+        moved.stockpile_id = None
+        self.assertEqual(g._choose_stockpile_drop_tile(sp), (5, 5, 0))
+        self.assertEqual(g._stockpile_used_slots(sp), 5)
+
+    def test_containers_use_slots_but_are_not_loose(self) -> None:
+        g = Game(rng_seed=632)
+        g.items = []
+        sp = g.add_stockpile("raw", 5, 5, 0, 2, 1)
+        bag = g._spawn_item("bag", 5, 5, 0, material="cloth", value=3)
+        bag.stockpile_id = sp.id
+        seed = g._spawn_item("seed", 6, 5, 0, material="spawn", value=1)
+        seed.stockpile_id = sp.id
+        self.assertEqual(g._stockpile_used_slots(sp), 2)
+        self.assertEqual(g._stockpile_loose_item_count(sp), 1)
+        seed.container_id = bag.id
+        self.assertEqual(g._stockpile_used_slots(sp), 1)
+        self.assertEqual(g._stockpile_loose_item_count(sp), 0)
+        self.assertEqual(g._choose_stockpile_drop_tile(sp), (6, 5, 0))
+
+    def test_occupancy_matches_scan_after_hauling(self) -> None:
+        g = Game(rng_seed=633)
+        piles = [g.add_stockpile("raw", 8, 8, 0, 3, 2), g.add_stockpile("materials", 1, 12, 0, 4, 2)]
+        for n in range(10):
+            g._spawn_item("stone" if n % 2 else "raw_food", 2 + n, 3, 0, value=1)
+        g.tick(100)
+        for sp in piles:
+            slot_items = [i for i in g.items if i.stockpile_id == sp.id and i.container_id is None]
+            self.assertEqual(g._stockpile_used_slots(sp), len(slot_items))
+            self.assertEqual(g._stockpile_loose_item_count(sp), sum(1 for i in slot_items if not is_container_kind(i.kind)))
+            self.assertEqual(g._choose_stockpile_drop_tile(sp), scan_drop_tile(g, sp))
+
+
+if __name__ == "__main__":
+    unittest.main()
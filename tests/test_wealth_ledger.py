@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+
+from fortress.engine import Game
+from fortress.models import Mandate
+
+
+def scan_wealth(g: Game) -> int:
+    return sum(i.value + i.quality for i in g.items) + g.economy_stats["mandate_wealth_earned"]
+
+
+class WealthLedgerTests(unittest.TestCase):
+    def test_ledger_follows_spawn_consume_and_edits(self) -> None:
+        g = Game(rng_seed=671)
+        g.tick()
+        self.assertEqual(g.world.wealth, scan_wealth(g))
+        gem = g._spawn_item("gem", 3, 3, 0, material="ruby", quality=2, value=9)
+        self.assertEqual(g._ledger_wealth(), scan_wealth(g))
+        gem.quality = 5
+        gem.value = 12
+        self.assertEqual(g._ledger_wealth(), scan_wealth(g))
+        g._consume_item(gem.id)
+        g.items = [i for i in g.items if i.kind != "raw_food"]
+        self.assertEqual(g._ledger_wealth(), scan_wealth(g))
+
+    def test_mandate_rewards_persist_in_wealth(self) -> None:
+        g = Game(rng_seed=672)
+        faction = g.factions[0]
+        g._spawn_item("herb", 1, 1, 0, material="test-herb", value=2)
+        g.mandates.append(
+            Mandate(
+                id=1,
+                issuer_faction_id=faction.id,
+                kind="ecology",
+                requested_item_kind="herb",
+                requested_amount=1,
+                due_tick=150,
+                reward_wealth=20,
+            )
+        )
+        g.tick()
+        self.assertEqual(g.economy_stats["mandate_wealth_earned"], 20)
+        self.assertEqual(g.world.wealth, scan_wealth(g))
+
+    def test_verify_mode_reports_drift(self) -> None:
+        g = Game(rng_seed=673)
+        self.assertEqual(g.handle_command("verify wealth on"), "wealth verify=True")
+        g.tick(60)
+        self.assertFalse(any(e.kind == "debug" for e in g.events))
+        g._spawn_item("gem", 3, 3, 0, material="ruby", quality=2, value=9)
+        self.assertIn("drift=+0", g.handle_command("verify wealth"))
+        g.inventory.wealth += 7
+        self.assertEqual(g._verify_wealth(), 7)
+        self.assertTrue(any("Wealth drift +7" in a for a in g.alerts))
+        g.inventory.wealth -= 7
+        g.tick()
+        self.assertIn("drift=+0", g.handle_command("verify wealth"))
+
+    def test_verify_toggle_is_not_saved(self) -> None:
+        g = Game(rng_seed=674)
+        g.handle_command("verify wealth on")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            g.save_json(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertNotIn("debug_verify_wealth", json.load(f)["meta"])
+            self.assertFalse(Game.load_json(path).debug_verify_wealth)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from fortress.engine import Game
+from fortress.models import Mandate, Workshop
+
+
+class WorkshopPlannerIndexTests(unittest.TestCase):
+    def test_built_workshops_by_kind_match_a_scan(self) -> None:
+        r = random.Random(23)
+        g = Game(rng_seed=231)
+        kinds = ["mill", "quern", "potter", "mechanic"]
+        for i in range(30):
+            g.workshops.append(Workshop(id=100 + i, kind=r.choice(kinds), x=r.randrange(g.width), y=r.randrange(g.height), z=r.randrange(2)))
+        for _ in range(200):
+            ws = g.workshops[r.randrange(len(g.workshops))]
+            if r.random() < 0.1:
+                g.workshops.remove(ws)
+            else:
+                ws.built = not ws.built
+            for kind in kinds:
+                built = [w for w in g.workshops if w.kind == kind and w.built]
+                self.assertEqual(g.built_workshops.of_kind(kind), built)
+                self.assertIs(g._built_workshop(kind), built[0] if built else None)
+
+    def test_planner_and_mandates_read_inventory_counts(self) -> None:
+        g = Game(rng_seed=232)
+        first = g.queue_build_workshop("potter", 10, 10, 0)
+        second = g.queue_build_workshop("potter", 12, 10, 0)
+        second.built = True
+        g.tick_count = 25
+        g._plan_workshop_orders()
+        self.assertEqual((first.orders, second.orders), ({}, {"fire_pottery": 1}))
+        first.built = True
+        g._plan_workshop_orders()
+        self.assertEqual((first.orders, second.orders), ({"fire_pottery": 1}, {"fire_pottery": 1}))
+        for _ in range(3):
+            g._spawn_item("stone", 5, 5, 0, material="granite", value=1)
+        g.mandates = [Mandate(id=1, issuer_faction_id=0, kind="culture", requested_item_kind="stone", requested_amount=9, due_tick=10**6)]
+        g._economy_tick()
+        self.assertEqual(g.mandates[0].delivered_amount, sum(1 for i in g.items if i.kind == "stone"))
+
+
+if __name__ == "__main__":
+    unittest.main()